@@ -52,6 +52,47 @@ CONNECTORS = {
     }
 }
 
+# Queue Settings
+QUEUES = {
+    # Redis Example
+    # 'dashboard_q': {
+    #     'backend': 'spaceone.core.queue.redis_queue.RedisQueue',
+    #     'host': 'redis',
+    #     'port': 6379,
+    #     'channel': 'dashboard_job'
+    # }
+}
+
+# Scheduler Settings
+SCHEDULERS = {
+    # 'materialized_data_table_scheduler': {
+    #     'backend': 'spaceone.dashboard.interface.task.v1.materialized_data_table_scheduler.MaterializedDataTableScheduler',
+    #     'queue': 'dashboard_q',
+    #     'interval': 1,
+    # }
+}
+
+# Worker Settings
+WORKERS = {}
+
+# Materialized Data Table Settings
+MATERIALIZED_DATA_TABLE_REFRESH_INTERVAL = 1  # hours
+MATERIALIZED_DATA_TABLE_MAX_SIZE = 12 * 1024 * 1024  # bytes
+MATERIALIZED_DATA_TABLE_TTL = 7 * 24  # hours without reads before deletion
+
+# Data Table Settings
+DATA_TABLE_CATEGORICAL_LABELS = False
+DATA_TABLE_MAX_LOAD_WORKERS = 4
+DATA_TABLE_VALIDATION_MODE = "SCHEMA"  # SCHEMA | PROBE | FULL
+DATA_TABLE_PREVIEW_LIMIT = 100  # rows per source query
+DATA_TABLE_PREVIEW_TIMEOUT = 5  # seconds
+DATA_TABLE_STREAM_CHUNK_SIZE = 1000  # rows per load_stream message
+DATA_TABLE_ANALYZE_BATCH_WINDOW = 0.02  # seconds to wait for compatible analyze calls
+DATA_TABLE_ANALYZE_COALESCING = True  # identical in-flight analyze calls share one
+
+# Dashboard Settings
+DASHBOARD_MAX_LOAD_WORKERS = 4  # data tables loaded in parallel by load_widgets
+
 # Log Settings
 LOG = {}
 
@@ -49,3 +49,23 @@ class ERROR_DUPLICATED_FIELD_NAME(ERROR_INVALID_ARGUMENT):
 
 class ERROR_NOT_ALLOWED_DATA_FIELD(ERROR_INVALID_ARGUMENT):
     _message = "The field name is not allowed data field. (name = {name}, data_fields = {data_fields})"
+
+
+class ERROR_DATA_TABLE_CYCLE(ERROR_INVALID_ARGUMENT):
+    _message = (
+        "Data table cannot be an ancestor of itself. (data_table_id = {data_table_id})"
+    )
+
+
+class ERROR_DATA_TABLE_DEPTH(ERROR_INVALID_ARGUMENT):
+    _message = (
+        "Data table is nested too deeply. (depth = {depth}, max_depth = {max_depth})"
+    )
+
+
+class ERROR_PREVIEW_TIMEOUT(ERROR_REQUEST_TIMEOUT):
+    _message = "Preview did not complete within the time budget. (timeout = {timeout}s)"
+
+
+class ERROR_LOAD_CANCELLED(ERROR_REQUEST_TIMEOUT):
+    _message = "Data table load was cancelled after the time budget ran out."
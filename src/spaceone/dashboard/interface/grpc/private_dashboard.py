@@ -1,5 +1,6 @@
 from spaceone.api.dashboard.v1 import private_dashboard_pb2, private_dashboard_pb2_grpc
 from spaceone.core.pygrpc import BaseAPI
+from spaceone.dashboard.interface.grpc.columnar import columnar_to_struct
 from spaceone.dashboard.service.private_dashboard_service import PrivateDashboardService
 
 
@@ -31,6 +32,15 @@ class PrivateDashboard(BaseAPI, private_dashboard_pb2_grpc.PrivateDashboardServi
         pri_dash_svc.delete(params)
         return self.empty()
 
+    def load_widgets(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        pri_dash_svc = PrivateDashboardService(metadata)
+        for response in pri_dash_svc.load_widgets(params):
+            if response.get("format") == "COLUMNAR":
+                yield columnar_to_struct(response)
+            else:
+                yield self.dict_to_message(response)
+
     def get(self, request, context):
         params, metadata = self.parse_request(request, context)
         pub_dash_svc = PrivateDashboardService(metadata)
@@ -3,6 +3,7 @@ from spaceone.api.dashboard.v1 import (
     private_data_table_pb2_grpc,
 )
 from spaceone.core.pygrpc import BaseAPI
+from spaceone.dashboard.interface.grpc.columnar import columnar_to_struct
 from spaceone.dashboard.service.private_data_table_service import (
     PrivateDataTableService,
 )
@@ -40,6 +41,22 @@ class PrivateDataTable(BaseAPI, private_data_table_pb2_grpc.PrivateDataTableServ
         params, metadata = self.parse_request(request, context)
         pri_data_table_svc = PrivateDataTableService(metadata)
         response: dict = pri_data_table_svc.load(params)
+
+        if response.get("format") == "COLUMNAR":
+            return columnar_to_struct(response)
+
+        return self.dict_to_message(response)
+
+    def load_stream(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        pri_data_table_svc = PrivateDataTableService(metadata)
+        for response in pri_data_table_svc.load_stream(params):
+            yield self.dict_to_message(response)
+
+    def explain(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        pri_data_table_svc = PrivateDataTableService(metadata)
+        response: dict = pri_data_table_svc.explain(params)
         return self.dict_to_message(response)
 
     def get(self, request, context):
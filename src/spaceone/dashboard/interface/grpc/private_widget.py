@@ -1,5 +1,6 @@
 from spaceone.api.dashboard.v1 import private_widget_pb2, private_widget_pb2_grpc
 from spaceone.core.pygrpc import BaseAPI
+from spaceone.dashboard.interface.grpc.columnar import columnar_to_struct
 from spaceone.dashboard.service.private_widget_service import PrivateWidgetService
 
 
@@ -29,8 +30,18 @@ class PrivateWidget(BaseAPI, private_widget_pb2_grpc.PrivateWidgetServicer):
         params, metadata = self.parse_request(request, context)
         pri_widget_svc = PrivateWidgetService(metadata)
         response: dict = pri_widget_svc.load(params)
+
+        if response.get("format") == "COLUMNAR":
+            return columnar_to_struct(response)
+
         return self.dict_to_message(response)
 
+    def load_stream(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        pri_widget_svc = PrivateWidgetService(metadata)
+        for response in pri_widget_svc.load_stream(params):
+            yield self.dict_to_message(response)
+
     def load_sum(self, request, context):
         params, metadata = self.parse_request(request, context)
         pri_widget_svc = PrivateWidgetService(metadata)
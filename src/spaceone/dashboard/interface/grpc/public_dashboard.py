@@ -1,5 +1,6 @@
 from spaceone.api.dashboard.v1 import public_dashboard_pb2, public_dashboard_pb2_grpc
 from spaceone.core.pygrpc import BaseAPI
+from spaceone.dashboard.interface.grpc.columnar import columnar_to_struct
 from spaceone.dashboard.service.public_dashboard_service import PublicDashboardService
 
 
@@ -43,6 +44,15 @@ class PublicDashboard(BaseAPI, public_dashboard_pb2_grpc.PublicDashboardServicer
         pub_dash_svc.delete(params)
         return self.empty()
 
+    def load_widgets(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        pub_dash_svc = PublicDashboardService(metadata)
+        for response in pub_dash_svc.load_widgets(params):
+            if response.get("format") == "COLUMNAR":
+                yield columnar_to_struct(response)
+            else:
+                yield self.dict_to_message(response)
+
     def get(self, request, context):
         params, metadata = self.parse_request(request, context)
         pub_dash_svc = PublicDashboardService(metadata)
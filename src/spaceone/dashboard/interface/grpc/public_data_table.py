@@ -1,5 +1,6 @@
 from spaceone.api.dashboard.v1 import public_data_table_pb2, public_data_table_pb2_grpc
 from spaceone.core.pygrpc import BaseAPI
+from spaceone.dashboard.interface.grpc.columnar import columnar_to_struct
 from spaceone.dashboard.service.public_data_table_service import PublicDataTableService
 
 
@@ -35,6 +36,22 @@ class PublicDataTable(BaseAPI, public_data_table_pb2_grpc.PublicDataTableService
         params, metadata = self.parse_request(request, context)
         pub_data_table_svc = PublicDataTableService(metadata)
         response: dict = pub_data_table_svc.load(params)
+
+        if response.get("format") == "COLUMNAR":
+            return columnar_to_struct(response)
+
+        return self.dict_to_message(response)
+
+    def load_stream(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        pub_data_table_svc = PublicDataTableService(metadata)
+        for response in pub_data_table_svc.load_stream(params):
+            yield self.dict_to_message(response)
+
+    def explain(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        pub_data_table_svc = PublicDataTableService(metadata)
+        response: dict = pub_data_table_svc.explain(params)
         return self.dict_to_message(response)
 
     def get(self, request, context):
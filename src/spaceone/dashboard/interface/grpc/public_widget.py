@@ -1,5 +1,6 @@
 from spaceone.api.dashboard.v1 import public_widget_pb2, public_widget_pb2_grpc
 from spaceone.core.pygrpc import BaseAPI
+from spaceone.dashboard.interface.grpc.columnar import columnar_to_struct
 from spaceone.dashboard.service.public_widget_service import PublicWidgetService
 
 
@@ -29,8 +30,18 @@ class PublicWidget(BaseAPI, public_widget_pb2_grpc.PublicWidgetServicer):
         params, metadata = self.parse_request(request, context)
         pub_widget_svc = PublicWidgetService(metadata)
         response: dict = pub_widget_svc.load(params)
+
+        if response.get("format") == "COLUMNAR":
+            return columnar_to_struct(response)
+
         return self.dict_to_message(response)
 
+    def load_stream(self, request, context):
+        params, metadata = self.parse_request(request, context)
+        pub_widget_svc = PublicWidgetService(metadata)
+        for response in pub_widget_svc.load_stream(params):
+            yield self.dict_to_message(response)
+
     def load_sum(self, request, context):
         params, metadata = self.parse_request(request, context)
         pub_widget_svc = PublicWidgetService(metadata)
@@ -0,0 +1,42 @@
+import logging
+
+from spaceone.core import config
+from spaceone.core.error import ERROR_CONFIGURATION
+from spaceone.core.scheduler import HourlyScheduler
+
+__all__ = ["MaterializedDataTableScheduler"]
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MaterializedDataTableScheduler(HourlyScheduler):
+    def __init__(self, queue, interval, minute=":00"):
+        super().__init__(queue, interval, minute)
+        self._token = config.get_global("TOKEN")
+        if not self._token:
+            raise ERROR_CONFIGURATION(key="TOKEN")
+
+    def create_task(self) -> list:
+        return [
+            {
+                "name": "refresh_materialized_data_tables",
+                "version": "v1",
+                "executionEngine": "BaseWorker",
+                "stages": [
+                    self._create_stage(service)
+                    for service in [
+                        "PublicDataTableService",
+                        "PrivateDataTableService",
+                    ]
+                ],
+            }
+        ]
+
+    def _create_stage(self, service: str) -> dict:
+        return {
+            "locator": "SERVICE",
+            "name": service,
+            "metadata": {"token": self._token},
+            "method": "refresh_materialized_data_tables",
+            "params": {"params": {}},
+        }
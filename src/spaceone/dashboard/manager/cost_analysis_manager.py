@@ -2,21 +2,33 @@ from spaceone.core import config
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
 from spaceone.dashboard.manager.identity_manager import IdentityManager
+from spaceone.dashboard.manager.single_flight_manager import SingleFlightManager
 
 
 class CostAnalysisManager(BaseManager):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.identity_mgr = IdentityManager()
+        self.single_flight_mgr = SingleFlightManager()
         self.cost_analysis_conn: SpaceConnector = self.locator.get_connector(
             "SpaceConnector", service="cost_analysis"
         )
 
     def analyze_cost(self, params: dict) -> dict:
-        return self.cost_analysis_conn.dispatch("Cost.analyze", params)
+        return self.single_flight_mgr.dispatch(
+            self.cost_analysis_conn,
+            "Cost.analyze",
+            params,
+            x_domain_id=self.transaction.get_meta("x_domain_id"),
+        )
 
     def analyze_unified_cost(self, params: dict) -> dict:
-        return self.cost_analysis_conn.dispatch("UnifiedCost.analyze", params)
+        return self.single_flight_mgr.dispatch(
+            self.cost_analysis_conn,
+            "UnifiedCost.analyze",
+            params,
+            x_domain_id=self.transaction.get_meta("x_domain_id"),
+        )
 
     def list_data_sources(self, params: dict) -> dict:
         return self.cost_analysis_conn.dispatch("DataSource.list", params)
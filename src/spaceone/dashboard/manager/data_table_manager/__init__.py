@@ -1,22 +1,136 @@
 import ast
+import functools
 import logging
 import re
-from typing import Union, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from datetime import datetime
+from typing import Union, Tuple, Generator
 
+import numpy as np
 import pandas as pd
+from dateutil.relativedelta import relativedelta
 from jinja2 import Environment, meta
 from markupsafe import escape
-from spaceone.core import cache, utils
+from spaceone.core import cache, config, utils
 from spaceone.core.manager import BaseManager
+from spaceone.core.transaction import LOCAL_STORAGE
 
 from spaceone.dashboard.error.data_table import (
     ERROR_QUERY_OPTION,
     ERROR_QUERY_GROUP_BY_OPTION,
     ERROR_EMPTY_DATA_FIELD,
+    ERROR_PREVIEW_TIMEOUT,
+    ERROR_LOAD_CANCELLED,
+)
+from spaceone.dashboard.manager.materialized_data_table_manager import (
+    MaterializedDataTableManager,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_VALIDATION_MODE = "SCHEMA"
+DEFAULT_PREVIEW_LIMIT = 100
+DEFAULT_PREVIEW_TIMEOUT = 5  # seconds
+DEFAULT_STREAM_CHUNK_SIZE = 1000  # rows
+JINJA_EXPRESSION_CACHE_SIZE = 4096
+JINJA_PATTERN = re.compile(r"\{\{\s*(.*?)\s*\}\}")
+GLOBAL_VARIABLE_PATTERN = re.compile(r"^global\.(\w+)\s*(?:\[\s*(-?\d+)\s*\])?$")
+HTML_TAG_PATTERN = re.compile(r"<.*?>")
+SOURCE_SCOPE_VARIABLES = [
+    "workspace_id",
+    "project_id",
+    "project_group_id",
+    "service_account_id",
+    "region_code",
+]
+
+_JINJA_ENV = Environment(autoescape=True)
+
+# Copy-on-Write is always enabled since pandas 3.0. Older versions need it
+# to share column data between frames without defensive copies.
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+
+@functools.lru_cache(maxsize=JINJA_EXPRESSION_CACHE_SIZE)
+def _find_jinja_variables(expression: str) -> frozenset:
+    expression = escape(HTML_TAG_PATTERN.sub("", expression))
+    expression = JINJA_PATTERN.sub(
+        lambda m: "{{" + m.group(1).replace(" ", "_") + "}}", expression
+    )
+    return frozenset(meta.find_undeclared_variables(_JINJA_ENV.parse(expression)))
+
+
+@functools.lru_cache(maxsize=JINJA_EXPRESSION_CACHE_SIZE)
+def _parse_jinja_template(expression: str) -> tuple:
+    """Splits an expression into text and placeholder nodes once per process.
+
+    ("TEXT", text): text outside of the braces, kept as is
+    ("GLOBAL", name, index): global variable, bound to vars[name] or vars[name][index]
+    ("FIELD", key): any other variable, referenced as a column
+    """
+
+    nodes = []
+    position = 0
+    for match in JINJA_PATTERN.finditer(expression):
+        if match.start() > position:
+            nodes.append(("TEXT", expression[position : match.start()]))
+
+        key = match.group(1).strip()
+        if global_match := GLOBAL_VARIABLE_PATTERN.match(key):
+            name, index = global_match.groups()
+            nodes.append(("GLOBAL", name, None if index is None else int(index)))
+        else:
+            nodes.append(("FIELD", key))
+
+        position = match.end()
+
+    if position < len(expression):
+        nodes.append(("TEXT", expression[position:]))
+
+    return tuple(nodes)
+
+
+def find_global_variables(options) -> list:
+    """Returns the global variables referenced by any expression in the options."""
+
+    variables = []
+    if isinstance(options, dict):
+        values = options.values()
+    elif isinstance(options, (list, tuple)):
+        values = options
+    elif isinstance(options, str) and "{{" in options:
+        for node in _parse_jinja_template(options):
+            if node[0] == "GLOBAL" and node[1] not in variables:
+                variables.append(node[1])
+        return variables
+    else:
+        return variables
+
+    for value in values:
+        for name in find_global_variables(value):
+            if name not in variables:
+                variables.append(name)
+
+    return variables
+
+
+def run_with_transaction(transaction, func, *args, **kwargs):
+    """Runs func on a worker thread with the transaction of the request.
+
+    Transactions are looked up per thread, so without it the remote calls of
+    the worker would be sent without the token and domain of the request.
+    """
+
+    thread_id = str(threading.current_thread().ident)
+    setattr(LOCAL_STORAGE, thread_id, transaction)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        delattr(LOCAL_STORAGE, thread_id)
+
 
 class DataTableManager(BaseManager):
     def __init__(self, *args, **kwargs):
@@ -27,11 +141,22 @@ class DataTableManager(BaseManager):
         self.df: Union[pd.DataFrame, None] = None
         self.data_keys = None
         self.label_keys = None
-        self.jinja_variables = None
-        self.jinja_variables_contain_space = []
         self.state = None
         self.error_message = None
         self.currency = "USD"
+        self.profile = None
+        self.plan_info = None
+        self.join_info = None
+        self.remote_time = 0.0
+        self.remote_calls = 0
+        self.materialized_info = None
+        self.load_mode = "FULL"
+        self.loaded_frames = None
+        self.analyze_batch_mgr = None
+        self.cancel_event = None
+        self.categorical_labels = config.get_global(
+            "DATA_TABLE_CATEGORICAL_LABELS", False
+        )
 
     def get_data_and_labels_info(self) -> Tuple[dict, dict]:
         raise NotImplementedError()
@@ -45,6 +170,301 @@ class DataTableManager(BaseManager):
     ) -> pd.DataFrame:
         raise NotImplementedError()
 
+    def is_incremental(self) -> bool:
+        return False
+
+    def check_cancelled(self) -> None:
+        if self.cancel_event is not None and self.cancel_event.is_set():
+            raise ERROR_LOAD_CANCELLED()
+
+    def validate(self, mode: str = None, vars: dict = None) -> pd.DataFrame:
+        """Verifies the options and infers the data and labels info on save.
+
+        SCHEMA: nothing is fetched, sources return empty frames of their columns
+        PROBE: every source query fetches at most one row
+        FULL: the default window is loaded as is
+        """
+
+        self.load_mode = mode or config.get_global(
+            "DATA_TABLE_VALIDATION_MODE", DEFAULT_VALIDATION_MODE
+        )
+
+        try:
+            return self.load(vars=vars)
+        finally:
+            self.load_mode = "FULL"
+
+    def preview(
+        self,
+        granularity: str,
+        start: str = None,
+        end: str = None,
+        vars: dict = None,
+    ) -> pd.DataFrame:
+        """Loads a limited row set for the editor within a time budget.
+
+        Every source query fetches at most DATA_TABLE_PREVIEW_LIMIT rows
+        and the operators run over those rows only. When the budget runs out,
+        the load stops before its next plan node or remote call.
+        """
+
+        timeout = config.get_global(
+            "DATA_TABLE_PREVIEW_TIMEOUT", DEFAULT_PREVIEW_TIMEOUT
+        )
+        self.load_mode = "PREVIEW"
+        self.cancel_event = threading.Event()
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(
+            run_with_transaction,
+            self.transaction,
+            self.load,
+            granularity,
+            start,
+            end,
+            vars,
+        )
+
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            # The remote call in flight cannot be cancelled,
+            # so the load stops before the next node or remote call
+            self.cancel_event.set()
+            raise ERROR_PREVIEW_TIMEOUT(timeout=timeout)
+        finally:
+            executor.shutdown(wait=False)
+
+    def explain(
+        self,
+        granularity: str,
+        start: str = None,
+        end: str = None,
+        vars: dict = None,
+        sort: list = None,
+        page: dict = None,
+    ) -> dict:
+        self.profile = []
+
+        start_time = time.perf_counter()
+        self.load(granularity, start, end, vars)
+        load_time = time.perf_counter() - start_time
+
+        if not self.profile:
+            self.profile.append(
+                self.make_node_profile(
+                    "root", self, [], self.df, load_time, self.remote_time
+                )
+            )
+            self.profile[0]["data_type"] = "ADDED"
+            self.profile[0]["remote_calls"] = self.remote_calls
+
+        total_count = 0
+        serialization_time = 0.0
+        if self.df is not None:
+            total_count = len(self.df)
+            start_time = time.perf_counter()
+            self.response_data(sort, page)
+            serialization_time = time.perf_counter() - start_time
+
+        return {
+            "state": self.state,
+            "error_message": self.error_message,
+            "plan": self.plan_info,
+            "nodes": self.profile,
+            "total_count": total_count,
+            "load_time": load_time,
+            "serialization_time": serialization_time,
+            "total_time": load_time + serialization_time,
+        }
+
+    def load_materialized(
+        self,
+        data_table_vo,
+        granularity: str,
+        start: str = None,
+        end: str = None,
+        vars: dict = None,
+    ) -> pd.DataFrame:
+        materialized_mgr = MaterializedDataTableManager()
+        role_type = self.transaction.get_meta("authorization.role_type")
+        query_data = {
+            "granularity": granularity,
+            "start": start,
+            "end": end,
+            "vars": vars,
+            "role_type": role_type,
+        }
+
+        if role_type == "WORKSPACE_OWNER":
+            query_data["workspace_id"] = self.transaction.get_meta(
+                "authorization.workspace_id"
+            )
+        elif role_type not in ["DOMAIN_ADMIN", "SYSTEM"]:
+            query_data["user_id"] = self.transaction.get_meta(
+                "authorization.user_id"
+            ) or self.transaction.get_meta("authorization.app_id")
+
+        query_hash = utils.dict_to_hash(query_data)
+        materialized_vo = materialized_mgr.get_materialized_data_table(
+            data_table_vo.data_table_id, query_hash, self.domain_id
+        )
+
+        # A stale result is recomputed when the scheduler has not refreshed it
+        if (
+            materialized_vo
+            and materialized_vo.state == "AVAILABLE"
+            and not materialized_mgr.is_stale(materialized_vo)
+        ):
+            materialized_mgr.update_read_at(materialized_vo)
+            self.df = materialized_mgr.restore_data_frame(materialized_vo.data)
+            self.data_keys = materialized_vo.data_keys
+            self.label_keys = materialized_vo.label_keys
+            self.state = "AVAILABLE"
+        else:
+            self.load(granularity, start, end, vars)
+
+            if self.df is None or self.state == "UNAVAILABLE":
+                return self.df
+
+            materialized_vo = materialized_mgr.save_data_frame(
+                materialized_vo,
+                {
+                    "data_table_type": self.data_table_type,
+                    "data_table_id": data_table_vo.data_table_id,
+                    "query_hash": query_hash,
+                    "granularity": granularity,
+                    "start": start,
+                    "end": end,
+                    "vars": vars,
+                    "role_type": role_type,
+                    "widget_id": self.widget_id,
+                    "domain_id": self.domain_id,
+                },
+                self.df,
+                self.data_keys,
+                self.label_keys,
+            )
+
+            if materialized_vo is None or materialized_vo.state != "AVAILABLE":
+                return self.df
+
+        self.materialized_info = {
+            "refreshed_at": utils.datetime_to_iso8601(materialized_vo.refreshed_at),
+            "is_stale": materialized_mgr.is_stale(materialized_vo),
+        }
+
+        return self.df
+
+    def refresh_materialized(self, materialized_vo) -> None:
+        materialized_mgr = MaterializedDataTableManager()
+        granularity = materialized_vo.granularity
+        vars = materialized_vo.vars
+        start, end = self._get_time_from_granularity(
+            granularity, materialized_vo.start, materialized_vo.end
+        )
+        open_period = self._get_open_period(granularity, start, end)
+
+        stored_df = None
+        if (
+            open_period
+            and materialized_vo.state == "AVAILABLE"
+            and materialized_vo.refreshed_at
+            and self._get_open_period(
+                granularity, start, end, materialized_vo.refreshed_at
+            )
+            == open_period
+            and self.is_incremental()
+        ):
+            stored_df = materialized_mgr.restore_data_frame(materialized_vo.data)
+
+            # Rows can only be split by period when they have a Date column
+            if "Date" not in stored_df.columns:
+                stored_df = None
+
+        if stored_df is not None:
+            # Only the open period can change, so fetch it alone
+            # and append it to the stored rows of the closed periods.
+            self.load(granularity, open_period, end, vars)
+
+            if self.df is not None and self.state != "UNAVAILABLE":
+                if set(self.df.columns) == set(stored_df.columns):
+                    stored_df = stored_df[
+                        (stored_df["Date"] >= start) & (stored_df["Date"] < open_period)
+                    ]
+                    self.df = pd.concat([stored_df, self.df], ignore_index=True)
+                else:
+                    # The columns changed since the last refresh, so nothing is reused
+                    self.load(
+                        granularity, materialized_vo.start, materialized_vo.end, vars
+                    )
+        else:
+            self.load(granularity, materialized_vo.start, materialized_vo.end, vars)
+
+        if self.state == "UNAVAILABLE" or self.df is None:
+            _LOGGER.warning(
+                f"[refresh_materialized] keep previous result "
+                f"({materialized_vo.data_table_id}): {self.error_message}"
+            )
+            return
+
+        materialized_mgr.save_data_frame(
+            materialized_vo, {}, self.df, self.data_keys, self.label_keys
+        )
+
+    @staticmethod
+    def _get_open_period(
+        granularity: str, start: str, end: str, now: datetime = None
+    ) -> Union[str, None]:
+        now = now or datetime.utcnow()
+
+        if granularity == "YEARLY":
+            open_period = now.strftime("%Y")
+        elif granularity == "MONTHLY":
+            open_period = now.strftime("%Y-%m")
+        else:
+            open_period = now.strftime("%Y-%m-01")
+
+        if len(start) != len(open_period) or len(end) != len(open_period):
+            return None
+
+        if start < open_period <= end:
+            return open_period
+
+        return None
+
+    @staticmethod
+    def make_node_profile(
+        node_id: str,
+        node,
+        input_rows: list,
+        df: Union[pd.DataFrame, None],
+        wall_time: float,
+        remote_time: float = 0.0,
+    ) -> dict:
+        node_profile = {
+            "node_id": node_id,
+            "data_table_id": getattr(node, "data_table_id", None),
+            "name": getattr(node, "name", None),
+            "data_type": getattr(node, "data_type", None),
+            "source_type": getattr(node, "source_type", None),
+            "operator": getattr(node, "operator", None),
+            "inputs": list(getattr(node, "inputs", [])),
+            "wall_time": wall_time,
+            "remote_time": remote_time,
+            "input_rows": input_rows,
+            "output_rows": 0,
+            "column_count": 0,
+            "memory_bytes": 0,
+        }
+
+        if df is not None:
+            node_profile["output_rows"] = len(df)
+            node_profile["column_count"] = len(df.columns)
+            node_profile["memory_bytes"] = int(df.memory_usage(deep=True).sum())
+
+        return node_profile
+
     def load_from_widget(
         self,
         data_table_id: str,
@@ -56,28 +476,41 @@ class DataTableManager(BaseManager):
         page: dict = None,
         vars: dict = None,
         column_sum: bool = False,
-    ) -> dict:
+        data_table_vo=None,
+        response_format: str = None,
+        stream: bool = False,
+        cache_widget_id: str = None,
+    ) -> Union[dict, Generator[dict, None, None]]:
+        cache_widget_id = cache_widget_id or self.widget_id
         query_data = self._prepare_query_data(
             data_table_id, granularity, start, end, group_by, sort, vars
         )
+        query_data["widget_id"] = cache_widget_id
+
+        if data_table_vo:
+            query_data["dag_hash"] = data_table_vo.dag_hash
+
+            # Variables the data table does not depend on must not split the cache
+            if data_table_vo.variables is not None and vars:
+                vars = {
+                    key: value
+                    for key, value in vars.items()
+                    if key in data_table_vo.variables
+                }
+                query_data["vars"] = vars
 
         cache_hash_key = utils.dict_to_hash(query_data)
-        response = self._get_cached_response(cache_hash_key)
+        response = self._get_cached_response(cache_hash_key, cache_widget_id)
 
         if not response:
-            self.load(
-                granularity,
-                start,
-                end,
-                vars=vars,
-            )
+            self._load_widget_data(data_table_vo, granularity, start, end, vars)
 
             if self.df is not None:
                 self._apply_group_by(group_by)
                 data_info, labels_info = self.get_data_and_labels_info()
 
                 response = {
-                    "results": self.df.copy(deep=True).to_dict(orient="records"),
+                    "results": self.decode_labels(self.df).to_dict(orient="records"),
                 }
 
                 if labels_info:
@@ -90,8 +523,11 @@ class DataTableManager(BaseManager):
                     order = self.label_keys + self.data_keys
                     response["order"] = order
 
+                if self.materialized_info:
+                    response["materialized"] = self.materialized_info
+
                 cache.set(
-                    f"dashboard:widget:load:{self.domain_id}:{self.widget_id}:{cache_hash_key}:{self.currency}",
+                    f"dashboard:widget:load:{self.domain_id}:{cache_widget_id}:{cache_hash_key}:{self.currency}",
                     response,
                     expire=600,
                 )
@@ -101,13 +537,91 @@ class DataTableManager(BaseManager):
         if column_sum:
             return self.response_sum_data_from_widget(response)
 
-        return self.response_data_from_widget(response, sort, page)
+        if stream:
+            return self.stream_response_data_from_widget(response, sort, page)
+
+        return self.response_data_from_widget(response, sort, page, response_format)
+
+    def load_from_widgets(
+        self,
+        data_table_id: str,
+        widgets: list,
+        granularity: str,
+        start: str,
+        end: str,
+        vars: dict = None,
+        data_table_vo=None,
+        response_format: str = None,
+    ) -> list:
+        """Loads several widgets of the same data table, fetching its data once.
+
+        widgets: [{"widget_id", "data_table_id", "data_table_widget_id",
+                   "group_by", "sort", "page"}]
+        Returns [(widget_id, response)] in the order of the widgets.
+
+        The data table ids of a widget key its cached response, so that it is
+        shared with and invalidated like the single widget load.
+        """
+
+        self.loaded_frames = {}
+        try:
+            return [
+                (
+                    widget["widget_id"],
+                    self.load_from_widget(
+                        widget.get("data_table_id", data_table_id),
+                        granularity,
+                        start,
+                        end,
+                        widget.get("group_by"),
+                        widget.get("sort"),
+                        widget.get("page"),
+                        dict(vars) if vars else vars,
+                        data_table_vo=data_table_vo,
+                        response_format=response_format,
+                        cache_widget_id=widget.get("data_table_widget_id"),
+                    ),
+                )
+                for widget in widgets
+            ]
+        finally:
+            self.loaded_frames = None
+
+    def _load_widget_data(
+        self,
+        data_table_vo,
+        granularity: str,
+        start: str,
+        end: str,
+        vars: dict = None,
+    ) -> None:
+        if self.loaded_frames is not None:
+            load_key = utils.dict_to_hash(
+                {"granularity": granularity, "start": start, "end": end, "vars": vars}
+            )
+            if load_key in self.loaded_frames:
+                self.df = self.loaded_frames[load_key]
+                return
+
+        if data_table_vo and data_table_vo.materialize:
+            self.load_materialized(data_table_vo, granularity, start, end, vars)
+        else:
+            self.load(
+                granularity,
+                start,
+                end,
+                vars=vars,
+            )
+
+        if self.loaded_frames is not None:
+            self.loaded_frames[load_key] = self.df
 
     def response_data_from_widget(
         self,
         response,
         sort: list = None,
         page: dict = None,
+        response_format: str = None,
     ) -> dict:
         data = response["results"]
 
@@ -119,10 +633,19 @@ class DataTableManager(BaseManager):
         if page:
             data = self.apply_page(data, page)
 
-        results = {
-            "results": data,
-            "total_count": total_count,
-        }
+        if response_format == "COLUMNAR":
+            results = {
+                "format": "COLUMNAR",
+                "columns": self.make_columnar_results(
+                    pd.DataFrame.from_records(data)
+                ),
+                "total_count": total_count,
+            }
+        else:
+            results = {
+                "results": data,
+                "total_count": total_count,
+            }
 
         if "labels_info" in response:
             results["labels_info"] = response["labels_info"]
@@ -130,9 +653,33 @@ class DataTableManager(BaseManager):
             results["data_info"] = response["data_info"]
         if "order" in response:
             results["order"] = response["order"]
+        if "materialized" in response:
+            results["materialized"] = response["materialized"]
 
         return results
 
+    def stream_response_data_from_widget(
+        self, response: dict, sort: list = None, page: dict = None
+    ) -> Generator[dict, None, None]:
+        """Same as response_data_from_widget, split into a header and chunks."""
+
+        data = response["results"]
+
+        total_count = len(data)
+
+        if sort:
+            data = self.apply_sort(data, sort)
+
+        if page:
+            data = self.apply_page(data, page)
+
+        header = {"total_count": total_count}
+        for key in ["labels_info", "data_info", "order", "materialized"]:
+            if key in response:
+                header[key] = response[key]
+
+        return self._generate_chunks(header, data)
+
     def response_sum_data_from_widget(self, response: dict) -> dict:
         data = response["results"]
         if self.data_keys:
@@ -183,7 +730,9 @@ class DataTableManager(BaseManager):
                 end_index = start_index + limit
                 return data[start_index:end_index]
 
-    def response_data(self, sort: list = None, page: dict = None) -> dict:
+    def response_data(
+        self, sort: list = None, page: dict = None, response_format: str = None
+    ) -> dict:
         total_count = len(self.df)
 
         if sort:
@@ -192,21 +741,81 @@ class DataTableManager(BaseManager):
         if page:
             self.apply_page_df(page)
 
-        df = self.df.copy(deep=True)
+        df = self.df
         data_info, labels_info = self.get_data_and_labels_info()
 
         self.df = None
 
-        results = {
-            "results": df.to_dict(orient="records"),
-            "total_count": total_count,
-        }
+        if response_format == "COLUMNAR":
+            results = {
+                "format": "COLUMNAR",
+                "columns": self.make_columnar_results(df),
+                "total_count": total_count,
+            }
+        else:
+            results = {
+                "results": self.decode_labels(df).to_dict(orient="records"),
+                "total_count": total_count,
+            }
+
+        results.update(self._make_response_info(data_info, labels_info))
+        return results
+
+    def stream_response_data(
+        self, sort: list = None, page: dict = None
+    ) -> Generator[dict, None, None]:
+        """Yields a header message and then the rows in bounded chunks.
+
+        The data table is loaded before the first message. Each chunk is
+        converted to records only when it is requested.
+        """
+
+        total_count = len(self.df)
+
+        if sort:
+            self.apply_sort_to_df(sort)
+
+        if page:
+            self.apply_page_df(page)
+
+        df = self.df
+        data_info, labels_info = self.get_data_and_labels_info()
+
+        self.df = None
+
+        header = {"total_count": total_count}
+        header.update(self._make_response_info(data_info, labels_info))
+
+        return self._generate_chunks(header, df)
+
+    def _generate_chunks(
+        self, header: dict, data: Union[pd.DataFrame, list]
+    ) -> Generator[dict, None, None]:
+        yield header
+
+        chunk_size = self._get_stream_chunk_size()
+        for index in range(0, len(data), chunk_size):
+            if isinstance(data, pd.DataFrame):
+                chunk_df = self.decode_labels(data.iloc[index : index + chunk_size])
+                yield {"results": chunk_df.to_dict(orient="records")}
+            else:
+                yield {"results": data[index : index + chunk_size]}
+
+    @staticmethod
+    def _get_stream_chunk_size() -> int:
+        chunk_size = config.get_global(
+            "DATA_TABLE_STREAM_CHUNK_SIZE", DEFAULT_STREAM_CHUNK_SIZE
+        )
+        return max(int(chunk_size), 1)
+
+    def _make_response_info(self, data_info: dict, labels_info: dict) -> dict:
+        response_info = {}
 
         if labels_info:
-            results["labels_info"] = labels_info
+            response_info["labels_info"] = labels_info
 
         if data_info:
-            results["data_info"] = data_info
+            response_info["data_info"] = data_info
 
         if self.data_keys:
             if self.label_keys is None:
@@ -214,9 +823,15 @@ class DataTableManager(BaseManager):
             else:
                 order = self.label_keys + self.data_keys
 
-            results["order"] = order
+            response_info["order"] = order
 
-        return results
+        if self.materialized_info:
+            response_info["materialized"] = self.materialized_info
+
+        if self.load_mode == "PREVIEW":
+            response_info["preview"] = True
+
+        return response_info
 
     def apply_sort_to_df(self, sort: list) -> None:
         if len(self.df) > 0:
@@ -247,139 +862,132 @@ class DataTableManager(BaseManager):
 
                     self.df = self.df.iloc[start - 1 : start + limit - 1]
 
-    def is_jinja_expression(self, expression: str) -> bool:
+    @staticmethod
+    def is_jinja_expression(expression: str) -> bool:
         if not expression:
             return False
 
         if isinstance(expression, list):
             expression = str(expression)
 
-        expression = self._sanitize_input(expression)
-        expression = escape(expression)
-
-        env = Environment(autoescape=True)
-
-        jinja_pattern = re.compile(r"\{\{\s*(.*?)\s*\}\}")
-
-        modified_expression = re.sub(
-            jinja_pattern,
-            lambda m: "{{" + m.group(1).replace(" ", "_") + "}}",
-            expression,
-        )
-
-        jinja_keys_with_space = {}
-        if expression != modified_expression:
-            keys_with_space = re.findall(jinja_pattern, expression)
-            for key in keys_with_space:
-                jinja_keys_with_space[key.replace(" ", "_")] = key
-
-        parsed_content = env.parse(modified_expression)
-        variables = meta.find_undeclared_variables(parsed_content)
-
-        if variables:
-            if jinja_keys_with_space:
-                for key, key_with_space in jinja_keys_with_space.items():
-                    self.jinja_variables_contain_space.append(
-                        {
-                            "origin_key": key_with_space,
-                            "modified_key": key,
-                        }
-                    )
+        return bool(_find_jinja_variables(expression))
 
-            self.jinja_variables = variables
+    def bind_global_variables(self, expression: str, vars: dict) -> str:
+        """Renders an expression as a pandas query with its variables bound.
 
-        return bool(variables)
+        Global variables become quoted literals, other variables become
+        column references.
+        """
 
-    def change_global_variables(self, expression: str, vars: dict):
-        gv_type_map = {}
+        rendered = []
+        for node in _parse_jinja_template(expression):
+            if node[0] == "TEXT":
+                rendered.append(node[1])
+            elif node[0] == "FIELD":
+                rendered.append(f"`{node[1]}`" if " " in node[1] else node[1])
+            else:
+                is_bound, value = self._get_global_variable(node, vars)
+                rendered.append(self._to_query_literal(value) if is_bound else node[1])
 
-        if "global" in self.jinja_variables:
-            exclude_keys = set(key for key in self.jinja_variables if key != "global")
-            expression = expression.replace("global.", "")
+        return "".join(rendered)
 
-            env = Environment(autoescape=True)
-            parsed_content = env.parse(expression)
-            jinja_variables = meta.find_undeclared_variables(parsed_content)
-            global_variables = jinja_variables - exclude_keys
+    def bind_filter_value(
+        self, expression: Union[str, list], vars: dict
+    ) -> Tuple[Union[str, int, float, list, None], bool]:
+        """Binds global variables into a filter value.
 
-            for global_variable_key in global_variables:
-                if vars and global_variable_key in vars:
-                    global_variable_value = vars[global_variable_key]
-                    gv_type = type(global_variable_value)
+        Returns the typed value and whether any global variable was bound.
+        """
 
-                    if isinstance(global_variable_value, str):
-                        global_variable_value = self._sanitize_input(
-                            global_variable_value
-                        )
-                        global_variable_value = escape(global_variable_value)
+        if isinstance(expression, list):
+            values = []
+            is_any_bound = False
+            for item in expression:
+                if not isinstance(item, str) or not self.is_jinja_expression(item):
+                    values.append(item)
+                    continue
+
+                value, is_bound = self.bind_filter_value(item, vars)
+                is_any_bound = is_any_bound or is_bound
+                if isinstance(value, list):
+                    values.extend(value)
+                else:
+                    values.append(value)
+
+            return values, is_any_bound
+
+        nodes = [
+            node
+            for node in _parse_jinja_template(expression)
+            if node[0] != "TEXT" or node[1].strip()
+        ]
+
+        if len(nodes) == 1 and nodes[0][0] == "GLOBAL":
+            is_bound, value = self._get_global_variable(nodes[0], vars)
+            return value, is_bound
+
+        is_bound = any(
+            node[0] == "GLOBAL" and self._get_global_variable(node, vars)[0]
+            for node in nodes
+        )
+        value = self.bind_global_variables(expression, vars)
+        try:
+            return ast.literal_eval(value), is_bound
+        except (ValueError, SyntaxError):
+            return value, is_bound
+
+    def _get_global_variable(self, node: tuple, vars: dict) -> Tuple[bool, object]:
+        _, name, index = node
+        if not vars or name not in vars:
+            return False, None
+
+        value = vars[name]
+        if index is not None:
+            value = value[index]
+
+        return True, self._sanitize_value(value)
+
+    def _sanitize_value(self, value):
+        if isinstance(value, str):
+            return self._sanitize_input(value)
+        elif isinstance(value, (list, tuple)):
+            return [self._sanitize_value(item) for item in value]
+        else:
+            return value
 
-                    elif isinstance(global_variable_value, (int, float, list)):
-                        global_variable_value = escape(str(global_variable_value))
+    def _to_query_literal(self, value) -> str:
+        if isinstance(value, list):
+            return "[" + ", ".join(self._to_query_literal(item) for item in value) + "]"
+        elif value is None or isinstance(value, (str, bool, int, float)):
+            return repr(value)
+        else:
+            return repr(str(value))
 
-                    gv_type_map[global_variable_value] = gv_type
+    @staticmethod
+    def _get_time_from_granularity(
+        granularity: str,
+        start: str = None,
+        end: str = None,
+    ) -> Tuple[str, str]:
+        if start and end:
+            return start, end
+        else:
+            now = datetime.utcnow()
 
-                    expression = expression.replace(
-                        global_variable_key, str(global_variable_value)
-                    )
+            if granularity == "YEARLY":
+                end_time = now.replace(month=1, day=1, hour=0, minute=0, second=0)
+                start_time = end_time - relativedelta(years=2)
+                return start_time.strftime("%Y"), end_time.strftime("%Y")
 
-        return expression, gv_type_map
+            elif granularity == "MONTHLY":
+                end_time = now.replace(day=1, hour=0, minute=0, second=0)
+                start_time = end_time - relativedelta(months=5)
+                return start_time.strftime("%Y-%m"), end_time.strftime("%Y-%m")
 
-    @staticmethod
-    def remove_jinja_braces(
-        expression: str,
-        gv_type_map: dict = None,
-    ) -> Union[str, float, list]:
-        if not gv_type_map:
-            jinja_pattern = re.compile(r"\{\{\s*(.*?)\s*\}\}")
-            modified_expression = re.sub(
-                jinja_pattern,
-                lambda m: "{{" + m.group(1).replace(" ", "_") + "}}",
-                expression,
-            )
-            expression = modified_expression
-
-        while "{{" in expression and "}}" in expression:
-            if re.match(r"{{\s*(\w+)\s*}}", expression):
-                expression = re.sub(r"{{\s*(\w+)\s*}}", r"\1", expression)
-            elif re.match(r"{{\s*(\d+(\.\d+)?)\s*}}", expression):
-                result = re.sub(r"{{\s*(\d+(\.\d+)?)\s*}}", r"\1", expression)
-                try:
-                    expression = float(result)
-                except ValueError:
-                    expression = eval(result)
             else:
-                expression = expression.replace("{{", "").replace("}}", "").strip()
-
-                pattern = r"\[\d+\]$"
-                if re.search(pattern, expression):
-                    dict_expression, _ = re.subn(pattern, "", expression)
-                    index_str = expression.replace(dict_expression, "").strip()
-                    index_str = index_str.replace("[", "").replace("]", "")
-                    index = int(index_str)
-                    expression = ast.literal_eval(dict_expression)[index]
-                try:
-                    expression = ast.literal_eval(expression)
-                except Exception as e:
-                    _LOGGER.error(f"Error: {e}")
-                    expression = expression
-        return expression
-
-    @staticmethod
-    def change_expression_data_type(expression: str, gv_type_map: dict) -> str:
-        for gv_value, data_type in gv_type_map.items():
-            if isinstance(data_type(gv_value), str):
-                expression = expression.replace(gv_value, f'"{gv_value}"')
-
-        return expression
-
-    def change_space_variable(self, expression: str) -> str:
-        if self.jinja_variables_contain_space:
-            for space_variable in self.jinja_variables_contain_space:
-                expression = expression.replace(
-                    space_variable["modified_key"], f"`{space_variable['origin_key']}`"
-                )
-
-        return expression
+                end_time = now.replace(hour=0, minute=0, second=0)
+                start_time = end_time - relativedelta(days=29)
+                return start_time.strftime("%Y-%m-%d"), end_time.strftime("%Y-%m-%d")
 
     def _prepare_query_data(
         self,
@@ -417,12 +1025,120 @@ class DataTableManager(BaseManager):
 
         return query_data
 
-    def _get_cached_response(self, cache_hash_key) -> dict:
+    def _get_cached_response(self, cache_hash_key, widget_id: str = None) -> dict:
         cache_data = cache.get(
-            f"dashboard:widget:load:{self.domain_id}:{self.widget_id}:{cache_hash_key}:{self.currency}"
+            f"dashboard:widget:load:{self.domain_id}:{widget_id or self.widget_id}:{cache_hash_key}:{self.currency}"
         )
         return cache_data if cache_data else None
 
+    @staticmethod
+    def encode_labels(df: pd.DataFrame, label_keys: list) -> pd.DataFrame:
+        for key in label_keys:
+            if key in df.columns and key != "Date":
+                if isinstance(df[key].dtype, pd.CategoricalDtype):
+                    continue
+
+                if pd.api.types.is_numeric_dtype(df[key]):
+                    continue
+
+                df[key] = df[key].astype("category")
+                df[key] = df[key].cat.set_categories(
+                    sorted(df[key].cat.categories, key=str)
+                )
+
+        return df
+
+    @staticmethod
+    def make_columnar_results(df: pd.DataFrame) -> list:
+        """Converts a data frame to a list of typed columns.
+
+        {"name", "values"}: numeric columns as float64 arrays, others as lists
+        {"name", "codes", "categories"}: dictionary encoded label columns,
+            used for categorical and repetitive columns (code -1 is missing)
+        """
+
+        columns = []
+        for name in df.columns:
+            column = df[name]
+            is_number = pd.api.types.is_numeric_dtype(
+                column.dtype
+            ) and not pd.api.types.is_bool_dtype(column.dtype)
+
+            if isinstance(column.dtype, pd.CategoricalDtype):
+                columns.append(
+                    {
+                        "name": name,
+                        "codes": column.cat.codes.to_numpy(),
+                        "categories": column.cat.categories.tolist(),
+                    }
+                )
+            elif is_number:
+                columns.append(
+                    {
+                        "name": name,
+                        "values": column.to_numpy(dtype="float64", na_value=np.nan),
+                    }
+                )
+            else:
+                codes, categories = pd.factorize(column)
+                if len(categories) * 2 <= len(column):
+                    columns.append(
+                        {
+                            "name": name,
+                            "codes": codes,
+                            "categories": categories.tolist(),
+                        }
+                    )
+                else:
+                    columns.append({"name": name, "values": column.tolist()})
+
+        return columns
+
+    @staticmethod
+    def decode_labels(df: pd.DataFrame, columns: list = None) -> pd.DataFrame:
+        categorical_columns = [
+            column
+            for column in columns or df.columns
+            if column in df.columns
+            and isinstance(df[column].dtype, pd.CategoricalDtype)
+        ]
+
+        if not categorical_columns:
+            return df
+
+        df = df.copy(deep=False)
+        for column in categorical_columns:
+            decoded = df[column].astype(object)
+            df[column] = decoded.where(decoded.notna(), None)
+
+        return df
+
+    @staticmethod
+    def align_categories(dfs: list, columns: list) -> None:
+        for column in columns:
+            target_dfs = [df for df in dfs if column in df.columns]
+            if not any(
+                isinstance(df[column].dtype, pd.CategoricalDtype) for df in target_dfs
+            ):
+                continue
+
+            categories = set()
+            for df in target_dfs:
+                categories.update(df[column].dropna().unique())
+
+            categories = sorted(categories, key=str)
+            for df in target_dfs:
+                df[column] = pd.Categorical(df[column], categories=categories)
+
+    @staticmethod
+    def fill_na_values(df: pd.DataFrame, fill_na: dict) -> pd.DataFrame:
+        for key, value in fill_na.items():
+            if key in df.columns and isinstance(df[key].dtype, pd.CategoricalDtype):
+                if value not in df[key].cat.categories:
+                    df[key] = df[key].cat.add_categories([value])
+
+        return df.fillna(value=fill_na)
+
     def _apply_group_by(self, group_by: list):
         if group_by and not self.df.empty:
             for key in group_by:
@@ -440,8 +1156,10 @@ class DataTableManager(BaseManager):
             if not agg_funcs:
                 raise ERROR_EMPTY_DATA_FIELD(fields=list(self.df.columns))
 
-            self.df = self.df.groupby(group_by).agg(agg_funcs).reset_index()
+            self.df = (
+                self.df.groupby(group_by, observed=True).agg(agg_funcs).reset_index()
+            )
 
     @staticmethod
     def _sanitize_input(value: str) -> str:
-        return re.sub(r"<.*?>", "", value)
+        return HTML_TAG_PATTERN.sub("", value)
@@ -0,0 +1,153 @@
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Union
+
+from spaceone.core import config, utils
+from spaceone.core.manager import BaseManager
+
+from spaceone.dashboard.manager.cost_analysis_manager import CostAnalysisManager
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_BATCH_WINDOW = 0.02  # seconds
+BATCH_FIELD_PREFIX = "batch_field_"
+
+
+class AnalyzeBatchManager(BaseManager):
+    """Merges compatible Cost.analyze calls of concurrent loads.
+
+    Queries that differ only in their single field are compatible. The first
+    caller waits for a short window, sends one analyze with the fields of every
+    caller that joined meanwhile and each caller gets the results of its field.
+
+    expected_callers: number of loads that may call analyze_cost, if known.
+    The first caller then stops waiting as soon as every load that has not
+    been released waits for a response, since no other load can join.
+    """
+
+    def __init__(self, expected_callers: int = None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cost_analysis_mgr = CostAnalysisManager()
+        self.window = config.get_global(
+            "DATA_TABLE_ANALYZE_BATCH_WINDOW", DEFAULT_BATCH_WINDOW
+        )
+        self.lock = threading.Lock()
+        self.pending_batches = {}
+        self.expected_callers = expected_callers
+        self.waiting_callers = 0
+
+    def release(self) -> None:
+        """Marks that one of the expected loads will not call analyze_cost again."""
+
+        with self.lock:
+            if self.expected_callers is not None:
+                self.expected_callers -= 1
+                self._complete_batches()
+
+    def analyze_cost(self, params: dict) -> dict:
+        batch_key = self._make_batch_key(params)
+        if batch_key is None:
+            return self.cost_analysis_mgr.analyze_cost(params)
+
+        with self.lock:
+            batch = self.pending_batches.get(batch_key)
+            is_leader = batch is None
+            if is_leader:
+                batch = {
+                    "params": params,
+                    "fields": {},
+                    "complete": threading.Event(),
+                    "future": Future(),
+                }
+                self.pending_batches[batch_key] = batch
+
+            alias = self._add_field(batch, params)
+
+            # Callers cannot join another batch until they get their response
+            self.waiting_callers += 1
+            self._complete_batches()
+
+        if is_leader:
+            batch["complete"].wait(timeout=self.window)
+            with self.lock:
+                del self.pending_batches[batch_key]
+
+            self._dispatch_batch(batch)
+
+        try:
+            response = batch["future"].result()
+        finally:
+            with self.lock:
+                self.waiting_callers -= 1
+
+        return self._split_response(response, batch, params, alias)
+
+    def _complete_batches(self) -> None:
+        # Once every expected load waits for a response, no other one can join
+        if self.expected_callers is None:
+            return
+
+        if self.waiting_callers >= self.expected_callers:
+            for batch in self.pending_batches.values():
+                batch["complete"].set()
+
+    @staticmethod
+    def _make_batch_key(params: dict) -> Union[str, None]:
+        query = params.get("query", {})
+
+        # Sorting and paging may refer to the field, so such queries are sent as is
+        if query.get("sort") or query.get("page"):
+            return None
+
+        if len(query.get("fields") or {}) != 1:
+            return None
+
+        batch_query = {key: value for key, value in query.items() if key != "fields"}
+        return utils.dict_to_hash({**params, "query": batch_query})
+
+    @staticmethod
+    def _add_field(batch: dict, params: dict) -> str:
+        field = list(params["query"]["fields"].values())[0]
+        field_key = utils.dict_to_hash(field)
+
+        if field_key not in batch["fields"]:
+            batch["fields"][field_key] = (
+                f"{BATCH_FIELD_PREFIX}{len(batch['fields'])}",
+                field,
+            )
+
+        return batch["fields"][field_key][0]
+
+    def _dispatch_batch(self, batch: dict) -> None:
+        params = batch["params"]
+        fields = {alias: field for alias, field in batch["fields"].values()}
+
+        try:
+            response = self.cost_analysis_mgr.analyze_cost(
+                {**params, "query": {**params["query"], "fields": fields}}
+            )
+            batch["future"].set_result(response)
+        except Exception as e:
+            batch["future"].set_exception(e)
+
+        if len(fields) > 1:
+            _LOGGER.debug(
+                f"[_dispatch_batch] merged {len(fields)} fields into one analyze: "
+                f"{params.get('data_source_id')}"
+            )
+
+    @staticmethod
+    def _split_response(response: dict, batch: dict, params: dict, alias: str) -> dict:
+        data_name = list(params["query"]["fields"].keys())[0]
+        aliases = {field_alias for field_alias, _ in batch["fields"].values()}
+
+        results = []
+        for row in response.get("results", []):
+            result = {key: value for key, value in row.items() if key not in aliases}
+            if alias in row:
+                result[data_name] = row[alias]
+
+            results.append(result)
+
+        return {**response, "results": results}
@@ -1,20 +1,29 @@
 import copy
 import logging
+import time
 from datetime import datetime
 from typing import Tuple
 
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 
+from spaceone.core import config
+
 from spaceone.dashboard.error.data_table import *
 from spaceone.dashboard.manager.config_manager import ConfigManager
 from spaceone.dashboard.manager.cost_analysis_manager import CostAnalysisManager
-from spaceone.dashboard.manager.data_table_manager import DataTableManager
+from spaceone.dashboard.manager.data_table_manager import (
+    DataTableManager,
+    SOURCE_SCOPE_VARIABLES,
+    DEFAULT_PREVIEW_LIMIT,
+)
 from spaceone.dashboard.manager.identity_manager import IdentityManager
 from spaceone.dashboard.manager.inventory_manager import InventoryManager
 
 _LOGGER = logging.getLogger(__name__)
 
+DATE_FORMATS = {4: "%Y", 7: "%Y-%m", 10: "%Y-%m-%d"}
+
 
 class DataSourceManager(DataTableManager):
     def __init__(
@@ -103,6 +112,9 @@ class DataSourceManager(DataTableManager):
 
         return data_info, labels_info
 
+    def is_incremental(self) -> bool:
+        return True
+
     def load(
         self,
         granularity: str = "MONTHLY",
@@ -120,20 +132,30 @@ class DataSourceManager(DataTableManager):
             elif self.source_type == "UNIFIED_COST":
                 self._analyze_unified_cost(granularity, start, end, vars)
 
-            if self.timediff:
-                self.df = self._apply_timediff(granularity, start, end, vars)
+            if self.load_mode == "SCHEMA":
+                self.df = self._make_schema_data_frame()
 
-            if self.group_by:
-                self._add_none_value_group_by_columns()
+            else:
+                if self.timediff:
+                    self.df = self._apply_timediff(granularity, start, end, vars)
 
-                group_by_keys = {option.get("key"): option for option in self.group_by}
+                if self.group_by:
+                    self._add_none_value_group_by_columns()
 
-                service_account_info = group_by_keys.get("service_account_id")
-                if service_account_info and service_account_info.get("tags"):
-                    service_account_keys = service_account_info["tags"]
-                    self._apply_left_join_tags_from_service_account(
-                        service_account_keys
-                    )
+                    group_by_keys = {
+                        option.get("key"): option for option in self.group_by
+                    }
+
+                    service_account_info = group_by_keys.get("service_account_id")
+                    if service_account_info and service_account_info.get("tags"):
+                        service_account_keys = service_account_info["tags"]
+                        self._apply_left_join_tags_from_service_account(
+                            service_account_keys
+                        )
+
+            if self.categorical_labels:
+                data_info, labels_info = self.get_data_and_labels_info()
+                self.df = self.encode_labels(self.df, list(labels_info.keys()))
 
             self.state = "AVAILABLE"
             self.error_message = None
@@ -169,12 +191,12 @@ class DataSourceManager(DataTableManager):
 
         params = {"metric_id": metric_id, "query": query}
 
-        response = self.inventory_mgr.analyze_metric_data(params)
+        response = self._dispatch_analyze(
+            self.inventory_mgr.analyze_metric_data, params
+        )
         results = response.get("results", [])
 
-        results = self._change_datetime_format(results)
-
-        self.df = pd.DataFrame(results)
+        self.df = self._make_data_frame(results, query)
 
     def _analyze_cost(
         self,
@@ -203,12 +225,15 @@ class DataSourceManager(DataTableManager):
 
         params = {"data_source_id": data_source_id, "query": query}
 
-        response = self.cost_analysis_mgr.analyze_cost(params)
-        results = response.get("results", [])
+        if self.analyze_batch_mgr:
+            analyze_func = self.analyze_batch_mgr.analyze_cost
+        else:
+            analyze_func = self.cost_analysis_mgr.analyze_cost
 
-        results = self._change_datetime_format(results)
+        response = self._dispatch_analyze(analyze_func, params)
+        results = response.get("results", [])
 
-        self.df = pd.DataFrame(results)
+        self.df = self._make_data_frame(results, query)
 
         if self.df.empty:
             expected_columns = []
@@ -254,17 +279,48 @@ class DataSourceManager(DataTableManager):
 
         params = {"query": query}
 
-        response = self.cost_analysis_mgr.analyze_unified_cost(params)
+        response = self._dispatch_analyze(
+            self.cost_analysis_mgr.analyze_unified_cost, params
+        )
         results = response.get("results", [])
 
-        results = self._change_datetime_format(results)
+        self.df = self._make_data_frame(results, query)
+
+    def _dispatch_analyze(self, analyze_func, params: dict) -> dict:
+        self.check_cancelled()
 
-        self.df = pd.DataFrame(results)
+        # The query is still built in schema mode to verify the options
+        if self.load_mode == "SCHEMA":
+            return {"results": []}
+
+        if self.load_mode == "PROBE":
+            params["query"]["page"] = {"limit": 1}
+        elif self.load_mode == "PREVIEW":
+            params["query"]["page"] = {
+                "limit": config.get_global(
+                    "DATA_TABLE_PREVIEW_LIMIT", DEFAULT_PREVIEW_LIMIT
+                )
+            }
+
+        start_time = time.perf_counter()
+        try:
+            return analyze_func(params)
+        finally:
+            self.remote_time += time.perf_counter() - start_time
+            self.remote_calls += 1
+
+    def _make_schema_data_frame(self) -> pd.DataFrame:
+        data_info, labels_info = self.get_data_and_labels_info()
+        columns = {
+            key: pd.Series(dtype=object) for key in labels_info if key is not None
+        }
+        columns.update({key: pd.Series(dtype="float64") for key in data_info})
+        return pd.DataFrame(columns)
 
     def _apply_timediff(
         self, granularity: str, start: str, end: str, vars: dict
     ) -> pd.DataFrame:
-        origin_df = self.df.copy()
+        origin_df = self.df
 
         start, end = self._change_query_time(granularity, start, end)
 
@@ -281,9 +337,7 @@ class DataSourceManager(DataTableManager):
             )
             self.df = pd.DataFrame(columns=origin_df.columns)
 
-        self.df["Date"] = self.df["Date"].apply(
-            lambda x: self._change_date_by_timediff(x)
-        )
+        self.df["Date"] = self._change_dates_by_timediff(self.df["Date"])
         self.df.rename(columns={self.data_name: self.timediff_data_name}, inplace=True)
 
         origin_label_keys = [
@@ -303,26 +357,49 @@ class DataSourceManager(DataTableManager):
         return merged_df
 
     @staticmethod
-    def _change_datetime_format(results: list) -> list:
-        changed_results = []
-        for result in results:
-            if date := result.get("date"):
-                result["Date"] = date
-                del result["date"]
-            changed_results.append(result)
-        return changed_results
-
-    def _change_date_by_timediff(self, date: str) -> str:
-        dt = self._get_datetime_from_str(date)
+    def _make_data_frame(results: list, query: dict) -> pd.DataFrame:
+        columns = list(dict.fromkeys(key for result in results for key in result))
+        if "date" in columns:
+            columns.remove("date")
+            columns.append("date")
+
+        # Skip per-cell type inference: labels are kept as objects
+        # and data fields are declared as float64
+        df = pd.DataFrame(results, columns=columns, dtype=object)
+        df.rename(columns={"date": "Date"}, inplace=True)
+
+        for data_name in query.get("fields", {}):
+            if data_name in df.columns:
+                try:
+                    df[data_name] = df[data_name].astype("float64")
+                except (TypeError, ValueError):
+                    df[data_name] = df[data_name].infer_objects()
+
+        return df
+
+    def _change_dates_by_timediff(self, dates: pd.Series) -> pd.Series:
         years = int(self.timediff.get("years", 0))
         months = int(self.timediff.get("months", 0))
 
         if years:
-            dt = dt - relativedelta(years=years)
-        elif months:
-            dt = dt - relativedelta(months=months)
+            offset = pd.DateOffset(years=years)
+        else:
+            offset = pd.DateOffset(months=months)
+
+        # Shift each distinct date once and map the result back to the rows
+        unique_dates = pd.Series(dates.unique(), dtype=object)
+        date_lens = unique_dates.str.len()
+        date_map = {}
+
+        for date_len, date_format in DATE_FORMATS.items():
+            target_dates = unique_dates[date_lens == date_len]
+            if target_dates.empty:
+                continue
+
+            shifted_dates = pd.to_datetime(target_dates, format=date_format) - offset
+            date_map.update(zip(target_dates, shifted_dates.dt.strftime(date_format)))
 
-        return self._change_str_from_datetime(dt, len(date))
+        return dates.map(date_map)
 
     def _change_query_time(
         self, granularity: str, start: str, end: str
@@ -391,32 +468,6 @@ class DataSourceManager(DataTableManager):
 
         return dt
 
-    @staticmethod
-    def _get_time_from_granularity(
-        granularity: str,
-        start: str = None,
-        end: str = None,
-    ) -> Tuple[str, str]:
-        if start and end:
-            return start, end
-        else:
-            now = datetime.utcnow()
-
-            if granularity == "YEARLY":
-                end_time = now.replace(month=1, day=1, hour=0, minute=0, second=0)
-                start_time = end_time - relativedelta(years=2)
-                return start_time.strftime("%Y"), end_time.strftime("%Y")
-
-            elif granularity == "MONTHLY":
-                end_time = now.replace(day=1, hour=0, minute=0, second=0)
-                start_time = end_time - relativedelta(months=5)
-                return start_time.strftime("%Y-%m"), end_time.strftime("%Y-%m")
-
-            else:
-                end_time = now.replace(hour=0, minute=0, second=0)
-                start_time = end_time - relativedelta(days=29)
-                return start_time.strftime("%Y-%m-%d"), end_time.strftime("%Y-%m-%d")
-
     def _make_query(
         self,
         data_key: str,
@@ -434,17 +485,13 @@ class DataSourceManager(DataTableManager):
 
                 query_value = filter_info.get("v") or filter_info.get("value")
                 if self.is_jinja_expression(query_value):
-                    query_value, gv_type_map = self.change_global_variables(
-                        query_value, vars
-                    )
-
-                    query_value = self.remove_jinja_braces(query_value, gv_type_map)
+                    query_value, is_bound = self.bind_filter_value(query_value, vars)
                     if isinstance(query_value, (str, int, float)):
                         filter_info["v"] = [query_value]
                     elif isinstance(query_value, list):
                         filter_info["v"] = query_value
 
-                    if not gv_type_map:
+                    if not is_bound:
                         continue
 
                 new_filter.append(filter_info)
@@ -453,12 +500,10 @@ class DataSourceManager(DataTableManager):
 
         if vars:
             for key, value in vars.items():
-                if key in [
-                    "workspace_id",
-                    "project_id",
-                    "project_group_id",
-                    "service_account_id",
-                ]:
+                if key not in SOURCE_SCOPE_VARIABLES:
+                    continue
+
+                if key != "region_code":
                     if isinstance(value, list):
                         self.filter.append(
                             {"key": key, "value": value, "operator": "in"}
@@ -467,7 +512,7 @@ class DataSourceManager(DataTableManager):
                         self.filter.append(
                             {"key": key, "value": value, "operator": "eq"}
                         )
-                elif key == "region_code":
+                else:
                     if isinstance(value, list):
                         if (
                             self.source_type == "COST"
@@ -520,6 +565,7 @@ class DataSourceManager(DataTableManager):
             self.df[column] = None
 
     def _apply_left_join_tags_from_service_account(self, service_account_keys) -> None:
+        self.check_cancelled()
         service_accounts_info = self.identity_mgr.list_service_accounts(
             self.workspace_id
         )
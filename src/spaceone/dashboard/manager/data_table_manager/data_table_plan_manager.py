@@ -0,0 +1,740 @@
+import ast
+import copy
+import logging
+import re
+from typing import List, Union
+
+from mongoengine import QuerySet
+
+from spaceone.core import cache, config, utils
+from spaceone.core.manager import BaseManager
+
+from spaceone.dashboard.error.data_table import (
+    ERROR_REQUIRED_PARAMETER,
+    ERROR_DATA_TABLE_CYCLE,
+    ERROR_DATA_TABLE_DEPTH,
+)
+from spaceone.dashboard.manager.data_table_manager import (
+    SOURCE_SCOPE_VARIABLES,
+    find_global_variables,
+)
+from spaceone.dashboard.manager.private_data_table_manager import (
+    PrivateDataTableManager,
+)
+from spaceone.dashboard.manager.public_data_table_manager import PublicDataTableManager
+from spaceone.dashboard.model.private_data_table.database import PrivateDataTable
+from spaceone.dashboard.model.public_data_table.database import PublicDataTable
+
+_LOGGER = logging.getLogger(__name__)
+
+ROOT_NODE_ID = "root"
+ROW_LOCAL_OPERATORS = ["SORT", "ADD_LABELS"]
+COLUMN_SELECTING_OPERATORS = ["AGGREGATE", "PIVOT"]
+INCREMENTAL_OPERATORS = ["ADD_LABELS", "CONCAT"]
+EXPRESSION_OPERATORS = ["QUERY", "EVAL", "VALUE_MAPPING"]
+ROW_LOCAL_EXPRESSION_NODES = (
+    ast.Expression,
+    ast.BinOp,
+    ast.UnaryOp,
+    ast.BoolOp,
+    ast.Compare,
+    ast.Name,
+    ast.Constant,
+    ast.List,
+    ast.Tuple,
+    ast.Load,
+    ast.operator,
+    ast.unaryop,
+    ast.boolop,
+    ast.cmpop,
+)
+BACKTICK_COLUMN_PATTERN = re.compile(r"`[^`]*`")
+TEMPLATE_KEY_PATTERN = re.compile(r"\{[^{}]*\}")
+DATA_DEPENDENT_OPERATORS = ["PIVOT"]
+DEFAULT_MAX_DEPTH = 20
+
+
+class DataTableNode:
+    """Read-only view of a plan node.
+
+    It exposes the same attributes as PublicDataTable/PrivateDataTable,
+    so the operators can consume plan nodes and data table documents alike.
+    """
+
+    def __init__(self, node: dict):
+        self.data_table_id = node["data_table_id"]
+        self.name = node.get("name")
+        self.data_type = node["data_type"]
+        self.source_type = node.get("source_type")
+        self.operator = node.get("operator")
+        self.options = copy.deepcopy(node.get("options") or {})
+        self.data_info = node.get("data_info") or {}
+        self.labels_info = node.get("labels_info") or {}
+        self.widget_id = node.get("widget_id")
+        self.domain_id = node.get("domain_id")
+        self.inputs = list(node.get("inputs", []))
+
+
+class DataTablePlanManager(BaseManager):
+    def __init__(self, data_table_type: str, domain_id: str, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.data_table_type = data_table_type
+        self.domain_id = domain_id
+        self.cache_status = None
+
+        if data_table_type == "PUBLIC":
+            self.data_table_mgr = PublicDataTableManager()
+        else:
+            self.data_table_mgr = PrivateDataTableManager()
+
+    def get_plan(
+        self,
+        widget_id: str,
+        operator: str,
+        options: dict,
+        data_table_vos: List[Union[PublicDataTable, PrivateDataTable]],
+    ) -> dict:
+        plan_key = self._make_plan_key(widget_id, operator, options, data_table_vos)
+
+        if cache.is_set():
+            if plan := cache.get(plan_key):
+                self.cache_status = "HIT"
+                return plan
+
+        self.cache_status = "MISS"
+        plan = self.compile_plan(widget_id, operator, options, data_table_vos)
+        plan = self.optimize_plan(plan)
+
+        if cache.is_set():
+            cache.set(plan_key, plan, expire=86400)
+
+        return plan
+
+    def compile_plan(
+        self,
+        widget_id: str,
+        operator: str,
+        options: dict,
+        data_table_vos: List[Union[PublicDataTable, PrivateDataTable]],
+    ) -> dict:
+        nodes = {}
+        data_table_map = self._prefetch_ancestors(data_table_vos)
+        for data_table_vo in data_table_vos:
+            self._add_data_table_node(nodes, data_table_vo, data_table_map)
+
+        nodes[ROOT_NODE_ID] = {
+            "data_table_id": ROOT_NODE_ID,
+            "name": None,
+            "data_type": "TRANSFORMED",
+            "operator": operator,
+            "options": {operator: copy.deepcopy(options)},
+            "inputs": [data_table_vo.data_table_id for data_table_vo in data_table_vos],
+            "data_info": {},
+            "labels_info": {},
+            "widget_id": widget_id,
+            "domain_id": self.domain_id,
+        }
+
+        return {
+            "root": ROOT_NODE_ID,
+            "order": self._sort_nodes(nodes, ROOT_NODE_ID),
+            "nodes": nodes,
+            "rewrites": [],
+        }
+
+    def optimize_plan(self, plan: dict) -> dict:
+        is_changed = True
+        while is_changed:
+            is_changed = any(
+                [
+                    self._fuse_query_and_sort(plan),
+                    self._push_down_predicates(plan),
+                    self._prune_projections(plan),
+                    self._eliminate_dead_nodes(plan),
+                ]
+            )
+
+        plan["order"] = self._sort_nodes(plan["nodes"], plan["root"])
+        plan["nodes"] = {
+            node_id: node
+            for node_id, node in plan["nodes"].items()
+            if node_id in plan["order"]
+        }
+
+        return plan
+
+    @staticmethod
+    def is_incremental_plan(plan: dict) -> bool:
+        return all(
+            node["data_type"] == "ADDED"
+            or node["operator"] in INCREMENTAL_OPERATORS
+            or DataTablePlanManager._is_row_local_expression_node(node)
+            for node in plan["nodes"].values()
+        )
+
+    @staticmethod
+    def has_data_dependent_columns(plan: dict) -> bool:
+        return any(
+            node["operator"] in DATA_DEPENDENT_OPERATORS
+            for node in plan["nodes"].values()
+        )
+
+    @staticmethod
+    def is_row_local_expression(expression) -> bool:
+        if isinstance(expression, (int, float)):
+            return True
+
+        # Global variables may expand to any expression, so they are not trusted
+        if not isinstance(expression, str) or "{{" in expression:
+            return False
+
+        expression = BACKTICK_COLUMN_PATTERN.sub("column", expression)
+        expression = TEMPLATE_KEY_PATTERN.sub("column", expression)
+
+        try:
+            tree = ast.parse(expression.strip(), mode="eval")
+        except SyntaxError:
+            return False
+
+        return all(
+            isinstance(ast_node, ROW_LOCAL_EXPRESSION_NODES)
+            for ast_node in ast.walk(tree)
+        )
+
+    @staticmethod
+    def count_consumers(plan: dict) -> dict:
+        consumers = {node_id: 0 for node_id in plan["order"]}
+        for node_id in plan["order"]:
+            for input_id in plan["nodes"][node_id]["inputs"]:
+                consumers[input_id] += 1
+        return consumers
+
+    def make_lineage(
+        self,
+        data_type: str,
+        source_type: Union[str, None],
+        operator: Union[str, None],
+        options: dict,
+        data_table_id: str = None,
+    ) -> dict:
+        """Computes the lineage stored on a data table at write time.
+
+        ancestors: every upstream data table in topological order (inputs first)
+        depth: length of the longest path from an ADDED data table
+        dag_hash: hash of the definitions of the data table and all of its ancestors
+        variables: global variables the result depends on, including its ancestors
+        """
+
+        variables = find_global_variables(options)
+
+        if data_type == "ADDED":
+            return {
+                "ancestors": [],
+                "depth": 0,
+                "dag_hash": utils.dict_to_hash(
+                    {"source_type": source_type, "options": options}
+                ),
+                "variables": sorted(set(SOURCE_SCOPE_VARIABLES + variables)),
+            }
+
+        input_ids = self._get_input_ids(operator, options.get(operator, {}))
+        data_table_map = {
+            data_table_vo.data_table_id: data_table_vo
+            for data_table_vo in self._filter_data_tables(
+                data_table_id=list(set(input_ids)), domain_id=self.domain_id
+            )
+        }
+
+        ancestors = []
+        depth = 0
+        input_hashes = []
+        for input_id in input_ids:
+            if input_id not in data_table_map:
+                data_table_map[input_id] = self._get_data_table(input_id)
+
+            input_lineage = self._get_stored_lineage(data_table_map[input_id])
+            for ancestor_id in input_lineage["ancestors"] + [input_id]:
+                if ancestor_id not in ancestors:
+                    ancestors.append(ancestor_id)
+
+            depth = max(depth, input_lineage["depth"] + 1)
+            input_hashes.append(input_lineage["dag_hash"])
+            variables.extend(input_lineage["variables"])
+
+        if data_table_id and data_table_id in ancestors:
+            raise ERROR_DATA_TABLE_CYCLE(data_table_id=data_table_id)
+
+        max_depth = config.get_global("DATA_TABLE_MAX_DEPTH", DEFAULT_MAX_DEPTH)
+        if depth > max_depth:
+            raise ERROR_DATA_TABLE_DEPTH(depth=depth, max_depth=max_depth)
+
+        definition = {"operator": operator, "options": options, "inputs": input_hashes}
+
+        # JOIN renames the duplicated columns after the names of its inputs
+        if operator in ["JOIN", "CONCAT"]:
+            definition["input_names"] = [
+                data_table_map[input_id].name for input_id in input_ids
+            ]
+
+        return {
+            "ancestors": ancestors,
+            "depth": depth,
+            "dag_hash": utils.dict_to_hash(definition),
+            "variables": sorted(set(variables)),
+        }
+
+    def update_descendant_lineages(
+        self, data_table_vo: Union[PublicDataTable, PrivateDataTable]
+    ) -> None:
+        descendant_vos = self._filter_data_tables(
+            ancestors=data_table_vo.data_table_id, domain_id=self.domain_id
+        )
+
+        for descendant_vo in sorted(descendant_vos, key=lambda vo: vo.depth or 0):
+            lineage = self.make_lineage(
+                descendant_vo.data_type,
+                descendant_vo.source_type,
+                descendant_vo.operator,
+                descendant_vo.options,
+                descendant_vo.data_table_id,
+            )
+            descendant_vo.update(lineage)
+
+    def _get_stored_lineage(
+        self,
+        data_table_vo: Union[PublicDataTable, PrivateDataTable],
+    ) -> dict:
+        # Data tables created before the lineage was stored are resolved once here
+        if (
+            data_table_vo.dag_hash
+            and data_table_vo.ancestors is not None
+            and data_table_vo.variables is not None
+        ):
+            return {
+                "ancestors": list(data_table_vo.ancestors),
+                "depth": data_table_vo.depth or 0,
+                "dag_hash": data_table_vo.dag_hash,
+                "variables": list(data_table_vo.variables),
+            }
+
+        lineage = self.make_lineage(
+            data_table_vo.data_type,
+            data_table_vo.source_type,
+            data_table_vo.operator,
+            data_table_vo.options,
+            data_table_vo.data_table_id,
+        )
+        data_table_vo.update(lineage)
+        return lineage
+
+    def _prefetch_ancestors(
+        self,
+        data_table_vos: List[Union[PublicDataTable, PrivateDataTable]],
+    ) -> dict:
+        ancestor_ids = set()
+        for data_table_vo in data_table_vos:
+            ancestor_ids.update(getattr(data_table_vo, "ancestors", None) or [])
+
+        if not ancestor_ids:
+            return {}
+
+        return {
+            data_table_vo.data_table_id: data_table_vo
+            for data_table_vo in self._filter_data_tables(
+                data_table_id=list(ancestor_ids), domain_id=self.domain_id
+            )
+        }
+
+    def _add_data_table_node(
+        self,
+        nodes: dict,
+        data_table_vo: Union[PublicDataTable, PrivateDataTable],
+        data_table_map: dict = None,
+    ) -> None:
+        if data_table_vo.data_table_id in nodes:
+            return
+
+        node = {
+            "data_table_id": data_table_vo.data_table_id,
+            "name": data_table_vo.name,
+            "data_type": data_table_vo.data_type,
+            "source_type": data_table_vo.source_type,
+            "operator": data_table_vo.operator,
+            "options": copy.deepcopy(data_table_vo.options),
+            "inputs": [],
+            "data_info": copy.deepcopy(data_table_vo.data_info or {}),
+            "labels_info": copy.deepcopy(data_table_vo.labels_info or {}),
+            "widget_id": data_table_vo.widget_id,
+            "domain_id": data_table_vo.domain_id,
+        }
+        nodes[data_table_vo.data_table_id] = node
+
+        if data_table_vo.data_type == "TRANSFORMED":
+            operator_options = data_table_vo.options.get(data_table_vo.operator, {})
+            for data_table_id in self._get_input_ids(
+                data_table_vo.operator, operator_options
+            ):
+                if data_table_map and data_table_id in data_table_map:
+                    parent_vo = data_table_map[data_table_id]
+                else:
+                    parent_vo = self._get_data_table(data_table_id)
+
+                node["inputs"].append(parent_vo.data_table_id)
+                self._add_data_table_node(nodes, parent_vo, data_table_map)
+
+    def _get_data_table(
+        self, data_table_id: str
+    ) -> Union[PublicDataTable, PrivateDataTable]:
+        if self.data_table_type == "PUBLIC":
+            return self.data_table_mgr.get_public_data_table(
+                data_table_id, self.domain_id
+            )
+        else:
+            return self.data_table_mgr.get_private_data_table(
+                data_table_id, self.domain_id
+            )
+
+    def _filter_data_tables(self, **conditions) -> QuerySet:
+        if self.data_table_type == "PUBLIC":
+            return self.data_table_mgr.filter_public_data_tables(**conditions)
+        else:
+            return self.data_table_mgr.filter_private_data_tables(**conditions)
+
+    @staticmethod
+    def _get_input_ids(operator: str, operator_options: dict) -> list:
+        if operator in ["JOIN", "CONCAT"]:
+            if data_tables := operator_options.get("data_tables"):
+                return list(data_tables)
+            raise ERROR_REQUIRED_PARAMETER(key=f"options.{operator}.data_tables")
+        else:
+            if data_table_id := operator_options.get("data_table_id"):
+                return [data_table_id]
+            raise ERROR_REQUIRED_PARAMETER(key="options.data_table_id")
+
+    @staticmethod
+    def _sort_nodes(nodes: dict, root_id: str) -> list:
+        order = []
+        visited = set()
+
+        def _visit(node_id: str) -> None:
+            if node_id in visited:
+                return
+            visited.add(node_id)
+            for input_id in nodes[node_id]["inputs"]:
+                _visit(input_id)
+            order.append(node_id)
+
+        _visit(root_id)
+        return order
+
+    @staticmethod
+    def _get_consumers(plan: dict) -> dict:
+        consumers = {node_id: [] for node_id in plan["nodes"]}
+        for node_id in DataTablePlanManager._sort_nodes(plan["nodes"], plan["root"]):
+            for input_id in plan["nodes"][node_id]["inputs"]:
+                consumers[input_id].append(node_id)
+        return consumers
+
+    @staticmethod
+    def _get_operator_options(node: dict) -> dict:
+        return node["options"].get(node["operator"], {})
+
+    @staticmethod
+    def _get_produced_columns(node: dict) -> list:
+        operator_options = DataTablePlanManager._get_operator_options(node)
+
+        if node["operator"] == "EVAL":
+            columns = []
+            for expression in operator_options.get("expressions", []):
+                if isinstance(expression, dict):
+                    columns.append(expression.get("name"))
+                elif isinstance(expression, str):
+                    columns.append(expression.split("=", 1)[0].replace("`", "").strip())
+            return columns
+        elif node["operator"] == "ADD_LABELS":
+            return list(operator_options.get("labels", {}).keys())
+        elif node["operator"] == "VALUE_MAPPING":
+            return [operator_options.get("name")]
+        else:
+            return []
+
+    @staticmethod
+    def _is_row_local_expression_node(node: dict) -> bool:
+        """Checks that every QUERY, EVAL or VALUE_MAPPING expression reads its own row.
+
+        Expressions such as `cost / cost.sum()` or `cost.shift(1)` read the whole
+        column, so their result depends on the other rows of the frame.
+        """
+
+        if node["operator"] not in EXPRESSION_OPERATORS:
+            return False
+
+        operator_options = DataTablePlanManager._get_operator_options(node)
+        if node["operator"] == "QUERY":
+            expressions = operator_options.get("conditions", [])
+        elif node["operator"] == "VALUE_MAPPING":
+            # The cases are matched per key, only the condition may read other rows
+            condition = operator_options.get("condition")
+            expressions = [condition] if condition else []
+        else:
+            expressions = []
+            for expression in operator_options.get("expressions", []):
+                if isinstance(expression, dict):
+                    expressions.append(expression.get("expression"))
+                    if expression.get("condition"):
+                        expressions.append(expression["condition"])
+                elif isinstance(expression, str):
+                    expressions.append(expression.split("=", 1)[-1])
+                else:
+                    return False
+
+        return all(
+            DataTablePlanManager.is_row_local_expression(expression)
+            for expression in expressions
+        )
+
+    @staticmethod
+    def _get_referenced_columns(node: dict, columns: list) -> set:
+        operator_options = DataTablePlanManager._get_operator_options(node)
+        text = str(operator_options)
+        return {column for column in columns if column and column in text}
+
+    def _fuse_query_and_sort(self, plan: dict) -> bool:
+        nodes = plan["nodes"]
+        consumers = self._get_consumers(plan)
+
+        for node_id in self._sort_nodes(nodes, plan["root"]):
+            node = nodes[node_id]
+            if node["operator"] not in ["QUERY", "SORT"] or len(node["inputs"]) != 1:
+                continue
+
+            input_id = node["inputs"][0]
+            input_node = nodes[input_id]
+            if (
+                input_node["operator"] != node["operator"]
+                or input_node["data_type"] != "TRANSFORMED"
+                or len(consumers[input_id]) != 1
+            ):
+                continue
+
+            operator = node["operator"]
+            options = node["options"][operator]
+            input_options = input_node["options"][operator]
+
+            if operator == "QUERY":
+                options["conditions"] = list(
+                    input_options.get("conditions", [])
+                ) + list(options.get("conditions", []))
+            else:
+                sort_keys = [sort_option["key"] for sort_option in options["sort"]]
+                options["sort"] = list(options["sort"]) + [
+                    sort_option
+                    for sort_option in input_options.get("sort", [])
+                    if sort_option["key"] not in sort_keys
+                ]
+
+            node["inputs"] = list(input_node["inputs"])
+            plan["rewrites"].append(f"fuse_{operator.lower()}:{input_id}->{node_id}")
+            return True
+
+        return False
+
+    def _push_down_predicates(self, plan: dict) -> bool:
+        nodes = plan["nodes"]
+        consumers = self._get_consumers(plan)
+
+        for node_id in self._sort_nodes(nodes, plan["root"]):
+            node = nodes[node_id]
+            if node["operator"] != "QUERY" or len(node["inputs"]) != 1:
+                continue
+
+            input_id = node["inputs"][0]
+            input_node = nodes[input_id]
+            is_row_local = input_node["operator"] in ROW_LOCAL_OPERATORS or (
+                input_node["operator"] in ["EVAL", "VALUE_MAPPING"]
+                and self._is_row_local_expression_node(input_node)
+            )
+            if (
+                not is_row_local
+                or input_node["data_type"] != "TRANSFORMED"
+                or len(consumers[input_id]) != 1
+            ):
+                continue
+
+            conditions = " ".join(
+                str(condition) for condition in node["options"]["QUERY"]["conditions"]
+            )
+
+            # Date conditions convert the Date column, so they have to stay on top
+            if "Date" in conditions:
+                continue
+
+            produced_columns = self._get_produced_columns(input_node)
+            if any(column and column in conditions for column in produced_columns):
+                continue
+
+            grand_input_node = nodes[input_node["inputs"][0]]
+
+            # Swap the operators: the QUERY runs first, the row-local operator after
+            query_payload = {
+                "operator": node["operator"],
+                "options": node["options"],
+                "name": node["name"],
+            }
+            node["operator"] = input_node["operator"]
+            node["options"] = input_node["options"]
+            node["name"] = input_node["name"]
+
+            input_node.update(query_payload)
+            input_node["data_info"] = copy.deepcopy(grand_input_node["data_info"])
+            input_node["labels_info"] = copy.deepcopy(grand_input_node["labels_info"])
+
+            plan["rewrites"].append(f"push_down_query:{node_id}->{input_id}")
+            return True
+
+        return False
+
+    def _prune_projections(self, plan: dict) -> bool:
+        nodes = plan["nodes"]
+        consumers = self._get_consumers(plan)
+
+        for node_id in self._sort_nodes(nodes, plan["root"]):
+            node = nodes[node_id]
+            node_consumers = consumers[node_id]
+            if (
+                node_id == plan["root"]
+                or not node_consumers
+                or node["operator"] not in ["EVAL", "ADD_LABELS"]
+                or node["data_type"] != "TRANSFORMED"
+            ):
+                continue
+
+            if any(
+                nodes[consumer_id]["operator"] not in COLUMN_SELECTING_OPERATORS
+                for consumer_id in node_consumers
+            ):
+                continue
+
+            produced_columns = self._get_produced_columns(node)
+            required_columns = set()
+            for consumer_id in node_consumers:
+                required_columns |= self._get_referenced_columns(
+                    nodes[consumer_id], produced_columns
+                )
+
+            operator_options = node["options"][node["operator"]]
+            if node["operator"] == "EVAL":
+                expressions = operator_options.get("expressions", [])
+                kept_expressions = []
+                for expression, column in reversed(
+                    list(zip(expressions, produced_columns))
+                ):
+                    if column in required_columns:
+                        kept_expressions.insert(0, expression)
+                        required_columns |= {
+                            produced_column
+                            for produced_column in produced_columns
+                            if produced_column
+                            and produced_column != column
+                            and produced_column in str(expression)
+                        }
+
+                if len(kept_expressions) == len(expressions):
+                    continue
+
+                operator_options["expressions"] = kept_expressions
+            else:
+                labels = operator_options.get("labels", {})
+                kept_labels = {
+                    key: value
+                    for key, value in labels.items()
+                    if key in required_columns
+                }
+
+                if len(kept_labels) == len(labels):
+                    continue
+
+                operator_options["labels"] = kept_labels
+
+            plan["rewrites"].append(f"prune_projection:{node_id}")
+            return True
+
+        return False
+
+    def _eliminate_dead_nodes(self, plan: dict) -> bool:
+        nodes = plan["nodes"]
+        consumers = self._get_consumers(plan)
+
+        for node_id in self._sort_nodes(nodes, plan["root"]):
+            node = nodes[node_id]
+            node_consumers = consumers[node_id]
+            if (
+                node_id == plan["root"]
+                or not node_consumers
+                or node["data_type"] != "TRANSFORMED"
+                or len(node["inputs"]) != 1
+            ):
+                continue
+
+            operator_options = node["options"].get(node["operator"], {})
+            is_dead = False
+
+            if node["operator"] == "SORT":
+                # AGGREGATE and PIVOT reorder rows, so a sort below them has no effect
+                is_dead = all(
+                    nodes[consumer_id]["operator"] in COLUMN_SELECTING_OPERATORS
+                    for consumer_id in node_consumers
+                )
+            elif node["operator"] == "QUERY":
+                is_dead = not operator_options.get("conditions")
+            elif node["operator"] == "EVAL":
+                is_dead = not operator_options.get("expressions")
+            elif node["operator"] == "ADD_LABELS":
+                is_dead = not operator_options.get("labels")
+            elif node["operator"] == "VALUE_MAPPING":
+                is_dead = all(
+                    nodes[consumer_id]["operator"] in COLUMN_SELECTING_OPERATORS
+                    and not self._get_referenced_columns(
+                        nodes[consumer_id], [operator_options.get("name")]
+                    )
+                    for consumer_id in node_consumers
+                )
+
+            if not is_dead:
+                continue
+
+            input_id = node["inputs"][0]
+            for consumer_id in node_consumers:
+                nodes[consumer_id]["inputs"] = [
+                    input_id if consumer_input_id == node_id else consumer_input_id
+                    for consumer_input_id in nodes[consumer_id]["inputs"]
+                ]
+
+            plan["rewrites"].append(f"eliminate_dead_node:{node_id}")
+            return True
+
+        return False
+
+    def _make_plan_key(
+        self,
+        widget_id: str,
+        operator: str,
+        options: dict,
+        data_table_vos: List[Union[PublicDataTable, PrivateDataTable]],
+    ) -> str:
+        plan_hash = utils.dict_to_hash(
+            {
+                "operator": operator,
+                "options": options,
+                "data_tables": [
+                    [
+                        data_table_vo.data_table_id,
+                        data_table_vo.name,
+                        getattr(data_table_vo, "dag_hash", None)
+                        or str(data_table_vo.updated_at),
+                    ]
+                    for data_table_vo in data_table_vos
+                ],
+            }
+        )
+        return f"dashboard:data-table:plan:{self.domain_id}:{widget_id}:{plan_hash}"
@@ -1,10 +1,14 @@
 import logging
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Union, Tuple
 
 import numpy as np
 import pandas as pd
 
+from spaceone.core import cache, config, utils
+
 from spaceone.dashboard.error.data_table import (
     ERROR_INVALID_PARAMETER,
     ERROR_NOT_SUPPORTED_OPERATOR,
@@ -14,10 +18,20 @@ from spaceone.dashboard.error.data_table import (
     ERROR_DUPLICATED_FIELD_NAME,
     ERROR_NOT_ALLOWED_DATA_FIELD,
 )
-from spaceone.dashboard.manager.data_table_manager import DataTableManager
+from spaceone.dashboard.manager.data_table_manager import (
+    DataTableManager,
+    run_with_transaction,
+)
+from spaceone.dashboard.manager.data_table_manager.analyze_batch_manager import (
+    AnalyzeBatchManager,
+)
 from spaceone.dashboard.manager.data_table_manager.data_source_manager import (
     DataSourceManager,
 )
+from spaceone.dashboard.manager.data_table_manager.data_table_plan_manager import (
+    DataTablePlanManager,
+    DataTableNode,
+)
 from spaceone.dashboard.manager.private_data_table_manager import (
     PrivateDataTableManager,
 )
@@ -27,6 +41,9 @@ from spaceone.dashboard.model.public_data_table.database import PublicDataTable
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_MAX_LOAD_WORKERS = 4
+BACKTICK_FIELD_PATTERN = re.compile(r"`([^`]+)`")
+
 
 class DataTransformationManager(DataTableManager):
     def __init__(
@@ -36,6 +53,7 @@ class DataTransformationManager(DataTableManager):
         options: dict,
         widget_id: str,
         domain_id: str,
+        data_table_vos: List[Union[PublicDataTable, PrivateDataTable]] = None,
         *args,
         **kwargs,
     ):
@@ -59,7 +77,11 @@ class DataTransformationManager(DataTableManager):
         self.options = options
         self.widget_id = widget_id
         self.domain_id = domain_id
-        self.data_table_vos = self._get_data_table_from_options(operator, options)
+        if data_table_vos is None:
+            data_table_vos = self._get_data_table_from_options(operator, options)
+
+        self.data_table_vos = data_table_vos
+        self.data_frames = {}
         self.data_keys = []
         self.label_keys = []
         self.total_series = None
@@ -86,6 +108,13 @@ class DataTransformationManager(DataTableManager):
 
         return data_info, labels_info
 
+    def is_incremental(self) -> bool:
+        plan_mgr = DataTablePlanManager(self.data_table_type, self.domain_id)
+        plan = plan_mgr.get_plan(
+            self.widget_id, self.operator, self.options, self.data_table_vos
+        )
+        return plan_mgr.is_incremental_plan(plan)
+
     def load(
         self,
         granularity: str = "MONTHLY",
@@ -94,24 +123,7 @@ class DataTransformationManager(DataTableManager):
         vars: dict = None,
     ) -> pd.DataFrame:
         try:
-            if self.operator == "JOIN":
-                self.join_data_tables(granularity, start, end, vars)
-            elif self.operator == "CONCAT":
-                self.concat_data_tables(granularity, start, end, vars)
-            elif self.operator == "AGGREGATE":
-                self.aggregate_data_table(granularity, start, end, vars)
-            elif self.operator == "QUERY":
-                self.query_data_table(granularity, start, end, vars)
-            elif self.operator == "EVAL":
-                self.evaluate_data_table(granularity, start, end, vars)
-            elif self.operator == "PIVOT":
-                self.pivot_data_table(granularity, start, end, vars)
-            elif self.operator == "ADD_LABELS":
-                self.add_labels_data_table(granularity, start, end, vars)
-            elif self.operator == "VALUE_MAPPING":
-                self.value_mapping_data_table(granularity, start, end, vars)
-            elif self.operator == "SORT":
-                self.sort_data_table(granularity, start, end, vars)
+            self.execute_plan(granularity, start, end, vars)
 
             self.state = "AVAILABLE"
             self.error_message = None
@@ -123,6 +135,189 @@ class DataTransformationManager(DataTableManager):
 
         return self.df
 
+    def execute_plan(
+        self,
+        granularity: str,
+        start: str = None,
+        end: str = None,
+        vars: dict = None,
+    ) -> None:
+        plan_mgr = DataTablePlanManager(self.data_table_type, self.domain_id)
+        plan = plan_mgr.get_plan(
+            self.widget_id, self.operator, self.options, self.data_table_vos
+        )
+        consumers = plan_mgr.count_consumers(plan)
+        data_frames = {}
+
+        # Pivoted columns come from the values, so they cannot be inferred
+        if self.load_mode != "FULL" and plan_mgr.has_data_dependent_columns(plan):
+            self.load_mode = "FULL"
+
+        source_mgrs = self._load_source_nodes(plan, granularity, start, end, vars)
+
+        if self.profile is not None:
+            self.plan_info = {
+                "root": plan["root"],
+                "order": plan["order"],
+                "rewrites": plan["rewrites"],
+                "cache": plan_mgr.cache_status,
+            }
+
+        for node_id in plan["order"]:
+            self.check_cancelled()
+            node = DataTableNode(plan["nodes"][node_id])
+
+            input_data_frames = {}
+            for input_id in node.inputs:
+                consumers[input_id] -= 1
+                if consumers[input_id] > 0:
+                    df = data_frames[input_id]
+                    input_data_frames[input_id] = (
+                        None if df is None else df.copy(deep=False)
+                    )
+                else:
+                    input_data_frames[input_id] = data_frames.pop(input_id)
+
+            start_time = time.perf_counter()
+
+            if node.data_type == "ADDED":
+                dt_mgr, elapsed_time = source_mgrs.pop(node_id)
+            else:
+                input_nodes = [
+                    DataTableNode(plan["nodes"][input_id]) for input_id in node.inputs
+                ]
+
+                if node_id == plan["root"]:
+                    dt_mgr = self
+                    dt_mgr.operator = node.operator
+                    dt_mgr.options = node.options.get(node.operator, {})
+                    dt_mgr.data_table_vos = input_nodes
+                else:
+                    dt_mgr = DataTransformationManager(
+                        self.data_table_type,
+                        node.operator,
+                        node.options.get(node.operator, {}),
+                        node.widget_id,
+                        node.domain_id,
+                        data_table_vos=input_nodes,
+                    )
+                    dt_mgr.load_mode = self.load_mode
+                    dt_mgr.cancel_event = self.cancel_event
+
+                dt_mgr.data_frames = input_data_frames
+                dt_mgr.run_operator(granularity, start, end, vars)
+                dt_mgr.data_frames = {}
+                elapsed_time = time.perf_counter() - start_time
+
+            data_frames[node_id] = dt_mgr.df
+
+            if self.profile is not None:
+                node_profile = self.make_node_profile(
+                    node_id,
+                    node,
+                    [0 if df is None else len(df) for df in input_data_frames.values()],
+                    dt_mgr.df,
+                    elapsed_time,
+                    dt_mgr.remote_time,
+                )
+                node_profile["state"] = dt_mgr.state or "AVAILABLE"
+                node_profile["remote_calls"] = dt_mgr.remote_calls
+                if dt_mgr.join_info:
+                    node_profile["join_info"] = dt_mgr.join_info
+                self.profile.append(node_profile)
+
+    def _load_source_nodes(
+        self,
+        plan: dict,
+        granularity: str,
+        start: str = None,
+        end: str = None,
+        vars: dict = None,
+    ) -> dict:
+        source_mgrs = {}
+        for node_id in plan["order"]:
+            node = DataTableNode(plan["nodes"][node_id])
+            if node.data_type == "ADDED":
+                # Managers are created here so that their connectors are set up once
+                source_mgrs[node_id] = DataSourceManager(
+                    self.data_table_type,
+                    node.source_type,
+                    node.options,
+                    node.widget_id,
+                    node.domain_id,
+                )
+                source_mgrs[node_id].load_mode = self.load_mode
+                source_mgrs[node_id].cancel_event = self.cancel_event
+
+        def _load(ds_mgr: DataSourceManager) -> Tuple[DataSourceManager, float]:
+            start_time = time.perf_counter()
+            try:
+                ds_mgr.load(granularity, start, end, vars)
+            finally:
+                # A loaded source cannot join a batch anymore
+                if ds_mgr.analyze_batch_mgr and ds_mgr.source_type == "COST":
+                    ds_mgr.analyze_batch_mgr.release()
+
+            return ds_mgr, time.perf_counter() - start_time
+
+        max_workers = min(
+            len(source_mgrs),
+            config.get_global("DATA_TABLE_MAX_LOAD_WORKERS", DEFAULT_MAX_LOAD_WORKERS),
+        )
+
+        # Sources of the same cost data source often differ only in their field
+        cost_source_count = len(
+            [ds_mgr for ds_mgr in source_mgrs.values() if ds_mgr.source_type == "COST"]
+        )
+        analyze_batch_mgr = self.analyze_batch_mgr
+        if analyze_batch_mgr is None and cost_source_count > 1 and max_workers > 1:
+            # Only the cost sources of this plan can join, so they are expected
+            analyze_batch_mgr = AnalyzeBatchManager(expected_callers=cost_source_count)
+
+        for ds_mgr in source_mgrs.values():
+            ds_mgr.analyze_batch_mgr = analyze_batch_mgr
+
+        if max_workers <= 1:
+            return {
+                node_id: _load(ds_mgr) for node_id, ds_mgr in source_mgrs.items()
+            }
+
+        transaction = self.transaction
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                node_id: executor.submit(
+                    run_with_transaction, transaction, _load, ds_mgr
+                )
+                for node_id, ds_mgr in source_mgrs.items()
+            }
+            return {node_id: future.result() for node_id, future in futures.items()}
+
+    def run_operator(
+        self,
+        granularity: str,
+        start: str = None,
+        end: str = None,
+        vars: dict = None,
+    ) -> None:
+        if self.operator == "JOIN":
+            self.join_data_tables(granularity, start, end, vars)
+        elif self.operator == "CONCAT":
+            self.concat_data_tables(granularity, start, end, vars)
+        elif self.operator == "AGGREGATE":
+            self.aggregate_data_table(granularity, start, end, vars)
+        elif self.operator == "QUERY":
+            self.query_data_table(granularity, start, end, vars)
+        elif self.operator == "EVAL":
+            self.evaluate_data_table(granularity, start, end, vars)
+        elif self.operator == "PIVOT":
+            self.pivot_data_table(granularity, start, end, vars)
+        elif self.operator == "ADD_LABELS":
+            self.add_labels_data_table(granularity, start, end, vars)
+        elif self.operator == "VALUE_MAPPING":
+            self.value_mapping_data_table(granularity, start, end, vars)
+        elif self.operator == "SORT":
+            self.sort_data_table(granularity, start, end, vars)
+
     def join_data_tables(
         self,
         granularity: str,
@@ -137,20 +332,23 @@ class DataTransformationManager(DataTableManager):
         self._validate_options(how, left_keys, right_keys)
 
         origin_vo = self.data_table_vos[0]
-        other_vo = self.data_table_vos[1]
-        origin_df = self._get_data_table(origin_vo, granularity, start, end, vars)
-        other_df = self._get_data_table(other_vo, granularity, start, end, vars)
+        other_vos = self.data_table_vos[1:]
+        data_frames = [
+            self._get_data_table(data_table_vo, granularity, start, end, vars)
+            for data_table_vo in self.data_table_vos
+        ]
 
-        self._validate_join_keys(left_keys, right_keys, origin_vo, other_vo)
+        for other_vo in other_vos:
+            self._validate_join_keys(left_keys, right_keys, origin_vo, other_vo)
 
-        self._set_data_keys(origin_vo, other_vo)
+        self._set_data_keys(self.data_table_vos)
 
         merged_df = self._merge_data_frames(
-            origin_df, other_df, how, left_keys, right_keys
-        )
-
-        merged_df = self._rename_duplicated_columns(
-            merged_df, origin_vo.name, other_vo.name
+            data_frames,
+            [data_table_vo.name for data_table_vo in self.data_table_vos],
+            how,
+            left_keys,
+            right_keys,
         )
 
         self.label_keys = list(set(merged_df.columns) - set(self.data_keys))
@@ -163,15 +361,14 @@ class DataTransformationManager(DataTableManager):
         end: str = None,
         vars: dict = None,
     ) -> None:
-        origin_vo = self.data_table_vos[0]
-        other_vo = self.data_table_vos[1]
-        origin_data_keys = set(origin_vo.data_info.keys())
-        other_data_keys = set(other_vo.data_info.keys())
+        data_keys = set()
+        label_keys = set()
+        for data_table_vo in self.data_table_vos:
+            data_keys |= set(data_table_vo.data_info.keys())
+            label_keys |= set(data_table_vo.labels_info.keys())
 
-        self.data_keys = list(origin_data_keys | other_data_keys)
-        origin_label_keys = set(origin_vo.labels_info.keys())
-        other_label_keys = set(other_vo.labels_info.keys())
-        self.label_keys = list(origin_label_keys | other_label_keys)
+        self.data_keys = list(data_keys)
+        self.label_keys = list(label_keys)
 
         fill_na = {}
         for key in self.data_keys:
@@ -180,11 +377,18 @@ class DataTransformationManager(DataTableManager):
         for key in self.label_keys:
             fill_na[key] = ""
 
-        origin_df = self._get_data_table(origin_vo, granularity, start, end, vars)
-        other_df = self._get_data_table(other_vo, granularity, start, end, vars)
+        data_frames = [
+            self._get_data_table(data_table_vo, granularity, start, end, vars)
+            for data_table_vo in self.data_table_vos
+        ]
+
+        self.align_categories(data_frames, self.label_keys)
+        merged_df = pd.concat(data_frames, ignore_index=True)
+        merged_df = self.fill_na_values(merged_df, fill_na)
+
+        if self.categorical_labels:
+            merged_df = self.encode_labels(merged_df, self.label_keys)
 
-        merged_df = pd.concat([origin_df, other_df], ignore_index=True)
-        merged_df = merged_df.fillna(value=fill_na)
         self.df = merged_df
 
     def aggregate_data_table(
@@ -212,7 +416,7 @@ class DataTransformationManager(DataTableManager):
         self.label_keys = group_by
 
         df = self._get_data_table(origin_vo, granularity, start, end, vars)
-        if df is None or df.empty:
+        if df is None or (df.empty and self.load_mode != "SCHEMA"):
             self.df = pd.DataFrame(columns=self.label_keys + self.data_keys)
             return
 
@@ -229,7 +433,7 @@ class DataTransformationManager(DataTableManager):
                 )
 
         if len(group_by) > 0:
-            self.df = df.groupby(group_by).agg(function).reset_index()
+            self.df = df.groupby(group_by, observed=True).agg(function).reset_index()
         else:
             self.df = df.agg(function).to_frame().T
 
@@ -248,16 +452,14 @@ class DataTransformationManager(DataTableManager):
 
         df = self._get_data_table(origin_vo, granularity, start, end, vars)
 
+        query_conditions = []
         for condition in conditions:
             if self.is_jinja_expression(condition):
-                condition, gv_type_map = self.change_global_variables(condition, vars)
-                condition = self.remove_jinja_braces(condition, gv_type_map)
-                condition = self.change_expression_data_type(condition, gv_type_map)
-                condition = self.change_space_variable(condition)
+                condition = self.bind_global_variables(condition, vars)
 
-            df = self.apply_query(df, condition)
+            query_conditions.append(condition)
 
-        self.df = df
+        self.df = self.apply_conditions(df, query_conditions)
 
     def evaluate_data_table(
         self,
@@ -273,7 +475,7 @@ class DataTransformationManager(DataTableManager):
         self.label_keys = list(origin_vo.labels_info.keys())
 
         df = self._get_data_table(origin_vo, granularity, start, end, vars)
-        if df is None or df.empty:
+        if df is None or (df.empty and self.load_mode != "SCHEMA"):
             new_keys = [
                 expression.get("name")
                 for expression in expressions
@@ -285,151 +487,39 @@ class DataTransformationManager(DataTableManager):
             self.df = pd.DataFrame(columns=self.label_keys + self.data_keys)
             return
 
-        for expression in expressions:
-            if isinstance(expression, dict):
-                name = expression.get("name")
-                field_type = expression.get("field_type", "DATA")
-                condition = expression.get("condition")
-                value_expression = expression.get("expression")
-
-                if name is None:
-                    raise ERROR_REQUIRED_PARAMETER(key="options.EVAL.expressions.name")
-
-                if name in self.data_keys:
-                    raise ERROR_DUPLICATED_FIELD_NAME(field=name, fields=self.data_keys)
-
-                if value_expression is None:
-                    raise ERROR_REQUIRED_PARAMETER(
-                        key="options.EVAL.expressions.expression"
-                    )
-
-                if self.is_jinja_expression(condition):
-                    condition, gv_type_map = self.change_global_variables(
-                        condition, vars
-                    )
-                    condition = self.remove_jinja_braces(condition, gv_type_map)
-                    condition = self.change_expression_data_type(condition, gv_type_map)
-                    condition = self.change_space_variable(condition)
-
-                if self.is_jinja_expression(value_expression):
-                    value_expression, gv_type_map = self.change_global_variables(
-                        value_expression, vars
-                    )
-                    value_expression = self.remove_jinja_braces(
-                        value_expression, gv_type_map
-                    )
-                    value_expression = self.change_expression_data_type(
-                        value_expression, gv_type_map
-                    )
-                    value_expression = self.change_space_variable(value_expression)
-
-                template_vars = {}
-                for key in self.data_keys:
-                    template_vars[key] = f"`{key}`"
-
-                for key in self.label_keys:
-                    template_vars[key] = f"`{key}`"
+        compiled_expressions = self._get_compiled_expressions(expressions)
 
-                if field_type not in ["DATA", "LABEL"]:
-                    raise ERROR_INVALID_PARAMETER(
-                        key="options.EVAL.expressions.field_type",
-                        reason=f"Invalid field type: {field_type}",
-                    )
+        batch = []
+        for eval_step in compiled_expressions["steps"]:
+            value_expression = eval_step["expression"]
+            condition = eval_step.get("condition")
 
-                if isinstance(value_expression, str):
-                    try:
-                        value_expression = value_expression.format(**template_vars)
-                    except KeyError as e:
-                        value_expression = value_expression.replace("{", "{{").replace(
-                            "}", "}}"
-                        )
-                        value_expression = value_expression.format(**template_vars)
-                    except Exception as e:
-                        raise ERROR_INVALID_PARAMETER(
-                            key="options.EVAL.expressions.expression",
-                            reason=f"Invalid expression: (template_var={e})",
-                        )
-
-                    if "@" in value_expression:
-                        raise ERROR_INVALID_PARAMETER(
-                            key="options.EVAL.expressions",
-                            reason="It should not have '@' symbol.",
-                        )
+            if eval_step.get("is_jinja_condition"):
+                condition = self.bind_global_variables(condition, vars)
 
-                try:
-                    merged_expr = f"`{name}` = {value_expression}"
-
-                    if field_type == "LABEL":
-                        self.label_keys = list(set(self.label_keys) | {name})
-                    else:
-                        self.data_keys = list(set(self.data_keys) | {name})
-
-                    if name in df.columns:
-                        last_key = name
-                    else:
-                        last_key = df.eval(merged_expr).columns[-1:][0]
-
-                    if not df.empty:
-                        if condition:
-                            matched_index = self.apply_query(df, condition).index
-                            if " " in name and name in df.columns:
-                                temp_key = name.replace(" ", "_")
-                                df.rename(columns={name: temp_key}, inplace=True)
-                                merged_expr = f"`{temp_key}` = {value_expression}"
-                                df.loc[matched_index, temp_key] = df.eval(
-                                    merged_expr
-                                ).loc[matched_index, temp_key]
-                                df.rename(columns={temp_key: name}, inplace=True)
-                            else:
-                                df.loc[matched_index, last_key] = df.eval(
-                                    merged_expr
-                                ).loc[matched_index, last_key]
-
-                        else:
-                            df.eval(merged_expr, inplace=True)
-
-                    if last_key.startswith("BACKTICK_QUOTED_STRING"):
-                        df.rename(columns={last_key: name}, inplace=True)
-
-                    df.replace([np.inf, -np.inf], 0, inplace=True)
-
-                except Exception as e:
-                    _LOGGER.error(f"[evaluate_data_table] eval error: {e}")
-                    raise ERROR_INVALID_PARAMETER(
-                        key="options.EVAL.expressions", reason=expression
-                    )
-
-            elif isinstance(expression, str):
-                if "@" in expression:
-                    raise ERROR_INVALID_PARAMETER(
-                        key="options.EVAL.expressions",
-                        reason="It should not have '@' symbol.",
-                    )
-
-                try:
-                    name, value_expression = expression.split("=", 1)
-                    name = name.replace("`", "").strip()
-                    value_expression = value_expression.strip()
-                    expression = f"`{name}` = {value_expression}"
-
-                    self.data_keys = list(set(self.data_keys) | {name})
+            if eval_step.get("is_jinja_expression"):
+                value_expression = self.bind_global_variables(value_expression, vars)
+                value_expression = self._format_eval_expression(
+                    value_expression, eval_step["template_keys"]
+                )
 
-                    df.eval(expression, inplace=True)
-                    last_key = df.columns[-1:][0]
-                    if last_key.startswith("BACKTICK_QUOTED_STRING"):
-                        df.rename(columns={last_key: name}, inplace=True)
-                    df.replace([np.inf, -np.inf], 0, inplace=True)
+            if not self._can_batch_eval_step(
+                df, batch, eval_step, value_expression, condition
+            ):
+                self._run_eval_batch(df, batch)
+                batch = []
 
-                except Exception as e:
-                    _LOGGER.error(f"[evaluate_data_table] eval error: {e}")
-                    raise ERROR_INVALID_PARAMETER(
-                        key="options.EVAL.expressions", reason=expression
-                    )
+            if self._can_batch_eval_step(
+                df, batch, eval_step, value_expression, condition
+            ):
+                batch.append((eval_step, value_expression))
             else:
-                raise ERROR_INVALID_PARAMETER_TYPE(
-                    key="options.EVAL.expressions", type=type(expression)
-                )
+                self._run_eval_step(df, eval_step, value_expression, condition)
 
+        self._run_eval_batch(df, batch)
+
+        self.data_keys = compiled_expressions["data_keys"]
+        self.label_keys = compiled_expressions["label_keys"]
         self.df = df
 
     def pivot_data_table(
@@ -456,13 +546,11 @@ class DataTransformationManager(DataTableManager):
             self._check_columns(raw_df, labels, column, data)
             fill_value = self._set_fill_value_from_df(raw_df, data)
 
-            pivot_table = self._create_pivot_table(
-                raw_df, labels, column, data, function, fill_value
+            cell_values = self._aggregate_pivot_cells(
+                raw_df, labels, column, data, function
             )
 
-            pivot_table = self._sort_and_filter_pivot_table(pivot_table)
-
-            self.df = pivot_table
+            self.df = self._create_pivot_table(cell_values, labels, column, fill_value)
 
     def add_labels_data_table(
         self,
@@ -510,12 +598,16 @@ class DataTransformationManager(DataTableManager):
 
         field_type = self.options.get("field_type", "LABEL")
 
-        filtered_df = self.filter_data(df, vars)
-        filtered_df = self.apply_cases(filtered_df)
+        if name in df.columns:
+            df = self.decode_labels(df, [name])
 
-        df.loc[filtered_df.index, name] = filtered_df[name]
+        filtered_df = self.filter_data(df, vars)
+        df.loc[filtered_df.index, name] = self.apply_cases(filtered_df)
         self.handle_unfiltered_data(df, filtered_df, name, field_type)
 
+        if self.categorical_labels and field_type == "LABEL":
+            df = self.encode_labels(df, [name])
+
         self.df = df
 
     def sort_data_table(
@@ -553,6 +645,9 @@ class DataTransformationManager(DataTableManager):
         end: str,
         vars: dict,
     ) -> pd.DataFrame:
+        if data_table_vo.data_table_id in self.data_frames:
+            return self.data_frames[data_table_vo.data_table_id]
+
         if data_table_vo.data_type == "ADDED":
             ds_mgr = DataSourceManager(
                 self.data_table_type,
@@ -561,6 +656,7 @@ class DataTransformationManager(DataTableManager):
                 data_table_vo.widget_id,
                 data_table_vo.domain_id,
             )
+            ds_mgr.load_mode = self.load_mode
             return ds_mgr.load(granularity, start, end, vars)
         else:
             operator = data_table_vo.operator
@@ -572,6 +668,7 @@ class DataTransformationManager(DataTableManager):
                 data_table_vo.widget_id,
                 data_table_vo.domain_id,
             )
+            ds_mgr.load_mode = self.load_mode
 
             return ds_mgr.load(granularity, start, end, vars)
 
@@ -589,10 +686,10 @@ class DataTransformationManager(DataTableManager):
 
         if operator in ["JOIN", "CONCAT"]:
             if data_tables := options.get("data_tables"):
-                if len(data_tables) != 2:
+                if len(data_tables) < 2:
                     raise ERROR_INVALID_PARAMETER(
                         key="options.data_tables",
-                        reason="It should have 2 data tables.",
+                        reason="It should have at least 2 data tables.",
                     )
 
                 for data_table_id in data_tables:
@@ -641,18 +738,256 @@ class DataTransformationManager(DataTableManager):
         return parent_dt_vos
 
     def _set_data_keys(
-        self,
-        origin_vo: Union[PublicDataTable, PrivateDataTable],
-        other_vo: Union[PublicDataTable, PrivateDataTable],
+        self, data_table_vos: List[Union[PublicDataTable, PrivateDataTable]]
     ) -> None:
-        origin_data_keys = set(origin_vo.data_info.keys())
-        other_data_keys = set(other_vo.data_info.keys())
+        data_keys = set()
+        duplicate_keys = set()
+        for data_table_vo in data_table_vos:
+            keys = set(data_table_vo.data_info.keys())
+            duplicate_keys |= data_keys & keys
+            data_keys |= keys
 
-        duplicate_keys = list(origin_data_keys & other_data_keys)
         if duplicate_keys:
             raise ERROR_DUPLICATED_DATA_FIELDS(field=", ".join(duplicate_keys))
 
-        self.data_keys = list(origin_data_keys | other_data_keys)
+        self.data_keys = list(data_keys)
+
+    def _get_compiled_expressions(self, expressions: list) -> dict:
+        compiled_key = self._make_compiled_expressions_key(expressions)
+
+        if cache.is_set():
+            if compiled_expressions := cache.get(compiled_key):
+                return compiled_expressions
+
+        compiled_expressions = self._compile_expressions(expressions)
+
+        if cache.is_set():
+            cache.set(compiled_key, compiled_expressions, expire=86400)
+
+        return compiled_expressions
+
+    def _make_compiled_expressions_key(self, expressions: list) -> str:
+        expressions_hash = utils.dict_to_hash(
+            {
+                "expressions": expressions,
+                "data_keys": self.data_keys,
+                "label_keys": self.label_keys,
+            }
+        )
+        return f"dashboard:data-table:eval:{self.domain_id}:{expressions_hash}"
+
+    def _compile_expressions(self, expressions: list) -> dict:
+        data_keys = list(self.data_keys)
+        label_keys = list(self.label_keys)
+        eval_steps = []
+
+        for expression in expressions:
+            if isinstance(expression, dict):
+                name = expression.get("name")
+                field_type = expression.get("field_type", "DATA")
+                condition = expression.get("condition")
+                value_expression = expression.get("expression")
+
+                if name is None:
+                    raise ERROR_REQUIRED_PARAMETER(key="options.EVAL.expressions.name")
+
+                if name in data_keys:
+                    raise ERROR_DUPLICATED_FIELD_NAME(field=name, fields=data_keys)
+
+                if value_expression is None:
+                    raise ERROR_REQUIRED_PARAMETER(
+                        key="options.EVAL.expressions.expression"
+                    )
+
+                if field_type not in ["DATA", "LABEL"]:
+                    raise ERROR_INVALID_PARAMETER(
+                        key="options.EVAL.expressions.field_type",
+                        reason=f"Invalid field type: {field_type}",
+                    )
+
+                eval_step = {
+                    "name": name,
+                    "condition": condition,
+                    "is_jinja_condition": self.is_jinja_expression(condition),
+                    "reason": expression,
+                }
+
+                if self.is_jinja_expression(value_expression):
+                    eval_step["expression"] = value_expression
+                    eval_step["is_jinja_expression"] = True
+                    eval_step["template_keys"] = data_keys + label_keys
+                else:
+                    eval_step["expression"] = self._format_eval_expression(
+                        value_expression, data_keys + label_keys
+                    )
+
+                if field_type == "LABEL":
+                    label_keys = list(set(label_keys) | {name})
+                else:
+                    data_keys = list(set(data_keys) | {name})
+
+            elif isinstance(expression, str):
+                if "@" in expression:
+                    raise ERROR_INVALID_PARAMETER(
+                        key="options.EVAL.expressions",
+                        reason="It should not have '@' symbol.",
+                    )
+
+                try:
+                    name, value_expression = expression.split("=", 1)
+                except Exception as e:
+                    _LOGGER.error(f"[evaluate_data_table] eval error: {e}")
+                    raise ERROR_INVALID_PARAMETER(
+                        key="options.EVAL.expressions", reason=expression
+                    )
+
+                name = name.replace("`", "").strip()
+                value_expression = value_expression.strip()
+
+                eval_step = {
+                    "name": name,
+                    "expression": value_expression,
+                    "reason": f"`{name}` = {value_expression}",
+                }
+
+                data_keys = list(set(data_keys) | {name})
+
+            else:
+                raise ERROR_INVALID_PARAMETER_TYPE(
+                    key="options.EVAL.expressions", type=type(expression)
+                )
+
+            eval_steps.append(eval_step)
+
+        return {"steps": eval_steps, "data_keys": data_keys, "label_keys": label_keys}
+
+    @staticmethod
+    def _format_eval_expression(
+        value_expression: Union[str, float, list], template_keys: list
+    ) -> Union[str, float, list]:
+        if not isinstance(value_expression, str):
+            return value_expression
+
+        template_vars = {key: f"`{key}`" for key in template_keys}
+
+        try:
+            value_expression = value_expression.format(**template_vars)
+        except KeyError as e:
+            value_expression = value_expression.replace("{", "{{").replace("}", "}}")
+            value_expression = value_expression.format(**template_vars)
+        except Exception as e:
+            raise ERROR_INVALID_PARAMETER(
+                key="options.EVAL.expressions.expression",
+                reason=f"Invalid expression: (template_var={e})",
+            )
+
+        if "@" in value_expression:
+            raise ERROR_INVALID_PARAMETER(
+                key="options.EVAL.expressions",
+                reason="It should not have '@' symbol.",
+            )
+
+        return value_expression
+
+    @staticmethod
+    def _can_batch_eval_step(
+        df: pd.DataFrame,
+        batch: list,
+        eval_step: dict,
+        value_expression: Union[str, float, list],
+        condition: Union[str, None],
+    ) -> bool:
+        name = eval_step["name"]
+        value_expression = str(value_expression)
+
+        if condition or name in df.columns or "\n" in value_expression:
+            return False
+
+        # A multi-line eval does not skip NaN in calls such as `cost.sum()`,
+        # so only per-row expressions are batched
+        if not DataTablePlanManager.is_row_local_expression(value_expression):
+            return False
+
+        # Steps in a batch are evaluated before their inf values are replaced,
+        # so a step must not read a column produced earlier in the same batch.
+        for batch_step, _ in batch:
+            if batch_step["name"] == name or batch_step["name"] in value_expression:
+                return False
+
+        return True
+
+    def _run_eval_batch(self, df: pd.DataFrame, batch: list) -> None:
+        if len(batch) < 2:
+            for eval_step, value_expression in batch:
+                self._run_eval_step(df, eval_step, value_expression)
+            return
+
+        merged_expr = "\n".join(
+            f"`{eval_step['name']}` = {value_expression}"
+            for eval_step, value_expression in batch
+        )
+
+        try:
+            eval_df = df.copy(deep=False)
+            eval_df.eval(merged_expr, inplace=True)
+            new_columns = [column for column in eval_df.columns if column not in df]
+        except Exception:
+            new_columns = []
+
+        if len(new_columns) != len(batch):
+            for eval_step, value_expression in batch:
+                self._run_eval_step(df, eval_step, value_expression)
+            return
+
+        for (eval_step, _), column in zip(batch, new_columns):
+            df[eval_step["name"]] = eval_df[column].replace([np.inf, -np.inf], 0)
+
+    def _run_eval_step(
+        self,
+        df: pd.DataFrame,
+        eval_step: dict,
+        value_expression: Union[str, float, list],
+        condition: str = None,
+    ) -> None:
+        name = eval_step["name"]
+        columns = list(df.columns)
+
+        try:
+            merged_expr = f"`{name}` = {value_expression}"
+
+            if condition:
+                matched_index = self.apply_query(df, condition).index
+                if " " in name and name in df.columns:
+                    temp_key = name.replace(" ", "_")
+                    df.rename(columns={name: temp_key}, inplace=True)
+                    merged_expr = f"`{temp_key}` = {value_expression}"
+                    df.loc[matched_index, temp_key] = df.eval(merged_expr).loc[
+                        matched_index, temp_key
+                    ]
+                    df.rename(columns={temp_key: name}, inplace=True)
+                else:
+                    eval_df = df.eval(merged_expr)
+                    last_key = name if name in df.columns else eval_df.columns[-1]
+                    df.loc[matched_index, last_key] = eval_df.loc[
+                        matched_index, last_key
+                    ]
+            else:
+                df.eval(merged_expr, inplace=True)
+
+            if name not in columns and name not in df.columns:
+                last_key = df.columns[-1]
+                if last_key.startswith("BACKTICK_QUOTED_STRING"):
+                    df.rename(columns={last_key: name}, inplace=True)
+
+            for column in df.columns:
+                if column == name or column not in columns:
+                    df[column] = df[column].replace([np.inf, -np.inf], 0)
+
+        except Exception as e:
+            _LOGGER.error(f"[evaluate_data_table] eval error: {e}")
+            raise ERROR_INVALID_PARAMETER(
+                key="options.EVAL.expressions", reason=eval_step["reason"]
+            )
 
     @staticmethod
     def _validate_options(how: str, left_keys: list, right_keys: list) -> None:
@@ -709,8 +1044,8 @@ class DataTransformationManager(DataTableManager):
 
     def _merge_data_frames(
         self,
-        origin_df: pd.DataFrame,
-        other_df: pd.DataFrame,
+        data_frames: List[pd.DataFrame],
+        names: list,
         how: str,
         left_keys: list,
         right_keys: list,
@@ -719,42 +1054,171 @@ class DataTransformationManager(DataTableManager):
             left_keys, right_keys, how
         )
         if how in ["left", "inner", "outer"]:
-            other_df = other_df.rename(columns=rename_columns)
+            join_keys = left_keys
+            data_frames = [data_frames[0]] + [
+                df.rename(columns=rename_columns) for df in data_frames[1:]
+            ]
+        else:
+            join_keys = right_keys
+            data_frames = [data_frames[0].rename(columns=rename_columns)] + list(
+                data_frames[1:]
+            )
+
+        if self.load_mode != "SCHEMA":
+            data_frames = [
+                pd.DataFrame(columns=join_keys) if df.empty else df
+                for df in data_frames
+            ]
+        data_frames = self._rename_duplicated_columns(data_frames, names, join_keys)
+        gap_columns = self._get_join_gap_columns(data_frames, how, join_keys)
+        columns = []
+        for df in data_frames:
+            columns += [column for column in df.columns if column not in columns]
+
+        # Outer joins return the keys in sorted order, so only they need sorted codes
+        key_codes, key_categories = self._encode_join_keys(
+            data_frames, join_keys, sort=how == "outer"
+        )
+
+        # Index every input by its encoded keys once, then fold the merges over them
+        merged_df = None
+        for df, codes in zip(data_frames, key_codes):
+            indexed_df = df.drop(columns=join_keys).set_axis(codes, axis=0)
+            if merged_df is None:
+                merged_df = indexed_df
+            else:
+                merged_df = merged_df.merge(
+                    indexed_df, left_index=True, right_index=True, how=how
+                )
+
+        key_columns = self._decode_join_keys(merged_df.index, key_categories)
+        merged_df = merged_df.reset_index(drop=True).assign(**key_columns)[columns]
+
+        fill_na = {
+            key: 0 if key in self.data_keys else ""
+            for key in columns
+            if key in gap_columns or merged_df[key].hasnans
+        }
+        merged_df = self.fill_na_values(merged_df, fill_na)
+
+        self.join_info = {
+            "how": how,
+            "keys": join_keys,
+            "key_cardinality": {
+                key: len(categories) for key, categories in key_categories.items()
+            },
+            "input_rows": [len(df) for df in data_frames],
+        }
+
+        return merged_df
+
+    @staticmethod
+    def _get_join_gap_columns(
+        data_frames: List[pd.DataFrame], how: str, join_keys: list
+    ) -> set:
+        # Only the columns of an input that may have no matching row can get new gaps
+        if how == "left":
+            unmatched_dfs = data_frames[1:]
         elif how == "right":
-            origin_df = origin_df.rename(columns=rename_columns)
+            unmatched_dfs = data_frames[:-1]
+        elif how == "outer":
+            unmatched_dfs = data_frames
+        else:
+            unmatched_dfs = []
+
+        gap_columns = set()
+        for df in unmatched_dfs:
+            gap_columns.update(column for column in df.columns if column not in join_keys)
+
+        return gap_columns
+
+    def _encode_join_keys(
+        self, data_frames: List[pd.DataFrame], join_keys: list, sort: bool = False
+    ) -> Tuple[List[pd.Index], dict]:
+        self.align_categories(data_frames, join_keys)
+
+        key_codes = {}
+        key_categories = {}
+        for key in join_keys:
+            values = pd.concat([df[key] for df in data_frames], ignore_index=True)
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                codes = values.cat.codes.to_numpy(dtype="int64")
+                categories = values.cat.categories
+                if (codes == -1).any():
+                    # Missing keys take the first code, as they sort first in categoricals
+                    codes = codes + 1
+                    categories = categories.insert(0, np.nan)
+
+                key_codes[key] = codes
+                key_categories[key] = pd.CategoricalIndex(
+                    categories, dtype=values.dtype
+                )
+            else:
+                # Factorize the key over all inputs at once, so every side shares the codes
+                key_codes[key], key_categories[key] = pd.factorize(
+                    values, sort=sort, use_na_sentinel=False
+                )
 
-        if origin_df.empty:
-            origin_df = pd.DataFrame(columns=left_keys)
+        cardinality = 1
+        for categories in key_categories.values():
+            cardinality *= max(len(categories), 1)
 
-        if other_df.empty:
-            other_df = pd.DataFrame(columns=right_keys)
+        if cardinality >= 2**62:
+            # Too many key combinations for a single integer, use one level per key
+            return [
+                pd.MultiIndex.from_frame(df[join_keys]) for df in data_frames
+            ], key_categories
 
-        join_keys = left_keys if how in ["left", "inner", "outer"] else right_keys
-        merged_df = origin_df.merge(
-            other_df, left_on=join_keys, right_on=join_keys, how=how
-        )
+        codes = np.zeros(sum(len(df) for df in data_frames), dtype="int64")
+        for key in join_keys:
+            codes = codes * max(len(key_categories[key]), 1) + key_codes[key]
 
-        label_keys = list(set(merged_df.columns) - set(self.data_keys))
-        fill_na = {key: 0 for key in self.data_keys}
-        fill_na.update({key: "" for key in label_keys})
-        merged_df = merged_df.fillna(value=fill_na)
+        row_codes = []
+        offset = 0
+        for df in data_frames:
+            row_codes.append(pd.Index(codes[offset : offset + len(df)]))
+            offset += len(df)
 
-        return merged_df
+        return row_codes, key_categories
 
     @staticmethod
-    def _rename_duplicated_columns(
-        merged_df: pd.DataFrame, origin_vo_name: str, other_vo_name: str
-    ) -> pd.DataFrame:
-        merged_rename_columns = {}
-        for column in merged_df.columns:
-            if column.endswith("_x"):
-                column_name, _ = column.split("_")
-                merged_rename_columns[column] = f"{column_name}({origin_vo_name})"
-            elif column.endswith("_y"):
-                column_name, _ = column.split("_")
-                merged_rename_columns[column] = f"{column_name}({other_vo_name})"
+    def _decode_join_keys(index: pd.Index, key_categories: dict) -> dict:
+        if isinstance(index, pd.MultiIndex):
+            return {key: index.get_level_values(key) for key in key_categories}
+
+        key_columns = {}
+        codes = index.to_numpy()
+        for key, categories in reversed(list(key_categories.items())):
+            codes, key_codes = np.divmod(codes, max(len(categories), 1))
+            if isinstance(categories, pd.CategoricalIndex):
+                key_columns[key] = pd.Categorical.from_codes(
+                    key_codes - int(categories.hasnans), dtype=categories.dtype
+                )
+            else:
+                key_columns[key] = categories.take(key_codes)
 
-        return merged_df.rename(columns=merged_rename_columns)
+        return {key: key_columns[key] for key in key_categories}
+
+    @staticmethod
+    def _rename_duplicated_columns(
+        data_frames: List[pd.DataFrame], names: list, join_keys: list
+    ) -> List[pd.DataFrame]:
+        column_counts = {}
+        for df in data_frames:
+            for column in df.columns:
+                if column not in join_keys:
+                    column_counts[column] = column_counts.get(column, 0) + 1
+
+        renamed_dfs = []
+        for df, name in zip(data_frames, names):
+            rename_columns = {
+                column: f"{column}({name})"
+                for column in df.columns
+                if column_counts.get(column, 0) > 1
+            }
+            renamed_dfs.append(df.rename(columns=rename_columns))
+
+        return renamed_dfs
 
     @staticmethod
     def _check_columns(
@@ -787,30 +1251,6 @@ class DataTransformationManager(DataTableManager):
             return ""
         return 0
 
-    @staticmethod
-    def _set_new_column_names(pivot_table: pd.DataFrame) -> pd.DataFrame:
-        if pivot_table.columns[0] == "index":
-            pivot_table = pivot_table.iloc[:, 1:]
-        else:
-            new_columns = [
-                lower_col if lower_col else upper_col
-                for upper_col, lower_col in pivot_table.columns
-            ]
-            pivot_table.columns = new_columns
-        return pivot_table
-
-    def _set_keys(self, columns: list) -> None:
-        if columns[0] == "index":
-            self.label_keys = []
-            self.data_keys = [col for col in columns if col != "index"]
-        else:
-            self.label_keys = [
-                upper_col for upper_col, lower_col in columns if not lower_col
-            ]
-            self.data_keys = [
-                lower_col for upper_col, lower_col in columns if lower_col
-            ]
-
     @staticmethod
     def _validate_select_fields(
         select_fields: list,
@@ -831,59 +1271,69 @@ class DataTransformationManager(DataTableManager):
                 reason=f"Invalid function type: {function}",
             )
 
-    def _create_pivot_table(
+    def _aggregate_pivot_cells(
         self,
         raw_df: pd.DataFrame,
         labels: list,
         column: str,
         data: str,
         function: str,
-        fill_value: Union[int, str],
-    ) -> pd.DataFrame:
+    ) -> pd.Series:
         try:
             self._validate_function(function)
-            pivot_table = pd.pivot_table(
-                raw_df,
-                values=[data],
-                index=labels,
-                columns=[column],
-                aggfunc=function,
-                fill_value=fill_value,
+            return (
+                raw_df.groupby((labels or []) + [column], observed=True)[data]
+                .agg(function)
+                .dropna()
             )
-            pivot_table.reset_index(inplace=True)
-            self._set_keys(list(pivot_table.columns))
-            return self._set_new_column_names(pivot_table)
         except Exception as e:
             _LOGGER.error(f"[pivot_data_table] pivot error: {e}")
             raise ERROR_INVALID_PARAMETER(key="options.PIVOT", reason=str(e))
 
-    def _sort_and_filter_pivot_table(self, pivot_table: pd.DataFrame) -> pd.DataFrame:
-        column_fields = list(set(pivot_table.columns) - set(self.label_keys))
-        if not self.total_series:
-            self.total_series = pivot_table[column_fields].sum(axis=1)
+    def _create_pivot_table(
+        self,
+        cell_values: pd.Series,
+        labels: list,
+        column: str,
+        fill_value: Union[int, str],
+    ) -> pd.DataFrame:
+        self.label_keys = list(labels or [])
 
-        pivot_table = self._apply_row_sorting(pivot_table)
+        row_totals, column_totals = self._get_pivot_totals(
+            cell_values, bool(self.label_keys)
+        )
+        column_fields = self._get_pivot_column_fields(column_totals)
 
-        if select_fields := self.options.get("select"):
-            self._validate_select_fields(select_fields, column_fields)
-            pivot_table = pivot_table[self.label_keys + select_fields]
-            column_fields = select_fields
+        selected_values = cell_values[
+            cell_values.index.get_level_values(column).isin(column_fields)
+        ]
 
-        if order_by := self.options.get("order_by"):
-            self._validate_order_by_type(order_by)
-            pivot_table = self._apply_order_by(pivot_table, order_by, column_fields)
+        if self.label_keys:
+            pivot_table = (
+                selected_values.unstack(column, fill_value=fill_value)
+                .reindex(
+                    index=row_totals.index,
+                    columns=column_fields,
+                    fill_value=fill_value,
+                )
+                .reset_index()
+            )
+        else:
+            pivot_table = (
+                selected_values.reindex(column_fields, fill_value=fill_value)
+                .to_frame()
+                .T.reset_index(drop=True)
+            )
 
-        if limit := self.options.get("limit"):
-            if isinstance(limit, float):
-                limit = int(limit)
-            limited_columns = pivot_table.iloc[
-                :, len(self.label_keys) : len(self.label_keys) + limit
-            ]
-            pivot_table = pivot_table.iloc[:, : len(self.label_keys) + limit]
+        pivot_table.columns = self.label_keys + list(column_fields)
+        self.total_series = row_totals.reset_index(drop=True)
+
+        pivot_table = self._apply_row_sorting(pivot_table)
 
+        if self.options.get("limit"):
             pivot_table["Others"] = self.total_series.loc[
                 pivot_table.index
-            ] - limited_columns.sum(axis=1)
+            ] - pivot_table[column_fields].sum(axis=1)
 
         pivot_table["Sub Total"] = self.total_series.loc[pivot_table.index]
         self.data_keys = [
@@ -892,6 +1342,51 @@ class DataTransformationManager(DataTableManager):
 
         return pivot_table
 
+    @staticmethod
+    def _get_pivot_totals(
+        cell_values: pd.Series, has_labels: bool
+    ) -> Tuple[pd.Series, pd.Series]:
+        if cell_values.empty:
+            raise ERROR_INVALID_PARAMETER(
+                key="options.PIVOT", reason="No data to pivot."
+            )
+
+        if not has_labels:
+            return pd.Series([cell_values.sum()]), cell_values
+
+        # Cells are sorted by labels, so totals are computed from the index codes
+        # instead of hashing the label values again.
+        index = cell_values.index
+        column_totals = cell_values.groupby(index.codes[-1]).sum()
+        column_totals.index = index.levels[-1][column_totals.index]
+
+        label_codes = np.vstack(index.codes[:-1])
+        row_starts = np.flatnonzero(
+            np.r_[True, (label_codes[:, 1:] != label_codes[:, :-1]).any(axis=0)]
+        )
+        row_totals = pd.Series(
+            np.add.reduceat(cell_values.to_numpy(), row_starts),
+            index=index[row_starts].droplevel(-1),
+        )
+
+        return row_totals, column_totals
+
+    def _get_pivot_column_fields(self, column_totals: pd.Series) -> list:
+        column_fields = column_totals.index.tolist()
+
+        if select_fields := self.options.get("select"):
+            self._validate_select_fields(select_fields, column_fields)
+            column_fields = select_fields
+
+        if order_by := self.options.get("order_by"):
+            self._validate_order_by_type(order_by)
+            column_fields = self._apply_order_by(column_fields, column_totals, order_by)
+
+        if limit := self.options.get("limit"):
+            column_fields = column_fields[: int(limit)]
+
+        return column_fields
+
     @staticmethod
     def validate_labels(labels: dict, df: pd.DataFrame) -> None:
         if not labels:
@@ -934,62 +1429,58 @@ class DataTransformationManager(DataTableManager):
     def filter_data(self, df: pd.DataFrame, vars: dict) -> pd.DataFrame:
         condition = self.options.get("condition")
         if not condition:
-            return df.copy()
+            return df
 
         if self.is_jinja_expression(condition):
-            condition, gv_type_map = self.change_global_variables(condition, vars)
-            condition = self.remove_jinja_braces(condition, gv_type_map)
-            condition = self.change_expression_data_type(condition, gv_type_map)
-            condition = self.change_space_variable(condition)
+            condition = self.bind_global_variables(condition, vars)
 
         return self.apply_query(df, condition)
 
-    def apply_cases(self, filtered_df: pd.DataFrame) -> pd.DataFrame:
+    def apply_cases(self, filtered_df: pd.DataFrame) -> pd.Series:
         name = self.options["name"]
         key = self.options["key"]
         else_value = self.options.get("else")
         cases = self.options.get("cases", [])
 
-        if key not in filtered_df.columns:
-            if name not in filtered_df.columns:
-                filtered_df[name] = pd.NA
-            return filtered_df
-
-        if name not in filtered_df.columns:
-            filtered_df[name] = pd.NA
-
-        if not filtered_df.empty:
-            temp_key_column = f"_{key}_backup"
-            if temp_key_column not in filtered_df.columns:
-                filtered_df[temp_key_column] = filtered_df[key]
-
-            for case in cases:
-                self._validate_case(case)
-                operator = case["operator"]
-                value = case["value"]
-                match = case["match"].strip()
+        if name in filtered_df.columns:
+            values = filtered_df[name].astype(object)
+        else:
+            values = pd.Series(pd.NA, index=filtered_df.index, dtype=object)
 
-                if operator == "eq":
-                    condition = (filtered_df[key] == match) & (filtered_df[name].isna())
-                    filtered_df.loc[condition, name] = value
+        if key not in filtered_df.columns or filtered_df.empty:
+            return values
 
-                elif operator == "regex":
-                    condition = (filtered_df[key].str.contains(match, na=False)) & (
-                        filtered_df[name].isna()
-                    )
-                    filtered_df.loc[condition, name] = value
+        key_values = filtered_df[key]
+        value_map = self._make_value_map(key_values, cases)
+        values = values.where(values.notna(), key_values.map(value_map).astype(object))
 
-            if else_value is not None:
-                filtered_df.loc[filtered_df[name].isna(), name] = else_value
+        if else_value is not None:
+            return values.where(values.notna(), else_value)
+        else:
+            return values.where(values.notna(), key_values.astype(object))
+
+    def _make_value_map(self, key_values: pd.Series, cases: list) -> dict:
+        # Cases are resolved once per distinct key instead of once per row,
+        # keeping the first matching case for each key.
+        unique_keys = pd.Series(key_values.dropna().unique())
+        mapped_values = pd.Series(pd.NA, index=unique_keys.index, dtype=object)
+
+        for case in cases:
+            self._validate_case(case)
+            operator = case["operator"]
+            match = case["match"].strip()
+
+            if operator == "eq":
+                condition = unique_keys == match
+            elif operator == "regex":
+                condition = unique_keys.str.contains(match, na=False)
             else:
-                if name in filtered_df.columns:
-                    filtered_df.loc[filtered_df[name].isna(), name] = filtered_df[
-                        temp_key_column
-                    ]
+                continue
 
-            filtered_df.drop(columns=[temp_key_column], inplace=True)
+            mapped_values[condition & mapped_values.isna()] = case["value"]
 
-        return filtered_df
+        matched = mapped_values.notna()
+        return dict(zip(unique_keys[matched], mapped_values[matched]))
 
     def handle_unfiltered_data(
         self,
@@ -1025,27 +1516,19 @@ class DataTransformationManager(DataTableManager):
                 reason=f"Invalid order_by type: {order_by_type}",
             )
 
+    @staticmethod
     def _apply_order_by(
-        self,
-        pivot_table: pd.DataFrame,
-        order_by: dict,
         column_fields: list,
-    ) -> pd.DataFrame:
+        column_totals: pd.Series,
+        order_by: dict,
+    ) -> list:
         order_by_type = order_by.get("type", "key")
         desc = order_by.get("desc", False)
         if order_by_type == "key":
-            pivot_table = pivot_table[
-                self.label_keys + sorted(column_fields, reverse=desc)
-            ]
+            return sorted(column_fields, reverse=desc)
         else:
-            column_sums = pivot_table.drop(columns=self.label_keys).sum()
-            if desc:
-                ascending = False
-            else:
-                ascending = True
-            sorted_columns = column_sums.sort_values(ascending=ascending).index.tolist()
-            pivot_table = pivot_table[self.label_keys + sorted_columns]
-        return pivot_table
+            column_sums = column_totals.loc[column_fields]
+            return column_sums.sort_values(ascending=not desc).index.tolist()
 
     @staticmethod
     def _validate_case(case):
@@ -1056,40 +1539,68 @@ class DataTransformationManager(DataTableManager):
 
     @staticmethod
     def extract_fields_from_condition(condition: str) -> list:
-        return re.findall(r"`([^`]+)`", condition)
+        return BACKTICK_FIELD_PATTERN.findall(condition)
 
-    def convert_datetime_fields(self, df: pd.DataFrame, conditions: list) -> tuple:
-        converted_fields = set()
-
-        for condition in conditions:
-            converted_fields.update(self.extract_fields_from_condition(condition))
+    @staticmethod
+    def _get_datetime_view(
+        df: pd.DataFrame, fields: list, datetime_columns: dict
+    ) -> pd.DataFrame:
+        datetime_df = df.copy(deep=False)
 
-        for field in converted_fields:
+        for field in fields:
             if field in df.columns:
-                df[field] = pd.to_datetime(df[field], errors="coerce")
+                if field not in datetime_columns:
+                    datetime_columns[field] = pd.to_datetime(df[field], errors="coerce")
 
-        return df, converted_fields
+                datetime_df[field] = datetime_columns[field]
 
-    @staticmethod
-    def revert_datetime_to_string(df: pd.DataFrame, fields: set) -> pd.DataFrame:
-        for field in fields:
-            if field in df.columns:
-                df[field] = df[field].astype(str)
-        return df
+        return datetime_df
 
     def apply_query(self, df: pd.DataFrame, condition: str) -> pd.DataFrame:
-        try:
-            fields_in_condition = self.extract_fields_from_condition(condition)
+        return self.apply_conditions(df, [condition])
 
-            if "Date" in fields_in_condition:
-                df, converted_fields = self.convert_datetime_fields(df, [condition])
-                df = df.query(condition).copy()
-                df = self.revert_datetime_to_string(df, converted_fields)
-            else:
-                df = df.query(condition).copy()
+    def apply_conditions(self, df: pd.DataFrame, conditions: list) -> pd.DataFrame:
+        if not conditions:
+            return df
 
-        except Exception as e:
-            _LOGGER.error(f"[apply_query] query error: {e}")
-            raise ERROR_INVALID_PARAMETER(key="query.condition", reason=condition)
+        # Conditions such as `cost > cost.mean()` read the whole column, so each
+        # one filters the rows kept by the previous ones, like separate queries
+        if len(conditions) > 1 and not all(
+            DataTablePlanManager.is_row_local_expression(condition)
+            for condition in conditions
+        ):
+            for condition in conditions:
+                df = self.apply_conditions(df, [condition])
+            return df
 
-        return df
+        mask = pd.Series(True, index=df.index)
+        datetime_columns = {}
+
+        for condition in conditions:
+            try:
+                fields_in_condition = self.extract_fields_from_condition(condition)
+
+                if "Date" in fields_in_condition:
+                    condition_df = self._get_datetime_view(
+                        df, fields_in_condition, datetime_columns
+                    )
+                else:
+                    condition_df = df
+
+                mask &= condition_df.eval(condition)
+
+            except Exception as e:
+                _LOGGER.error(f"[apply_query] query error: {e}")
+                raise ERROR_INVALID_PARAMETER(key="query.condition", reason=condition)
+
+        filtered_df = df if mask.all() else df[mask]
+
+        if datetime_columns:
+            filtered_df = filtered_df.assign(
+                **{
+                    field: datetime_column[mask].astype(str)
+                    for field, datetime_column in datetime_columns.items()
+                }
+            )
+
+        return filtered_df
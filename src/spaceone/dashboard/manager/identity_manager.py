@@ -32,4 +32,8 @@ class IdentityManager(BaseManager):
             query = {"workspace_id": workspace_id}
         else:
             query = {}
-        return self.identity_conn.dispatch("ServiceAccount.list", query)
+        return self.identity_conn.dispatch(
+            "ServiceAccount.list",
+            query,
+            x_domain_id=self.transaction.get_meta("x_domain_id"),
+        )
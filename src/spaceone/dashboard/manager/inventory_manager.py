@@ -1,6 +1,7 @@
 from spaceone.core import config
 from spaceone.core.manager import BaseManager
 from spaceone.core.connector.space_connector import SpaceConnector
+from spaceone.dashboard.manager.single_flight_manager import SingleFlightManager
 
 
 class InventoryManager(BaseManager):
@@ -9,9 +10,15 @@ class InventoryManager(BaseManager):
         self.inventory_conn: SpaceConnector = self.locator.get_connector(
             "SpaceConnector", service="inventory"
         )
+        self.single_flight_mgr = SingleFlightManager()
 
     def analyze_metric_data(self, params: dict) -> dict:
-        return self.inventory_conn.dispatch("MetricData.analyze", params)
+        return self.single_flight_mgr.dispatch(
+            self.inventory_conn,
+            "MetricData.analyze",
+            params,
+            x_domain_id=self.transaction.get_meta("x_domain_id"),
+        )
 
     def list_metrics(self, params: dict) -> dict:
         return self.inventory_conn.dispatch("Metric.list", params)
@@ -0,0 +1,157 @@
+import json
+import logging
+import zlib
+from datetime import datetime, timedelta
+from typing import Union
+
+import pandas as pd
+from mongoengine import QuerySet
+
+from spaceone.core import config
+from spaceone.core.manager import BaseManager
+from spaceone.dashboard.model.materialized_data_table.database import (
+    MaterializedDataTable,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_INTERVAL = 1  # hours
+DEFAULT_MAX_DATA_SIZE = 12 * 1024 * 1024  # bytes
+DEFAULT_TTL = 7 * 24  # hours
+
+
+class MaterializedDataTableManager(BaseManager):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.materialized_model = MaterializedDataTable
+
+    def create_materialized_data_table(self, params: dict) -> MaterializedDataTable:
+        return self.materialized_model.create(params)
+
+    @staticmethod
+    def update_materialized_data_table_by_vo(
+        params: dict, materialized_vo: MaterializedDataTable
+    ) -> MaterializedDataTable:
+        return materialized_vo.update(params)
+
+    def get_materialized_data_table(
+        self,
+        data_table_id: str,
+        query_hash: str,
+        domain_id: str,
+    ) -> Union[MaterializedDataTable, None]:
+        return self.materialized_model.filter(
+            data_table_id=data_table_id, query_hash=query_hash, domain_id=domain_id
+        ).first()
+
+    def filter_materialized_data_tables(self, **conditions) -> QuerySet:
+        return self.materialized_model.filter(**conditions)
+
+    def expire_materialized_data_tables(self, **conditions) -> None:
+        self.materialized_model.filter(**conditions).update(state="EXPIRED")
+
+    def delete_materialized_data_tables(self, **conditions) -> None:
+        self.materialized_model.filter(**conditions).delete()
+
+    def delete_unused_materialized_data_tables(self, data_table_type: str) -> None:
+        """Deletes expired results and results nobody has read within the TTL."""
+
+        self.delete_materialized_data_tables(
+            data_table_type=data_table_type, state="EXPIRED"
+        )
+        self.delete_materialized_data_tables(
+            data_table_type=data_table_type, read_at__lt=self.get_read_after()
+        )
+
+        # Results saved before reads were recorded
+        self.delete_materialized_data_tables(
+            data_table_type=data_table_type, read_at=None
+        )
+
+    def update_read_at(self, materialized_vo: MaterializedDataTable) -> None:
+        # A read is written at most once per refresh interval, not on every load
+        if (
+            materialized_vo.read_at is None
+            or datetime.utcnow() - materialized_vo.read_at
+            > self.get_refresh_interval()
+        ):
+            self.update_materialized_data_table_by_vo(
+                {"read_at": datetime.utcnow()}, materialized_vo
+            )
+
+    def save_data_frame(
+        self,
+        materialized_vo: Union[MaterializedDataTable, None],
+        params: dict,
+        df: pd.DataFrame,
+        data_keys: Union[list, None],
+        label_keys: Union[list, None],
+    ) -> Union[MaterializedDataTable, None]:
+        data = self.dump_data_frame(df)
+        max_size = config.get_global(
+            "MATERIALIZED_DATA_TABLE_MAX_SIZE", DEFAULT_MAX_DATA_SIZE
+        )
+
+        if len(data) > max_size:
+            _LOGGER.warning(
+                f"[save_data_frame] skip materialization of {params['data_table_id']}"
+                f" (size: {len(data)} bytes > {max_size} bytes)"
+            )
+            return materialized_vo
+
+        materialized_info = {
+            "state": "AVAILABLE",
+            "data": data,
+            "data_size": len(data),
+            "row_count": len(df),
+            "data_keys": data_keys,
+            "label_keys": label_keys,
+            "refreshed_at": datetime.utcnow(),
+        }
+
+        if materialized_vo:
+            return self.update_materialized_data_table_by_vo(
+                materialized_info, materialized_vo
+            )
+        else:
+            params.update(materialized_info)
+            params["read_at"] = materialized_info["refreshed_at"]
+            return self.create_materialized_data_table(params)
+
+    @staticmethod
+    def dump_data_frame(df: pd.DataFrame) -> bytes:
+        columnar_data = {
+            "columns": [str(column) for column in df.columns],
+            "data": [df[column].tolist() for column in df.columns],
+        }
+        return zlib.compress(json.dumps(columnar_data, default=str).encode("utf-8"))
+
+    @staticmethod
+    def restore_data_frame(data: bytes) -> pd.DataFrame:
+        columnar_data = json.loads(zlib.decompress(data).decode("utf-8"))
+        return pd.DataFrame(
+            dict(zip(columnar_data["columns"], columnar_data["data"])),
+            columns=columnar_data["columns"],
+        )
+
+    @staticmethod
+    def get_refresh_interval() -> timedelta:
+        return timedelta(
+            hours=config.get_global(
+                "MATERIALIZED_DATA_TABLE_REFRESH_INTERVAL", DEFAULT_REFRESH_INTERVAL
+            )
+        )
+
+    @staticmethod
+    def get_read_after() -> datetime:
+        ttl = config.get_global("MATERIALIZED_DATA_TABLE_TTL", DEFAULT_TTL)
+        return datetime.utcnow() - timedelta(hours=ttl)
+
+    def is_stale(self, materialized_vo: MaterializedDataTable) -> bool:
+        if materialized_vo.state == "EXPIRED" or materialized_vo.refreshed_at is None:
+            return True
+
+        return (
+            datetime.utcnow() - materialized_vo.refreshed_at
+            > self.get_refresh_interval()
+        )
@@ -0,0 +1,81 @@
+import logging
+import threading
+from concurrent.futures import Future
+
+from spaceone.core import config, utils
+from spaceone.core.manager import BaseManager
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SingleFlightManager(BaseManager):
+    """Shares one upstream call among identical calls in flight in the process.
+
+    Calls are identical when the method, the params and the scope of the
+    caller are the same. The scope is the domain and the role type, plus the
+    workspace below the domain admin and the user below the workspace owner.
+    The shared response must not be mutated by the callers.
+    """
+
+    _lock = threading.Lock()
+    _in_flight = {}
+    _stats = {}
+
+    def dispatch(self, connector, method: str, params: dict, **kwargs) -> dict:
+        if not config.get_global("DATA_TABLE_ANALYZE_COALESCING", True):
+            return connector.dispatch(method, params, **kwargs)
+
+        flight_key = self._make_flight_key(method, params, kwargs)
+
+        with self._lock:
+            stats = self._stats.setdefault(method, {"calls": 0, "coalesced": 0})
+            stats["calls"] += 1
+
+            future = self._in_flight.get(flight_key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._in_flight[flight_key] = future
+            else:
+                stats["coalesced"] += 1
+
+        if not is_leader:
+            _LOGGER.debug(f"[dispatch] coalesced with an in-flight call: {method}")
+            return future.result()
+
+        try:
+            future.set_result(connector.dispatch(method, params, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                del self._in_flight[flight_key]
+
+        return future.result()
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        with cls._lock:
+            return {method: dict(stats) for method, stats in cls._stats.items()}
+
+    def _make_flight_key(self, method: str, params: dict, kwargs: dict) -> str:
+        role_type = self.transaction.get_meta("authorization.role_type")
+        flight_data = {
+            "method": method,
+            "params": params,
+            "kwargs": kwargs,
+            "domain_id": self.transaction.get_meta("authorization.domain_id"),
+            "role_type": role_type,
+        }
+
+        if role_type not in ["DOMAIN_ADMIN", "SYSTEM"]:
+            flight_data["workspace_id"] = self.transaction.get_meta(
+                "authorization.workspace_id"
+            )
+
+            if role_type != "WORKSPACE_OWNER":
+                flight_data["user_id"] = self.transaction.get_meta(
+                    "authorization.user_id"
+                ) or self.transaction.get_meta("authorization.app_id")
+
+        return utils.dict_to_hash(flight_data)
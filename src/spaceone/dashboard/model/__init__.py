@@ -6,3 +6,6 @@ from spaceone.dashboard.model.private_folder.database import PrivateFolder
 from spaceone.dashboard.model.private_dashboard.database import PrivateDashboard
 from spaceone.dashboard.model.private_widget.database import PrivateWidget
 from spaceone.dashboard.model.private_data_table.database import PrivateDataTable
+from spaceone.dashboard.model.materialized_data_table.database import (
+    MaterializedDataTable,
+)
@@ -0,0 +1,64 @@
+from mongoengine import *
+
+from spaceone.core.model.mongo_model import MongoModel
+
+
+class MaterializedDataTable(MongoModel):
+    materialized_id = StringField(
+        max_length=40, generate_id="materialized-dt", unique=True
+    )
+    state = StringField(
+        max_length=40, default="AVAILABLE", choices=("AVAILABLE", "EXPIRED")
+    )
+    data_table_type = StringField(max_length=40, choices=("PUBLIC", "PRIVATE"))
+    data_table_id = StringField(max_length=40)
+    query_hash = StringField(max_length=40)
+    granularity = StringField(max_length=40)
+    start = StringField(max_length=40, default=None, null=True)
+    end = StringField(max_length=40, default=None, null=True)
+    vars = DictField(default=None)
+    role_type = StringField(max_length=40, default=None, null=True)
+    data = BinaryField(default=None)
+    data_size = IntField(default=0)
+    row_count = IntField(default=0)
+    data_keys = ListField(StringField(), default=None)
+    label_keys = ListField(StringField(), default=None)
+    widget_id = StringField(max_length=40)
+    domain_id = StringField(max_length=40)
+    refreshed_at = DateTimeField(default=None, null=True)
+    read_at = DateTimeField(default=None, null=True)
+    created_at = DateTimeField(auto_now_add=True)
+
+    meta = {
+        "updatable_fields": [
+            "state",
+            "data",
+            "data_size",
+            "row_count",
+            "data_keys",
+            "label_keys",
+            "refreshed_at",
+            "read_at",
+        ],
+        "minimal_fields": [
+            "materialized_id",
+            "state",
+            "data_table_type",
+            "data_table_id",
+            "granularity",
+            "row_count",
+            "refreshed_at",
+        ],
+        "ordering": ["refreshed_at"],
+        "indexes": [
+            "state",
+            "data_table_type",
+            "data_table_id",
+            "query_hash",
+            "role_type",
+            "widget_id",
+            "domain_id",
+            "refreshed_at",
+            "read_at",
+        ],
+    }
@@ -1,4 +1,4 @@
-from typing import Union, List, Any
+from typing import Union, List, Any, Literal
 from pydantic import BaseModel
 
 __all__ = [
@@ -6,11 +6,14 @@ __all__ = [
     "PrivateDashboardUpdateRequest",
     "PrivateDashboardDeleteRequest",
     "PrivateDashboardGetRequest",
+    "PrivateDashboardLoadWidgetsRequest",
     "PrivateDashboardSearchQueryRequest",
     "PrivateDashboardStatQueryRequest",
     "PrivateDashboardChangeFolderRequest",
 ]
 
+ResponseFormat = Literal["ROWS", "COLUMNAR"]
+
 
 class PrivateDashboardCreateRequest(BaseModel):
     name: str
@@ -66,6 +69,18 @@ class PrivateDashboardGetRequest(BaseModel):
     domain_id: str
 
 
+class PrivateDashboardLoadWidgetsRequest(BaseModel):
+    dashboard_id: str
+    granularity: str
+    start: str
+    end: str
+    vars: Union[dict, None] = None
+    widgets: Union[List[dict], None] = None
+    format: Union[ResponseFormat, None] = None
+    user_id: str
+    domain_id: str
+
+
 class PrivateDashboardSearchQueryRequest(BaseModel):
     query: Union[dict, None] = None
     dashboard_id: Union[str, None] = None
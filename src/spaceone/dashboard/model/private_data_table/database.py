@@ -17,6 +17,11 @@ class PrivateDataTable(MongoModel):
     tags = DictField(default=None)
     labels_info = DictField(default=None)
     data_info = DictField(default=None)
+    materialize = BooleanField(default=False)
+    ancestors = ListField(StringField(max_length=40), default=None)
+    depth = IntField(default=0)
+    dag_hash = StringField(max_length=40, default=None, null=True)
+    variables = ListField(StringField(max_length=255), default=None)
     dashboard_id = StringField(max_length=40)
     widget_id = StringField(max_length=40)
     resource_group = StringField(
@@ -36,6 +41,11 @@ class PrivateDataTable(MongoModel):
             "tags",
             "labels_info",
             "data_info",
+            "materialize",
+            "ancestors",
+            "depth",
+            "dag_hash",
+            "variables",
         ],
         "minimal_fields": [
             "data_table_id",
@@ -58,6 +68,7 @@ class PrivateDataTable(MongoModel):
             "operator",
             "dashboard_id",
             "widget_id",
+            "ancestors",
             "user_id",
             "domain_id",
         ],
@@ -7,11 +7,14 @@ __all__ = [
     "PrivateDataTableUpdateRequest",
     "PrivateDataTableDeleteRequest",
     "PrivateDataTableLoadRequest",
+    "PrivateDataTableExplainRequest",
     "PrivateDataTableGetRequest",
     "PrivateDataTableSearchQueryRequest",
 ]
 
 Granularity = Literal["DAILY", "MONTHLY", "YEARLY"]
+Validation = Literal["SCHEMA", "PROBE", "FULL"]
+ResponseFormat = Literal["ROWS", "COLUMNAR"]
 
 
 class PrivateDataTableAddRequest(BaseModel):
@@ -20,6 +23,8 @@ class PrivateDataTableAddRequest(BaseModel):
     source_type: str
     options: dict
     vars: Union[dict, None] = None
+    validation: Union[Validation, None] = None
+    materialize: Union[bool, None] = None
     tags: Union[dict, None] = None
     user_id: str
     domain_id: str
@@ -31,6 +36,8 @@ class PrivateDataTableTransformRequest(BaseModel):
     operator: str
     options: dict
     vars: Union[dict, None] = None
+    validation: Union[Validation, None] = None
+    materialize: Union[bool, None] = None
     tags: Union[dict, None] = None
     user_id: str
     domain_id: str
@@ -41,6 +48,8 @@ class PrivateDataTableUpdateRequest(BaseModel):
     name: Union[str, None] = None
     options: Union[dict, None] = None
     vars: Union[dict, None] = None
+    validation: Union[Validation, None] = None
+    materialize: Union[bool, None] = None
     tags: Union[dict, None] = None
     user_id: str
     domain_id: str
@@ -53,6 +62,20 @@ class PrivateDataTableDeleteRequest(BaseModel):
 
 
 class PrivateDataTableLoadRequest(BaseModel):
+    data_table_id: str
+    granularity: Granularity
+    start: Union[str, None] = None
+    end: Union[str, None] = None
+    sort: Union[list, None] = None
+    page: Union[dict, None] = None
+    vars: Union[dict, None] = None
+    preview: Union[bool, None] = None
+    format: Union[ResponseFormat, None] = None
+    user_id: str
+    domain_id: str
+
+
+class PrivateDataTableExplainRequest(BaseModel):
     data_table_id: str
     granularity: Granularity
     start: Union[str, None] = None
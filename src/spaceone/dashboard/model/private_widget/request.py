@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, Literal
 from pydantic import BaseModel
 
 __all__ = [
@@ -11,6 +11,8 @@ __all__ = [
     "PrivateWidgetSearchQueryRequest",
 ]
 
+ResponseFormat = Literal["ROWS", "COLUMNAR"]
+
 
 class PrivateWidgetCreateRequest(BaseModel):
     dashboard_id: str
@@ -56,6 +58,7 @@ class PrivateWidgetLoadRequest(BaseModel):
     sort: Union[list, None] = None
     page: Union[dict, None] = None
     vars: Union[dict, None] = None
+    format: Union[ResponseFormat, None] = None
     user_id: str
     domain_id: str
 
@@ -16,6 +16,7 @@ class PrivateWidgetResponse(BaseModel):
     options: Union[dict, None] = None
     tags: Union[dict, None] = None
     data_table_id: Union[str, None] = None
+    variables: Union[list, None] = None
     dashboard_id: Union[str, None] = None
     user_id: Union[str, None] = None
     domain_id: Union[str, None] = None
@@ -9,6 +9,7 @@ __all__ = [
     "PublicDashboardUnshareRequest",
     "PublicDashboardDeleteRequest",
     "PublicDashboardGetRequest",
+    "PublicDashboardLoadWidgetsRequest",
     "PublicDashboardSearchQueryRequest",
     "PublicDashboardStatQueryRequest",
     "ResourceGroup",
@@ -16,6 +17,7 @@ __all__ = [
 
 ResourceGroup = Literal["DOMAIN", "WORKSPACE", "PROJECT"]
 Scope = Literal["WORKSPACE", "PROJECT"]
+ResponseFormat = Literal["ROWS", "COLUMNAR"]
 
 
 class PublicDashboardCreateRequest(BaseModel):
@@ -94,6 +96,19 @@ class PublicDashboardGetRequest(BaseModel):
     user_projects: Union[list, None] = None
 
 
+class PublicDashboardLoadWidgetsRequest(BaseModel):
+    dashboard_id: str
+    granularity: str
+    start: str
+    end: str
+    vars: Union[dict, None] = None
+    widgets: Union[List[dict], None] = None
+    format: Union[ResponseFormat, None] = None
+    workspace_id: Union[str, list, None] = None
+    domain_id: str
+    user_projects: Union[list, None] = None
+
+
 class PublicDashboardSearchQueryRequest(BaseModel):
     query: Union[dict, None] = None
     dashboard_id: Union[str, None] = None
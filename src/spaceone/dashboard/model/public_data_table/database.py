@@ -17,6 +17,11 @@ class PublicDataTable(MongoModel):
     tags = DictField(default=None)
     labels_info = DictField(default=None)
     data_info = DictField(default=None)
+    materialize = BooleanField(default=False)
+    ancestors = ListField(StringField(max_length=40), default=None)
+    depth = IntField(default=0)
+    dag_hash = StringField(max_length=40, default=None, null=True)
+    variables = ListField(StringField(max_length=255), default=None)
     dashboard_id = StringField(max_length=40)
     widget_id = StringField(max_length=40)
     resource_group = StringField(
@@ -37,6 +42,11 @@ class PublicDataTable(MongoModel):
             "tags",
             "labels_info",
             "data_info",
+            "materialize",
+            "ancestors",
+            "depth",
+            "dag_hash",
+            "variables",
             "project_id",
             "workspace_id",
         ],
@@ -64,6 +74,7 @@ class PublicDataTable(MongoModel):
             "operator",
             "dashboard_id",
             "widget_id",
+            "ancestors",
             "resource_group",
             "project_id",
             "workspace_id",
@@ -7,11 +7,14 @@ __all__ = [
     "PublicDataTableUpdateRequest",
     "PublicDataTableDeleteRequest",
     "PublicDataTableLoadRequest",
+    "PublicDataTableExplainRequest",
     "PublicDataTableGetRequest",
     "PublicDataTableSearchQueryRequest",
 ]
 
 Granularity = Literal["DAILY", "MONTHLY", "YEARLY"]
+Validation = Literal["SCHEMA", "PROBE", "FULL"]
+ResponseFormat = Literal["ROWS", "COLUMNAR"]
 
 
 class PublicDataTableAddRequest(BaseModel):
@@ -20,6 +23,8 @@ class PublicDataTableAddRequest(BaseModel):
     source_type: str
     options: dict
     vars: Union[dict, None] = None
+    validation: Union[Validation, None] = None
+    materialize: Union[bool, None] = None
     tags: Union[dict, None] = None
     workspace_id: Union[str, None] = None
     domain_id: str
@@ -32,6 +37,8 @@ class PublicDataTableTransformRequest(BaseModel):
     operator: str
     options: dict
     vars: Union[dict, None] = None
+    validation: Union[Validation, None] = None
+    materialize: Union[bool, None] = None
     tags: Union[dict, None] = None
     workspace_id: Union[str, None] = None
     domain_id: str
@@ -43,6 +50,8 @@ class PublicDataTableUpdateRequest(BaseModel):
     name: Union[str, None] = None
     options: Union[dict, None] = None
     vars: Union[dict, None] = None
+    validation: Union[Validation, None] = None
+    materialize: Union[bool, None] = None
     tags: Union[dict, None] = None
     workspace_id: Union[str, None] = None
     domain_id: str
@@ -57,6 +66,21 @@ class PublicDataTableDeleteRequest(BaseModel):
 
 
 class PublicDataTableLoadRequest(BaseModel):
+    data_table_id: str
+    granularity: Granularity
+    start: Union[str, None] = None
+    end: Union[str, None] = None
+    sort: Union[list, None] = None
+    page: Union[dict, None] = None
+    vars: Union[dict, None] = None
+    preview: Union[bool, None] = None
+    format: Union[ResponseFormat, None] = None
+    workspace_id: Union[str, list, None] = None
+    domain_id: str
+    user_projects: Union[list, None] = None
+
+
+class PublicDataTableExplainRequest(BaseModel):
     data_table_id: str
     granularity: Granularity
     start: Union[str, None] = None
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Union, Literal
 from pydantic import BaseModel
 
 __all__ = [
@@ -11,6 +11,8 @@ __all__ = [
     "PublicWidgetSearchQueryRequest",
 ]
 
+ResponseFormat = Literal["ROWS", "COLUMNAR"]
+
 
 class PublicWidgetCreateRequest(BaseModel):
     dashboard_id: str
@@ -66,6 +68,7 @@ class PublicWidgetLoadRequest(BaseModel):
     sort: Union[list, None] = None
     page: Union[dict, None] = None
     vars: Union[dict, None] = None
+    format: Union[ResponseFormat, None] = None
     workspace_id: Union[str, list, None] = None
     domain_id: str
     user_projects: Union[list, None] = None
@@ -18,6 +18,7 @@ class PublicWidgetResponse(BaseModel):
     options: Union[dict, None] = None
     tags: Union[dict, None] = None
     data_table_id: Union[str, None] = None
+    variables: Union[list, None] = None
     dashboard_id: Union[str, None] = None
     resource_group: Union[ResourceGroup, None] = None
     project_id: Union[str, None] = None
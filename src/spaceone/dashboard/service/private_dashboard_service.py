@@ -1,5 +1,5 @@
 import logging
-from typing import Union
+from typing import Union, Generator
 
 from spaceone.core.service import *
 from spaceone.core.error import *
@@ -225,6 +225,38 @@ class PrivateDashboardService(BaseService):
 
         self.pri_dashboard_mgr.delete_private_dashboard_by_vo(pri_dashboard_vo)
 
+    @transaction(
+        permission="dashboard:PrivateDashboard.read",
+        role_types=["USER"],
+    )
+    @convert_model
+    def load_widgets(self, params: PrivateDashboardLoadWidgetsRequest) -> Generator:
+        """Load all widgets of private dashboard
+
+        Args:
+            params (dict): {
+                'dashboard_id': 'str',          # required
+                'granularity': 'str',           # required
+                'start': 'str',                 # required
+                'end': 'str',                   # required
+                'vars': 'dict',
+                'widgets': 'list',              # widget_id, group_by, sort, page
+                'format': 'str',
+                'user_id': 'str',               # injected from auth (required)
+                'domain_id': 'str'              # injected from auth (required)
+            }
+
+        Returns:
+            Generator: one message per widget as soon as it is loaded
+        """
+
+        self.pri_dashboard_mgr.get_private_dashboard(
+            params.dashboard_id, params.domain_id, params.user_id
+        )
+
+        pri_widget_svc = PrivateWidgetService()
+        return pri_widget_svc.load_dashboard_widgets(params.dict())
+
     @transaction(
         permission="dashboard:PrivateDashboard.read",
         role_types=["USER"],
@@ -1,6 +1,7 @@
 import logging
 import copy
-from typing import Union
+from datetime import datetime
+from typing import Union, Generator
 
 from spaceone.core import cache
 from spaceone.core.service import *
@@ -17,7 +18,13 @@ from spaceone.dashboard.manager.data_table_manager.data_source_manager import (
 from spaceone.dashboard.manager.data_table_manager.data_transformation_manager import (
     DataTransformationManager,
 )
+from spaceone.dashboard.manager.data_table_manager.data_table_plan_manager import (
+    DataTablePlanManager,
+)
 from spaceone.dashboard.manager.cost_analysis_manager import CostAnalysisManager
+from spaceone.dashboard.manager.materialized_data_table_manager import (
+    MaterializedDataTableManager,
+)
 from spaceone.dashboard.model.private_data_table.request import *
 from spaceone.dashboard.model.private_data_table.response import *
 from spaceone.dashboard.model.private_data_table.database import PrivateDataTable
@@ -53,6 +60,8 @@ class PrivateDataTableService(BaseService):
                 'source_type': 'str',           # required
                 'options': 'dict',              # required
                 'vars': 'dict',
+                'validation': 'str',
+                'materialize': 'bool',
                 'tags': 'dict',
                 'user_id': 'str',               # injected from auth (required)
                 'domain_id': 'str',             # injected from auth (required)
@@ -70,6 +79,7 @@ class PrivateDataTableService(BaseService):
         source_type = params_dict.get("source_type")
         options = params_dict.get("options")
         vars = params_dict.get("vars")
+        validation = params_dict.get("validation")
         widget_id = params_dict.get("widget_id")
         domain_id = params_dict.get("domain_id")
         user_id = params_dict.get("user_id")
@@ -98,8 +108,8 @@ class PrivateDataTableService(BaseService):
             domain_id,
         )
 
-        # Load data source to verify options
-        ds_mgr.load(vars=vars)
+        # Verify options, data is only fetched when requested
+        ds_mgr.validate(validation, vars)
 
         # Get data and labels info from options
         data_info, labels_info = ds_mgr.get_data_and_labels_info()
@@ -114,6 +124,11 @@ class PrivateDataTableService(BaseService):
         if raw_filter:
             params_dict["options"]["filter"] = raw_filter
 
+        plan_mgr = DataTablePlanManager("PRIVATE", domain_id)
+        params_dict.update(
+            plan_mgr.make_lineage("ADDED", source_type, None, params_dict["options"])
+        )
+
         pri_data_table_vo = self.pri_data_table_mgr.create_private_data_table(
             params_dict
         )
@@ -154,6 +169,8 @@ class PrivateDataTableService(BaseService):
                 'operator': 'str',              # required
                 'options': 'dict',              # required
                 'vars': 'dict',
+                'validation': 'str',
+                'materialize': 'bool',
                 'tags': 'dict',
                 'user_id': 'str',               # injected from auth (required)
                 'domain_id': 'str',             # injected from auth (required)
@@ -172,6 +189,7 @@ class PrivateDataTableService(BaseService):
         options = params_dict.get("options")
         operator_options = options.get(operator, {})
         vars = params_dict.get("vars")
+        validation = params_dict.get("validation")
         widget_id = params_dict.get("widget_id")
         domain_id = params_dict.get("domain_id")
         user_id = params_dict.get("user_id")
@@ -183,12 +201,16 @@ class PrivateDataTableService(BaseService):
             user_id,
         )
 
+        # Reject cycles and excessive depth before loading
+        plan_mgr = DataTablePlanManager("PRIVATE", domain_id)
+        lineage = plan_mgr.make_lineage("TRANSFORMED", None, operator, options)
+
         dt_mgr = DataTransformationManager(
             "PRIVATE", operator, operator_options, widget_id, domain_id
         )
 
-        # Load data table to verify options
-        dt_mgr.load(vars=vars)
+        # Verify options, data is only fetched when requested
+        dt_mgr.validate(validation, vars)
 
         # Get data and labels info from options
         data_info, labels_info = dt_mgr.get_data_and_labels_info()
@@ -199,6 +221,7 @@ class PrivateDataTableService(BaseService):
         params_dict["dashboard_id"] = pri_widget_vo.dashboard_id
         params_dict["state"] = dt_mgr.state
         params_dict["error_message"] = dt_mgr.error_message
+        params_dict.update(lineage)
 
         pri_data_table_vo = self.pri_data_table_mgr.create_private_data_table(
             params_dict
@@ -222,6 +245,8 @@ class PrivateDataTableService(BaseService):
                 'name': 'str',
                 'options': 'dict',
                 'vars': 'dict',
+                'validation': 'str',
+                'materialize': 'bool',
                 'tags': 'dict',
                 'user_id': 'str',               # injected from auth (required)
                 'domain_id': 'str'              # injected from auth (required)
@@ -239,8 +264,10 @@ class PrivateDataTableService(BaseService):
 
         params_dict = params.dict(exclude_unset=True)
         vars = params_dict.get("vars")
+        validation = params_dict.get("validation")
 
         if options := params_dict.get("options"):
+            plan_mgr = DataTablePlanManager("PRIVATE", params.domain_id)
             raw_filter = copy.deepcopy(options.get("filter"))
 
             if pri_data_table_vo.data_type == "ADDED":
@@ -252,8 +279,8 @@ class PrivateDataTableService(BaseService):
                     pri_data_table_vo.domain_id,
                 )
 
-                # Load data source to verify options
-                ds_mgr.load(vars=vars)
+                # Verify options, data is only fetched when requested
+                ds_mgr.validate(validation, vars)
 
                 # Get ds_mgr state and error_message
                 params_dict["state"] = ds_mgr.state
@@ -278,6 +305,15 @@ class PrivateDataTableService(BaseService):
             else:
                 operator = pri_data_table_vo.operator
                 operator_options = options.get(operator, {})
+                # Reject cycles and excessive depth before loading
+                lineage = plan_mgr.make_lineage(
+                    "TRANSFORMED",
+                    None,
+                    operator,
+                    {operator: operator_options},
+                    pri_data_table_vo.data_table_id,
+                )
+
                 dt_mgr = DataTransformationManager(
                     "PRIVATE",
                     operator,
@@ -286,8 +322,8 @@ class PrivateDataTableService(BaseService):
                     pri_data_table_vo.domain_id,
                 )
 
-                # Load data table to verify options
-                dt_mgr.load(vars=vars)
+                # Verify options, data is only fetched when requested
+                dt_mgr.validate(validation, vars)
 
                 # Get data and labels info from options
                 data_info, labels_info = dt_mgr.get_data_and_labels_info()
@@ -303,19 +339,52 @@ class PrivateDataTableService(BaseService):
                 # Get dt_mgr state and error_message
                 params_dict["state"] = dt_mgr.state
                 params_dict["error_message"] = dt_mgr.error_message
+                params_dict.update(lineage)
 
             if raw_filter:
                 params_dict["options"]["filter"] = raw_filter
 
+            if pri_data_table_vo.data_type == "ADDED":
+                params_dict.update(
+                    plan_mgr.make_lineage(
+                        "ADDED",
+                        pri_data_table_vo.source_type,
+                        None,
+                        params_dict["options"],
+                    )
+                )
+
         cache_key = (
             f"dashboard:widget:load:{params.domain_id}:{pri_data_table_vo.widget_id}:*"
         )
         cache.delete_pattern(cache_key)
+        cache.delete_pattern(
+            f"dashboard:data-table:plan:{params.domain_id}:{pri_data_table_vo.widget_id}:*"
+        )
+
+        materialized_mgr = MaterializedDataTableManager()
+        if params_dict.get("materialize") is None:
+            params_dict.pop("materialize", None)
+        elif params_dict["materialize"] is False:
+            materialized_mgr.delete_materialized_data_tables(
+                data_table_id=pri_data_table_vo.data_table_id,
+                domain_id=params.domain_id,
+            )
+
+        if params_dict.get("options"):
+            materialized_mgr.expire_materialized_data_tables(
+                widget_id=pri_data_table_vo.widget_id, domain_id=params.domain_id
+            )
 
         pri_data_table_vo = self.pri_data_table_mgr.update_private_data_table_by_vo(
             params_dict, pri_data_table_vo
         )
 
+        # Descendant JOINs name the duplicated columns after this data table
+        if params_dict.get("options") or params_dict.get("name"):
+            plan_mgr = DataTablePlanManager("PRIVATE", params.domain_id)
+            plan_mgr.update_descendant_lineages(pri_data_table_vo)
+
         return PrivateDataTableResponse(**pri_data_table_vo.to_dict())
 
     @transaction(
@@ -349,6 +418,17 @@ class PrivateDataTableService(BaseService):
             f"dashboard:widget:load:{params.domain_id}:{pri_data_table_vo.widget_id}:*"
         )
         cache.delete_pattern(cache_key)
+        cache.delete_pattern(
+            f"dashboard:data-table:plan:{params.domain_id}:{pri_data_table_vo.widget_id}:*"
+        )
+
+        materialized_mgr = MaterializedDataTableManager()
+        materialized_mgr.delete_materialized_data_tables(
+            data_table_id=pri_data_table_vo.data_table_id, domain_id=params.domain_id
+        )
+        materialized_mgr.expire_materialized_data_tables(
+            widget_id=pri_data_table_vo.widget_id, domain_id=params.domain_id
+        )
 
         self.pri_data_table_mgr.delete_private_data_table_by_vo(pri_data_table_vo)
 
@@ -369,6 +449,8 @@ class PrivateDataTableService(BaseService):
                 'sort': 'list',
                 'page': 'dict',
                 'vars': 'dict',
+                'preview': 'bool',
+                'format': 'str',
                 'user_id': 'str',               # injected from auth (required)
                 'domain_id': 'str'              # injected from auth (required)
             }
@@ -377,6 +459,42 @@ class PrivateDataTableService(BaseService):
             None
         """
 
+        data_table_mgr = self._load_data_table(params)
+        return data_table_mgr.response_data(params.sort, params.page, params.format)
+
+    @transaction(
+        permission="dashboard:PrivateDataTable.read",
+        role_types=["USER"],
+    )
+    @convert_model
+    def load_stream(self, params: PrivateDataTableLoadRequest) -> Generator:
+        """Load private data table as a stream of messages
+
+        Args:
+            params (dict): {
+                'data_table_id': 'str',         # required
+                'granularity': 'str',           # required
+                'start': 'str',
+                'end': 'str',
+                'sort': 'list',
+                'page': 'dict',
+                'vars': 'dict',
+                'preview': 'bool',
+                'user_id': 'str',               # injected from auth (required)
+                'domain_id': 'str'              # injected from auth (required)
+            }
+
+        Returns:
+            Generator: a header with total_count, labels_info, data_info and
+                order, followed by chunks of results
+        """
+
+        data_table_mgr = self._load_data_table(params)
+        return data_table_mgr.stream_response_data(params.sort, params.page)
+
+    def _load_data_table(
+        self, params: PrivateDataTableLoadRequest
+    ) -> Union[DataSourceManager, DataTransformationManager]:
         pri_data_table_vo: PrivateDataTable = (
             self.pri_data_table_mgr.get_private_data_table(
                 params.data_table_id,
@@ -385,55 +503,162 @@ class PrivateDataTableService(BaseService):
             )
         )
 
-        if pri_data_table_vo.data_type == "ADDED":
-            ds_mgr = DataSourceManager(
-                "PRIVATE",
-                pri_data_table_vo.source_type,
-                pri_data_table_vo.options,
-                pri_data_table_vo.widget_id,
-                pri_data_table_vo.domain_id,
+        data_table_mgr = self._get_data_table_manager(pri_data_table_vo)
+
+        if params.preview:
+            data_table_mgr.preview(
+                params.granularity,
+                params.start,
+                params.end,
+                params.vars,
             )
-            ds_mgr.load(
+        elif pri_data_table_vo.materialize:
+            data_table_mgr.load_materialized(
+                pri_data_table_vo,
+                params.granularity,
+                params.start,
+                params.end,
+                params.vars,
+            )
+        else:
+            data_table_mgr.load(
                 params.granularity,
                 params.start,
                 params.end,
                 params.vars,
             )
 
-            if ds_mgr.state == "UNAVAILABLE":
-                raise ERROR_UNAVAILABLE_DATA_TABLE(
-                    data_table_id=pri_data_table_vo.data_table_id
-                )
+        if data_table_mgr.state == "UNAVAILABLE":
+            raise ERROR_UNAVAILABLE_DATA_TABLE(
+                data_table_id=pri_data_table_vo.data_table_id
+            )
 
-            return ds_mgr.response_data(params.sort, params.page)
+        return data_table_mgr
 
+    @transaction(
+        permission="dashboard:PrivateDataTable.read",
+        role_types=["USER"],
+    )
+    @convert_model
+    def explain(self, params: PrivateDataTableExplainRequest) -> dict:
+        """Explain private data table
+
+        Args:
+            params (dict): {
+                'data_table_id': 'str',         # required
+                'granularity': 'str',           # required
+                'start': 'str',
+                'end': 'str',
+                'sort': 'list',
+                'page': 'dict',
+                'vars': 'dict',
+                'user_id': 'str',               # injected from auth (required)
+                'domain_id': 'str'              # injected from auth (required)
+            }
+
+        Returns:
+            dict: executed plan with per-node wall time, remote time, rows, columns and memory
+        """
+
+        pri_data_table_vo: PrivateDataTable = (
+            self.pri_data_table_mgr.get_private_data_table(
+                params.data_table_id,
+                params.domain_id,
+                params.user_id,
+            )
+        )
+
+        data_table_mgr = self._get_data_table_manager(pri_data_table_vo)
+        explain_info = data_table_mgr.explain(
+            params.granularity,
+            params.start,
+            params.end,
+            params.vars,
+            params.sort,
+            params.page,
+        )
+        explain_info["data_table_id"] = pri_data_table_vo.data_table_id
+
+        return explain_info
+
+    @staticmethod
+    def _get_data_table_manager(
+        pri_data_table_vo: PrivateDataTable,
+    ) -> Union[DataSourceManager, DataTransformationManager]:
+        if pri_data_table_vo.data_type == "ADDED":
+            return DataSourceManager(
+                "PRIVATE",
+                pri_data_table_vo.source_type,
+                pri_data_table_vo.options,
+                pri_data_table_vo.widget_id,
+                pri_data_table_vo.domain_id,
+            )
         else:
             operator = pri_data_table_vo.operator
-            options = pri_data_table_vo.options.get(operator, {})
-            widget_id = pri_data_table_vo.widget_id
-            domain_id = pri_data_table_vo.domain_id
-
-            dt_mgr = DataTransformationManager(
+            return DataTransformationManager(
                 "PRIVATE",
                 operator,
-                options,
-                widget_id,
-                domain_id,
+                pri_data_table_vo.options.get(operator, {}),
+                pri_data_table_vo.widget_id,
+                pri_data_table_vo.domain_id,
             )
 
-            dt_mgr.load(
-                params.granularity,
-                params.start,
-                params.end,
-                params.vars,
-            )
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def refresh_materialized_data_tables(self, params: dict) -> None:
+        """Refresh materialized private data tables which are older than refresh interval
+        and delete the ones which are expired or have not been read within the TTL
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None
+        """
 
-            if dt_mgr.state == "UNAVAILABLE":
-                raise ERROR_UNAVAILABLE_DATA_TABLE(
-                    data_table_id=pri_data_table_vo.data_table_id
+        materialized_mgr = MaterializedDataTableManager()
+        refreshed_at = datetime.utcnow() - materialized_mgr.get_refresh_interval()
+        materialized_vos = materialized_mgr.filter_materialized_data_tables(
+            data_table_type="PRIVATE",
+            state="AVAILABLE",
+            refreshed_at__lt=refreshed_at,
+            read_at__gte=materialized_mgr.get_read_after(),
+        )
+
+        for materialized_vo in materialized_vos:
+            try:
+                self.refresh_materialized_data_table(materialized_vo)
+            except Exception as e:
+                _LOGGER.error(
+                    f"[refresh_materialized_data_tables] refresh error "
+                    f"({materialized_vo.data_table_id}): {e}",
+                    exc_info=True,
                 )
 
-            return dt_mgr.response_data(params.sort, params.page)
+        materialized_mgr.delete_unused_materialized_data_tables("PRIVATE")
+
+    def refresh_materialized_data_table(self, materialized_vo) -> None:
+        materialized_mgr = MaterializedDataTableManager()
+        pri_data_table_vo = self.pri_data_table_mgr.filter_private_data_tables(
+            data_table_id=materialized_vo.data_table_id,
+            domain_id=materialized_vo.domain_id,
+        ).first()
+
+        if pri_data_table_vo is None or not pri_data_table_vo.materialize:
+            materialized_vo.delete()
+            return
+
+        # Only domain-wide results can be reproduced with the system token.
+        # The others are recomputed by the next load with the caller's token.
+        if materialized_vo.role_type != "DOMAIN_ADMIN":
+            materialized_mgr.update_materialized_data_table_by_vo(
+                {"state": "EXPIRED"}, materialized_vo
+            )
+            return
+
+        self.transaction.set_meta("x_domain_id", materialized_vo.domain_id)
+
+        data_table_mgr = self._get_data_table_manager(pri_data_table_vo)
+        data_table_mgr.refresh_materialized(materialized_vo)
 
     @transaction(
         permission="dashboard:PrivateDataTable.read",
@@ -1,12 +1,19 @@
 import logging
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Union, Generator
 
+from spaceone.core import config
+from spaceone.core.error import ERROR_BASE, ERROR_NOT_FOUND, ERROR_UNKNOWN
 from spaceone.core.service import *
 from spaceone.dashboard.manager.private_widget_manager import PrivateWidgetManager
 from spaceone.dashboard.manager.private_dashboard_manager import PrivateDashboardManager
 from spaceone.dashboard.manager.private_data_table_manager import (
     PrivateDataTableManager,
 )
+from spaceone.dashboard.manager.data_table_manager import run_with_transaction
+from spaceone.dashboard.manager.data_table_manager.analyze_batch_manager import (
+    AnalyzeBatchManager,
+)
 from spaceone.dashboard.manager.data_table_manager.data_source_manager import (
     DataSourceManager,
 )
@@ -26,6 +33,8 @@ from spaceone.dashboard.service.private_data_table_service import (
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_MAX_LOAD_WORKERS = 4
+
 
 @authentication_handler
 @authorization_handler
@@ -349,6 +358,7 @@ class PrivateWidgetService(BaseService):
                 'sort': 'list',
                 'page': 'dict',
                 'vars': 'dict',
+                'format': 'str',
                 'user_id': 'str',               # injected from auth (required)
                 'domain_id': 'str'              # injected from auth (required)
             }
@@ -357,6 +367,42 @@ class PrivateWidgetService(BaseService):
             None
         """
 
+        return self._load_widget(params)
+
+    @transaction(
+        permission="dashboard:PrivateWidget.read",
+        role_types=["USER"],
+    )
+    @change_value_by_rule("APPEND", "workspace_id", "*")
+    @change_value_by_rule("APPEND", "project_id", "*")
+    @convert_model
+    def load_stream(self, params: PrivateWidgetLoadRequest) -> Generator:
+        """Load private widget as a stream of messages
+
+        Args:
+            params (dict): {
+                'widget_id': 'str',             # required
+                'granularity': 'str',           # required
+                'start': 'str',                 # required
+                'end': 'str',                   # required
+                'group_by': 'list',
+                'sort': 'list',
+                'page': 'dict',
+                'vars': 'dict',
+                'user_id': 'str',               # injected from auth (required)
+                'domain_id': 'str'              # injected from auth (required)
+            }
+
+        Returns:
+            Generator: a header with total_count, labels_info, data_info and
+                order, followed by chunks of results
+        """
+
+        return self._load_widget(params, stream=True)
+
+    def _load_widget(
+        self, params: PrivateWidgetLoadRequest, stream: bool = False
+    ) -> Union[dict, Generator]:
         pri_widget_vo = self.pri_widget_mgr.get_private_widget(
             params.widget_id,
             params.domain_id,
@@ -392,6 +438,9 @@ class PrivateWidgetService(BaseService):
                 params.sort,
                 params.page,
                 params.vars,
+                data_table_vo=pri_data_table_vo,
+                response_format=params.format,
+                stream=stream,
             )
 
         else:
@@ -414,6 +463,203 @@ class PrivateWidgetService(BaseService):
                 params.sort,
                 params.page,
                 params.vars,
+                data_table_vo=pri_data_table_vo,
+                response_format=params.format,
+                stream=stream,
+            )
+
+    def load_dashboard_widgets(self, params_dict: dict) -> Generator:
+        """Loads the widgets of a dashboard, each data table once.
+
+        Widgets whose data tables have the same definition (dag_hash) share a
+        single load and the data tables are loaded in parallel. A message is
+        yielded for each widget as soon as its data table is loaded, with
+        the widget_id and either the load response or an error.
+        """
+
+        dashboard_id = params_dict["dashboard_id"]
+        domain_id = params_dict["domain_id"]
+        widget_options = {}
+        for widget in params_dict.get("widgets") or []:
+            if not widget.get("widget_id"):
+                raise ERROR_REQUIRED_PARAMETER(key="widgets.widget_id")
+
+            widget_options[widget["widget_id"]] = widget
+
+        conditions = {
+            "dashboard_id": dashboard_id,
+            "user_id": params_dict["user_id"],
+            "domain_id": domain_id,
+        }
+
+        if widget_options:
+            conditions["widget_id"] = list(widget_options.keys())
+
+        pri_widget_vos = list(self.pri_widget_mgr.filter_private_widgets(**conditions))
+
+        data_table_ids = list(
+            {
+                pri_widget_vo.data_table_id
+                for pri_widget_vo in pri_widget_vos
+                if pri_widget_vo.data_table_id
+            }
+        )
+        conditions.pop("dashboard_id")
+        conditions.pop("widget_id", None)
+        pri_data_table_mgr = PrivateDataTableManager()
+        data_table_map = {
+            data_table_vo.data_table_id: data_table_vo
+            for data_table_vo in pri_data_table_mgr.filter_private_data_tables(
+                data_table_id=data_table_ids, **conditions
+            )
+        }
+
+        widget_responses = []
+        widget_groups = {}
+        for pri_widget_vo in pri_widget_vos:
+            widget_id = pri_widget_vo.widget_id
+            data_table_id = pri_widget_vo.data_table_id
+
+            if data_table_id is None:
+                error = ERROR_INVALID_PARAMETER(
+                    key="widget_id", reason="Data table is not set."
+                )
+                widget_responses.append(self._make_widget_error(widget_id, error))
+                continue
+
+            if data_table_id not in data_table_map:
+                error = ERROR_NOT_FOUND(key="data_table_id", value=data_table_id)
+                widget_responses.append(self._make_widget_error(widget_id, error))
+                continue
+
+            data_table_vo = data_table_map[data_table_id]
+            if data_table_vo.materialize or data_table_vo.dag_hash is None:
+                group_key = data_table_id
+            else:
+                group_key = data_table_vo.dag_hash
+
+            widget_groups.setdefault(
+                group_key, {"data_table_vo": data_table_vo, "widgets": []}
+            )
+            # Responses are cached for the data table of each widget
+            widget_groups[group_key]["widgets"].append(
+                {
+                    **widget_options.get(widget_id, {"widget_id": widget_id}),
+                    "data_table_id": data_table_id,
+                    "data_table_widget_id": data_table_vo.widget_id,
+                }
+            )
+
+        if not widget_groups:
+            return iter(widget_responses)
+
+        return self._generate_widget_responses(
+            widget_responses, widget_groups, params_dict, self.transaction
+        )
+
+    def _load_widget_group(
+        self,
+        widget_group: dict,
+        params_dict: dict,
+        analyze_batch_mgr: AnalyzeBatchManager = None,
+    ) -> list:
+        data_table_vo = widget_group["data_table_vo"]
+        widgets = widget_group["widgets"]
+
+        try:
+            data_table_mgr = self._get_data_table_manager(data_table_vo)
+            data_table_mgr.analyze_batch_mgr = analyze_batch_mgr
+            responses = data_table_mgr.load_from_widgets(
+                data_table_vo.data_table_id,
+                widgets,
+                params_dict["granularity"],
+                params_dict["start"],
+                params_dict["end"],
+                params_dict.get("vars"),
+                data_table_vo=data_table_vo,
+                response_format=params_dict.get("format"),
+            )
+        except Exception as e:
+            _LOGGER.error(
+                f"[_load_widget_group] failed to load data table: "
+                f"{data_table_vo.data_table_id} ({e})",
+                exc_info=True,
+            )
+            return [
+                self._make_widget_error(widget["widget_id"], e) for widget in widgets
+            ]
+
+        return [
+            {"widget_id": widget_id, **response} for widget_id, response in responses
+        ]
+
+    def _generate_widget_responses(
+        self,
+        widget_responses: list,
+        widget_groups: dict,
+        params_dict: dict,
+        transaction,
+    ) -> Generator:
+        max_workers = min(
+            len(widget_groups),
+            config.get_global("DASHBOARD_MAX_LOAD_WORKERS", DEFAULT_MAX_LOAD_WORKERS),
+        )
+        # Compatible cost queries of different data tables are sent as one
+        analyze_batch_mgr = AnalyzeBatchManager()
+
+        # The executor only exists while the generator runs, so none is left
+        # behind when the generator is never iterated or is closed early
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [
+                executor.submit(
+                    run_with_transaction,
+                    transaction,
+                    self._load_widget_group,
+                    widget_group,
+                    params_dict,
+                    analyze_batch_mgr,
+                )
+                for widget_group in widget_groups.values()
+            ]
+
+            yield from widget_responses
+
+            for future in as_completed(futures):
+                yield from future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _make_widget_error(widget_id: str, error: Exception) -> dict:
+        if not isinstance(error, ERROR_BASE):
+            error = ERROR_UNKNOWN(message=error)
+
+        return {
+            "widget_id": widget_id,
+            "error": {"error_code": error.error_code, "message": error.message},
+        }
+
+    @staticmethod
+    def _get_data_table_manager(
+        pri_data_table_vo,
+    ) -> Union[DataSourceManager, DataTransformationManager]:
+        if pri_data_table_vo.data_type == "ADDED":
+            return DataSourceManager(
+                "PRIVATE",
+                pri_data_table_vo.source_type,
+                pri_data_table_vo.options,
+                pri_data_table_vo.widget_id,
+                pri_data_table_vo.domain_id,
+            )
+        else:
+            operator = pri_data_table_vo.operator
+            return DataTransformationManager(
+                "PRIVATE",
+                operator,
+                pri_data_table_vo.options.get(operator, {}),
+                pri_data_table_vo.widget_id,
+                pri_data_table_vo.domain_id,
             )
 
     @transaction(
@@ -474,6 +720,7 @@ class PrivateWidgetService(BaseService):
                 params.end,
                 vars=params.vars,
                 column_sum=True,
+                data_table_vo=pri_data_table_vo,
             )
 
         else:
@@ -494,6 +741,7 @@ class PrivateWidgetService(BaseService):
                 params.end,
                 vars=params.vars,
                 column_sum=True,
+                data_table_vo=pri_data_table_vo,
             )
 
     @transaction(
@@ -525,7 +773,9 @@ class PrivateWidgetService(BaseService):
             params.user_id,
         )
 
-        return PrivateWidgetResponse(**pri_widget_vo.to_dict())
+        pri_widget_info = pri_widget_vo.to_dict()
+        self._add_data_table_variables([pri_widget_info], params.domain_id)
+        return PrivateWidgetResponse(**pri_widget_info)
 
     @transaction(
         permission="dashboard:PrivateWidget.read",
@@ -566,4 +816,29 @@ class PrivateWidgetService(BaseService):
         query = params.query or {}
         pri_widget_vos, total_count = self.pri_widget_mgr.list_private_widgets(query)
         pri_widgets_info = [pri_widget_vo.to_dict() for pri_widget_vo in pri_widget_vos]
+        self._add_data_table_variables(pri_widgets_info, params.domain_id)
         return PrivateWidgetsResponse(results=pri_widgets_info, total_count=total_count)
+
+    @staticmethod
+    def _add_data_table_variables(widgets_info: list, domain_id: str) -> None:
+        # Lets clients reload only the widgets affected by a changed variable
+        data_table_ids = [
+            widget_info["data_table_id"]
+            for widget_info in widgets_info
+            if widget_info.get("data_table_id")
+        ]
+
+        if not data_table_ids:
+            return
+
+        pri_data_table_mgr = PrivateDataTableManager()
+        variables_map = {
+            data_table_vo.data_table_id: data_table_vo.variables
+            for data_table_vo in pri_data_table_mgr.filter_private_data_tables(
+                data_table_id=data_table_ids, domain_id=domain_id
+            )
+        }
+
+        for widget_info in widgets_info:
+            data_table_id = widget_info.get("data_table_id")
+            widget_info["variables"] = variables_map.get(data_table_id)
@@ -1,5 +1,5 @@
 import logging
-from typing import Union
+from typing import Union, Generator
 
 from spaceone.core.service import *
 from spaceone.dashboard.manager.public_dashboard_manager import PublicDashboardManager
@@ -490,6 +490,44 @@ class PublicDashboardService(BaseService):
 
         self.pub_dashboard_mgr.delete_public_dashboard_by_vo(pub_dashboard_vo)
 
+    @transaction(
+        permission="dashboard:PublicDashboard.read",
+        role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
+    )
+    @change_value_by_rule("APPEND", "workspace_id", "*")
+    @change_value_by_rule("APPEND", "user_projects", "*")
+    @convert_model
+    def load_widgets(self, params: PublicDashboardLoadWidgetsRequest) -> Generator:
+        """Load all widgets of public dashboard
+
+        Args:
+            params (dict): {
+                'dashboard_id': 'str',          # required
+                'granularity': 'str',           # required
+                'start': 'str',                 # required
+                'end': 'str',                   # required
+                'vars': 'dict',
+                'widgets': 'list',              # widget_id, group_by, sort, page
+                'format': 'str',
+                'workspace_id': 'str',          # injected from auth
+                'domain_id': 'str'              # injected from auth (required)
+                'user_projects': 'list'         # injected from auth
+            }
+
+        Returns:
+            Generator: one message per widget as soon as it is loaded
+        """
+
+        self.pub_dashboard_mgr.get_public_dashboard(
+            params.dashboard_id,
+            params.domain_id,
+            params.workspace_id,
+            params.user_projects,
+        )
+
+        pub_widget_svc = PublicWidgetService()
+        return pub_widget_svc.load_dashboard_widgets(params.dict())
+
     @transaction(
         permission="dashboard:PublicDashboard.read",
         role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
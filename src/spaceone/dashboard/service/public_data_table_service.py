@@ -1,6 +1,7 @@
 import logging
 import copy
-from typing import Union
+from datetime import datetime
+from typing import Union, Generator
 
 from spaceone.core import cache
 from spaceone.core.service import *
@@ -14,7 +15,13 @@ from spaceone.dashboard.manager.data_table_manager.data_source_manager import (
 from spaceone.dashboard.manager.data_table_manager.data_transformation_manager import (
     DataTransformationManager,
 )
+from spaceone.dashboard.manager.data_table_manager.data_table_plan_manager import (
+    DataTablePlanManager,
+)
 from spaceone.dashboard.manager.cost_analysis_manager import CostAnalysisManager
+from spaceone.dashboard.manager.materialized_data_table_manager import (
+    MaterializedDataTableManager,
+)
 from spaceone.dashboard.model.public_data_table.request import *
 from spaceone.dashboard.model.public_data_table.response import *
 from spaceone.dashboard.model.public_data_table.database import PublicDataTable
@@ -50,6 +57,8 @@ class PublicDataTableService(BaseService):
                 'source_type': 'str',           # required
                 'options': 'dict',              # required
                 'vars': 'dict',
+                'validation': 'str',
+                'materialize': 'bool',
                 'tags': 'dict',
                 'workspace_id': 'str',          # injected from auth
                 'domain_id': 'str',             # injected from auth (required)
@@ -68,6 +77,7 @@ class PublicDataTableService(BaseService):
         source_type = params_dict.get("source_type")
         options = params_dict.get("options")
         vars = params_dict.get("vars")
+        validation = params_dict.get("validation")
         widget_id = params_dict.get("widget_id")
         domain_id = params_dict.get("domain_id")
         workspace_id = params_dict.get("workspace_id")
@@ -101,8 +111,8 @@ class PublicDataTableService(BaseService):
             domain_id,
         )
 
-        # Load data source to verify options
-        ds_mgr.load(vars=vars)
+        # Verify options, data is only fetched when requested
+        ds_mgr.validate(validation, vars)
 
         # Get data and labels info from options
         data_info, labels_info = ds_mgr.get_data_and_labels_info()
@@ -120,6 +130,11 @@ class PublicDataTableService(BaseService):
         if raw_filter:
             params_dict["options"]["filter"] = raw_filter
 
+        plan_mgr = DataTablePlanManager("PUBLIC", domain_id)
+        params_dict.update(
+            plan_mgr.make_lineage("ADDED", source_type, None, params_dict["options"])
+        )
+
         pub_data_table_vo = self.pub_data_table_mgr.create_public_data_table(
             params_dict
         )
@@ -169,6 +184,8 @@ class PublicDataTableService(BaseService):
                 'operator': 'str',              # required
                 'options': 'dict',              # required
                 'vars': 'dict',
+                'validation': 'str',
+                'materialize': 'bool',
                 'tags': 'dict',
                 'workspace_id': 'str',          # injected from auth
                 'domain_id': 'str',             # injected from auth (required)
@@ -188,6 +205,7 @@ class PublicDataTableService(BaseService):
         options = params_dict.get("options")
         operator_options = options.get(operator, {})
         vars = params_dict.get("vars")
+        validation = params_dict.get("validation")
         widget_id = params_dict.get("widget_id")
         domain_id = params_dict.get("domain_id")
         workspace_id = params_dict.get("workspace_id")
@@ -201,6 +219,10 @@ class PublicDataTableService(BaseService):
             user_projects,
         )
 
+        # Reject cycles and excessive depth before loading
+        plan_mgr = DataTablePlanManager("PUBLIC", domain_id)
+        lineage = plan_mgr.make_lineage("TRANSFORMED", None, operator, options)
+
         dt_mgr = DataTransformationManager(
             "PUBLIC",
             operator,
@@ -209,8 +231,8 @@ class PublicDataTableService(BaseService):
             domain_id,
         )
 
-        # Load data table to verify options
-        dt_mgr.load(vars=vars)
+        # Verify options, data is only fetched when requested
+        dt_mgr.validate(validation, vars)
 
         # Get data and labels info from options
         data_info, labels_info = dt_mgr.get_data_and_labels_info()
@@ -224,6 +246,7 @@ class PublicDataTableService(BaseService):
         params_dict["project_id"] = pub_widget_vo.project_id
         params_dict["state"] = dt_mgr.state
         params_dict["error_message"] = dt_mgr.error_message
+        params_dict.update(lineage)
 
         pub_data_table_vo = self.pub_data_table_mgr.create_public_data_table(
             params_dict
@@ -247,6 +270,8 @@ class PublicDataTableService(BaseService):
                 'name': 'str',
                 'options': 'dict',
                 'vars': 'dict',
+                'validation': 'str',
+                'materialize': 'bool',
                 'tags': 'dict',
                 'workspace_id': 'str',          # injected from auth
                 'domain_id': 'str'              # injected from auth (required)
@@ -268,8 +293,10 @@ class PublicDataTableService(BaseService):
 
         params_dict = params.dict(exclude_unset=True)
         vars = params_dict.get("vars")
+        validation = params_dict.get("validation")
 
         if options := params_dict.get("options"):
+            plan_mgr = DataTablePlanManager("PUBLIC", params.domain_id)
             raw_filter = copy.deepcopy(options.get("filter"))
 
             if pub_data_table_vo.data_type == "ADDED":
@@ -282,8 +309,8 @@ class PublicDataTableService(BaseService):
                     pub_data_table_vo.workspace_id,
                 )
 
-                # Load data source to verify options
-                ds_mgr.load(vars=vars)
+                # Verify options, data is only fetched when requested
+                ds_mgr.validate(validation, vars)
 
                 # Get ds_mgr state and error_message
                 params_dict["state"] = ds_mgr.state
@@ -308,6 +335,15 @@ class PublicDataTableService(BaseService):
             else:
                 operator = pub_data_table_vo.operator
                 operator_options = options.get(operator, {})
+                # Reject cycles and excessive depth before loading
+                lineage = plan_mgr.make_lineage(
+                    "TRANSFORMED",
+                    None,
+                    operator,
+                    {operator: operator_options},
+                    pub_data_table_vo.data_table_id,
+                )
+
                 dt_mgr = DataTransformationManager(
                     "PUBLIC",
                     operator,
@@ -316,8 +352,8 @@ class PublicDataTableService(BaseService):
                     pub_data_table_vo.domain_id,
                 )
 
-                # Load data table to verify options
-                dt_mgr.load(vars=vars)
+                # Verify options, data is only fetched when requested
+                dt_mgr.validate(validation, vars)
 
                 # Get data and labels info from options
                 data_info, labels_info = dt_mgr.get_data_and_labels_info()
@@ -333,19 +369,52 @@ class PublicDataTableService(BaseService):
                 # Get dt_mgr state and error_message
                 params_dict["state"] = dt_mgr.state
                 params_dict["error_message"] = dt_mgr.error_message
+                params_dict.update(lineage)
 
             if raw_filter:
                 params_dict["options"]["filter"] = raw_filter
 
+            if pub_data_table_vo.data_type == "ADDED":
+                params_dict.update(
+                    plan_mgr.make_lineage(
+                        "ADDED",
+                        pub_data_table_vo.source_type,
+                        None,
+                        params_dict["options"],
+                    )
+                )
+
         cache_key = (
             f"dashboard:widget:load:{params.domain_id}:{pub_data_table_vo.widget_id}:*"
         )
         cache.delete_pattern(cache_key)
+        cache.delete_pattern(
+            f"dashboard:data-table:plan:{params.domain_id}:{pub_data_table_vo.widget_id}:*"
+        )
+
+        materialized_mgr = MaterializedDataTableManager()
+        if params_dict.get("materialize") is None:
+            params_dict.pop("materialize", None)
+        elif params_dict["materialize"] is False:
+            materialized_mgr.delete_materialized_data_tables(
+                data_table_id=pub_data_table_vo.data_table_id,
+                domain_id=params.domain_id,
+            )
+
+        if params_dict.get("options"):
+            materialized_mgr.expire_materialized_data_tables(
+                widget_id=pub_data_table_vo.widget_id, domain_id=params.domain_id
+            )
 
         pub_data_table_vo = self.pub_data_table_mgr.update_public_data_table_by_vo(
             params_dict, pub_data_table_vo
         )
 
+        # Descendant JOINs name the duplicated columns after this data table
+        if params_dict.get("options") or params_dict.get("name"):
+            plan_mgr = DataTablePlanManager("PUBLIC", params.domain_id)
+            plan_mgr.update_descendant_lineages(pub_data_table_vo)
+
         return PublicDataTableResponse(**pub_data_table_vo.to_dict())
 
     @transaction(
@@ -381,6 +450,17 @@ class PublicDataTableService(BaseService):
             f"dashboard:Widget:load:{params.domain_id}:{pub_data_table_vo.widget_id}:*"
         )
         cache.delete_pattern(cache_key)
+        cache.delete_pattern(
+            f"dashboard:data-table:plan:{params.domain_id}:{pub_data_table_vo.widget_id}:*"
+        )
+
+        materialized_mgr = MaterializedDataTableManager()
+        materialized_mgr.delete_materialized_data_tables(
+            data_table_id=pub_data_table_vo.data_table_id, domain_id=params.domain_id
+        )
+        materialized_mgr.expire_materialized_data_tables(
+            widget_id=pub_data_table_vo.widget_id, domain_id=params.domain_id
+        )
 
         self.pub_data_table_mgr.delete_public_data_table_by_vo(pub_data_table_vo)
 
@@ -403,6 +483,8 @@ class PublicDataTableService(BaseService):
                 'sort': 'list',
                 'page': 'dict',
                 'vars': 'dict',
+                'preview': 'bool',
+                'format': 'str',
                 'workspace_id': 'str',          # injected from auth
                 'domain_id': 'str'              # injected from auth (required)
                 'user_projects': 'list'         # injected from auth
@@ -412,6 +494,45 @@ class PublicDataTableService(BaseService):
             None
         """
 
+        data_table_mgr = self._load_data_table(params)
+        return data_table_mgr.response_data(params.sort, params.page, params.format)
+
+    @transaction(
+        permission="dashboard:PublicDataTable.read",
+        role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
+    )
+    @change_value_by_rule("APPEND", "workspace_id", "*")
+    @change_value_by_rule("APPEND", "user_projects", "*")
+    @convert_model
+    def load_stream(self, params: PublicDataTableLoadRequest) -> Generator:
+        """Load public data table as a stream of messages
+
+        Args:
+            params (dict): {
+                'data_table_id': 'str',         # required
+                'granularity': 'str',           # required
+                'start': 'str',
+                'end': 'str',
+                'sort': 'list',
+                'page': 'dict',
+                'vars': 'dict',
+                'preview': 'bool',
+                'workspace_id': 'str',          # injected from auth
+                'domain_id': 'str'              # injected from auth (required)
+                'user_projects': 'list'         # injected from auth
+            }
+
+        Returns:
+            Generator: a header with total_count, labels_info, data_info and
+                order, followed by chunks of results
+        """
+
+        data_table_mgr = self._load_data_table(params)
+        return data_table_mgr.stream_response_data(params.sort, params.page)
+
+    def _load_data_table(
+        self, params: PublicDataTableLoadRequest
+    ) -> Union[DataSourceManager, DataTransformationManager]:
         pub_data_table_vo: PublicDataTable = (
             self.pub_data_table_mgr.get_public_data_table(
                 params.data_table_id,
@@ -426,54 +547,166 @@ class PublicDataTableService(BaseService):
                 data_table_id=pub_data_table_vo.data_table_id
             )
 
-        if pub_data_table_vo.data_type == "ADDED":
-            ds_mgr = DataSourceManager(
-                "PUBLIC",
-                pub_data_table_vo.source_type,
-                pub_data_table_vo.options,
-                pub_data_table_vo.widget_id,
-                pub_data_table_vo.domain_id,
+        data_table_mgr = self._get_data_table_manager(pub_data_table_vo)
+
+        if params.preview:
+            data_table_mgr.preview(
+                params.granularity,
+                params.start,
+                params.end,
+                params.vars,
             )
-            ds_mgr.load(
+        elif pub_data_table_vo.materialize:
+            data_table_mgr.load_materialized(
+                pub_data_table_vo,
+                params.granularity,
+                params.start,
+                params.end,
+                params.vars,
+            )
+        else:
+            data_table_mgr.load(
                 params.granularity,
                 params.start,
                 params.end,
                 params.vars,
             )
 
-            if ds_mgr.state == "UNAVAILABLE":
-                raise ERROR_UNAVAILABLE_DATA_TABLE(
-                    data_table_id=pub_data_table_vo.data_table_id
-                )
+        if data_table_mgr.state == "UNAVAILABLE":
+            raise ERROR_UNAVAILABLE_DATA_TABLE(
+                data_table_id=pub_data_table_vo.data_table_id
+            )
 
-            return ds_mgr.response_data(params.sort, params.page)
+        return data_table_mgr
 
+    @transaction(
+        permission="dashboard:PublicDataTable.read",
+        role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
+    )
+    @change_value_by_rule("APPEND", "workspace_id", "*")
+    @change_value_by_rule("APPEND", "user_projects", "*")
+    @convert_model
+    def explain(self, params: PublicDataTableExplainRequest) -> dict:
+        """Explain public data table
+
+        Args:
+            params (dict): {
+                'data_table_id': 'str',         # required
+                'granularity': 'str',           # required
+                'start': 'str',
+                'end': 'str',
+                'sort': 'list',
+                'page': 'dict',
+                'vars': 'dict',
+                'workspace_id': 'str',          # injected from auth
+                'domain_id': 'str'              # injected from auth (required)
+                'user_projects': 'list'         # injected from auth
+            }
+
+        Returns:
+            dict: executed plan with per-node wall time, remote time, rows, columns and memory
+        """
+
+        pub_data_table_vo: PublicDataTable = (
+            self.pub_data_table_mgr.get_public_data_table(
+                params.data_table_id,
+                params.domain_id,
+                params.workspace_id,
+                params.user_projects,
+            )
+        )
+
+        data_table_mgr = self._get_data_table_manager(pub_data_table_vo)
+        explain_info = data_table_mgr.explain(
+            params.granularity,
+            params.start,
+            params.end,
+            params.vars,
+            params.sort,
+            params.page,
+        )
+        explain_info["data_table_id"] = pub_data_table_vo.data_table_id
+
+        return explain_info
+
+    @staticmethod
+    def _get_data_table_manager(
+        pub_data_table_vo: PublicDataTable,
+    ) -> Union[DataSourceManager, DataTransformationManager]:
+        if pub_data_table_vo.data_type == "ADDED":
+            return DataSourceManager(
+                "PUBLIC",
+                pub_data_table_vo.source_type,
+                pub_data_table_vo.options,
+                pub_data_table_vo.widget_id,
+                pub_data_table_vo.domain_id,
+            )
         else:
             operator = pub_data_table_vo.operator
-            options = pub_data_table_vo.options.get(operator, {})
-            widget_id = pub_data_table_vo.widget_id
-            domain_id = pub_data_table_vo.domain_id
-
-            dt_mgr = DataTransformationManager(
+            return DataTransformationManager(
                 "PUBLIC",
                 operator,
-                options,
-                widget_id,
-                domain_id,
-            )
-            dt_mgr.load(
-                params.granularity,
-                params.start,
-                params.end,
-                params.vars,
+                pub_data_table_vo.options.get(operator, {}),
+                pub_data_table_vo.widget_id,
+                pub_data_table_vo.domain_id,
             )
 
-            if dt_mgr.state == "UNAVAILABLE":
-                raise ERROR_UNAVAILABLE_DATA_TABLE(
-                    data_table_id=pub_data_table_vo.data_table_id
+    @transaction(exclude=["authentication", "authorization", "mutation"])
+    def refresh_materialized_data_tables(self, params: dict) -> None:
+        """Refresh materialized public data tables which are older than refresh interval
+        and delete the ones which are expired or have not been read within the TTL
+
+        Args:
+            params (dict): {}
+
+        Returns:
+            None
+        """
+
+        materialized_mgr = MaterializedDataTableManager()
+        refreshed_at = datetime.utcnow() - materialized_mgr.get_refresh_interval()
+        materialized_vos = materialized_mgr.filter_materialized_data_tables(
+            data_table_type="PUBLIC",
+            state="AVAILABLE",
+            refreshed_at__lt=refreshed_at,
+            read_at__gte=materialized_mgr.get_read_after(),
+        )
+
+        for materialized_vo in materialized_vos:
+            try:
+                self.refresh_materialized_data_table(materialized_vo)
+            except Exception as e:
+                _LOGGER.error(
+                    f"[refresh_materialized_data_tables] refresh error "
+                    f"({materialized_vo.data_table_id}): {e}",
+                    exc_info=True,
                 )
 
-            return dt_mgr.response_data(params.sort, params.page)
+        materialized_mgr.delete_unused_materialized_data_tables("PUBLIC")
+
+    def refresh_materialized_data_table(self, materialized_vo) -> None:
+        materialized_mgr = MaterializedDataTableManager()
+        pub_data_table_vo = self.pub_data_table_mgr.filter_public_data_tables(
+            data_table_id=materialized_vo.data_table_id,
+            domain_id=materialized_vo.domain_id,
+        ).first()
+
+        if pub_data_table_vo is None or not pub_data_table_vo.materialize:
+            materialized_vo.delete()
+            return
+
+        # Only domain-wide results can be reproduced with the system token.
+        # The others are recomputed by the next load with the caller's token.
+        if materialized_vo.role_type != "DOMAIN_ADMIN":
+            materialized_mgr.update_materialized_data_table_by_vo(
+                {"state": "EXPIRED"}, materialized_vo
+            )
+            return
+
+        self.transaction.set_meta("x_domain_id", materialized_vo.domain_id)
+
+        data_table_mgr = self._get_data_table_manager(pub_data_table_vo)
+        data_table_mgr.refresh_materialized(materialized_vo)
 
     @transaction(
         permission="dashboard:PublicDataTable.read",
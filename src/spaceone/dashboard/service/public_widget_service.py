@@ -1,10 +1,17 @@
 import logging
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Union, Generator
 
+from spaceone.core import config
+from spaceone.core.error import ERROR_BASE, ERROR_NOT_FOUND, ERROR_UNKNOWN
 from spaceone.core.service import *
 from spaceone.dashboard.manager.public_widget_manager import PublicWidgetManager
 from spaceone.dashboard.manager.public_dashboard_manager import PublicDashboardManager
 from spaceone.dashboard.manager.public_data_table_manager import PublicDataTableManager
+from spaceone.dashboard.manager.data_table_manager import run_with_transaction
+from spaceone.dashboard.manager.data_table_manager.analyze_batch_manager import (
+    AnalyzeBatchManager,
+)
 from spaceone.dashboard.manager.data_table_manager.data_source_manager import (
     DataSourceManager,
 )
@@ -23,6 +30,8 @@ from spaceone.dashboard.service.public_data_table_service import PublicDataTable
 
 _LOGGER = logging.getLogger(__name__)
 
+DEFAULT_MAX_LOAD_WORKERS = 4
+
 
 @authentication_handler
 @authorization_handler
@@ -368,6 +377,7 @@ class PublicWidgetService(BaseService):
                 'sort': 'list',
                 'page': 'dict',
                 'vars': 'dict',
+                'format': 'str',
                 'workspace_id': 'str',          # injected from auth
                 'domain_id': 'str'              # injected from auth (required)
                 'user_projects': 'list'         # injected from auth
@@ -377,6 +387,43 @@ class PublicWidgetService(BaseService):
             None
         """
 
+        return self._load_widget(params)
+
+    @transaction(
+        permission="dashboard:PublicWidget.write",
+        role_types=["DOMAIN_ADMIN", "WORKSPACE_OWNER", "WORKSPACE_MEMBER"],
+    )
+    @change_value_by_rule("APPEND", "workspace_id", "*")
+    @change_value_by_rule("APPEND", "user_projects", "*")
+    @convert_model
+    def load_stream(self, params: PublicWidgetLoadRequest) -> Generator:
+        """Load public widget as a stream of messages
+
+        Args:
+            params (dict): {
+                'widget_id': 'str',             # required
+                'granularity': 'str',           # required
+                'start': 'str',                 # required
+                'end': 'str',                   # required
+                'group_by': 'list',
+                'sort': 'list',
+                'page': 'dict',
+                'vars': 'dict',
+                'workspace_id': 'str',          # injected from auth
+                'domain_id': 'str'              # injected from auth (required)
+                'user_projects': 'list'         # injected from auth
+            }
+
+        Returns:
+            Generator: a header with total_count, labels_info, data_info and
+                order, followed by chunks of results
+        """
+
+        return self._load_widget(params, stream=True)
+
+    def _load_widget(
+        self, params: PublicWidgetLoadRequest, stream: bool = False
+    ) -> Union[dict, Generator]:
         pub_widget_vo: PublicWidget = self.pub_widget_mgr.get_public_widget(
             params.widget_id,
             params.domain_id,
@@ -414,6 +461,9 @@ class PublicWidgetService(BaseService):
                 params.sort,
                 params.page,
                 params.vars,
+                data_table_vo=pub_data_table_vo,
+                response_format=params.format,
+                stream=stream,
             )
 
         else:
@@ -436,6 +486,204 @@ class PublicWidgetService(BaseService):
                 params.sort,
                 params.page,
                 params.vars,
+                data_table_vo=pub_data_table_vo,
+                response_format=params.format,
+                stream=stream,
+            )
+
+    def load_dashboard_widgets(self, params_dict: dict) -> Generator:
+        """Loads the widgets of a dashboard, each data table once.
+
+        Widgets whose data tables have the same definition (dag_hash) share a
+        single load and the data tables are loaded in parallel. A message is
+        yielded for each widget as soon as its data table is loaded, with
+        the widget_id and either the load response or an error.
+        """
+
+        dashboard_id = params_dict["dashboard_id"]
+        domain_id = params_dict["domain_id"]
+        widget_options = {}
+        for widget in params_dict.get("widgets") or []:
+            if not widget.get("widget_id"):
+                raise ERROR_REQUIRED_PARAMETER(key="widgets.widget_id")
+
+            widget_options[widget["widget_id"]] = widget
+
+        conditions = {"dashboard_id": dashboard_id, "domain_id": domain_id}
+        if workspace_id := params_dict.get("workspace_id"):
+            conditions["workspace_id"] = workspace_id
+
+        if user_projects := params_dict.get("user_projects"):
+            conditions["project_id"] = user_projects
+
+        if widget_options:
+            conditions["widget_id"] = list(widget_options.keys())
+
+        pub_widget_vos = list(self.pub_widget_mgr.filter_public_widgets(**conditions))
+
+        data_table_ids = list(
+            {
+                pub_widget_vo.data_table_id
+                for pub_widget_vo in pub_widget_vos
+                if pub_widget_vo.data_table_id
+            }
+        )
+        conditions.pop("dashboard_id")
+        conditions.pop("widget_id", None)
+        pub_data_table_mgr = PublicDataTableManager()
+        data_table_map = {
+            data_table_vo.data_table_id: data_table_vo
+            for data_table_vo in pub_data_table_mgr.filter_public_data_tables(
+                data_table_id=data_table_ids, **conditions
+            )
+        }
+
+        widget_responses = []
+        widget_groups = {}
+        for pub_widget_vo in pub_widget_vos:
+            widget_id = pub_widget_vo.widget_id
+            data_table_id = pub_widget_vo.data_table_id
+
+            if data_table_id is None:
+                error = ERROR_INVALID_PARAMETER(
+                    key="widget_id", reason="Data table is not set."
+                )
+                widget_responses.append(self._make_widget_error(widget_id, error))
+                continue
+
+            if data_table_id not in data_table_map:
+                error = ERROR_NOT_FOUND(key="data_table_id", value=data_table_id)
+                widget_responses.append(self._make_widget_error(widget_id, error))
+                continue
+
+            data_table_vo = data_table_map[data_table_id]
+            if data_table_vo.materialize or data_table_vo.dag_hash is None:
+                group_key = data_table_id
+            else:
+                group_key = data_table_vo.dag_hash
+
+            widget_groups.setdefault(
+                group_key, {"data_table_vo": data_table_vo, "widgets": []}
+            )
+            # Responses are cached for the data table of each widget
+            widget_groups[group_key]["widgets"].append(
+                {
+                    **widget_options.get(widget_id, {"widget_id": widget_id}),
+                    "data_table_id": data_table_id,
+                    "data_table_widget_id": data_table_vo.widget_id,
+                }
+            )
+
+        if not widget_groups:
+            return iter(widget_responses)
+
+        return self._generate_widget_responses(
+            widget_responses, widget_groups, params_dict, self.transaction
+        )
+
+    def _load_widget_group(
+        self,
+        widget_group: dict,
+        params_dict: dict,
+        analyze_batch_mgr: AnalyzeBatchManager = None,
+    ) -> list:
+        data_table_vo = widget_group["data_table_vo"]
+        widgets = widget_group["widgets"]
+
+        try:
+            data_table_mgr = self._get_data_table_manager(data_table_vo)
+            data_table_mgr.analyze_batch_mgr = analyze_batch_mgr
+            responses = data_table_mgr.load_from_widgets(
+                data_table_vo.data_table_id,
+                widgets,
+                params_dict["granularity"],
+                params_dict["start"],
+                params_dict["end"],
+                params_dict.get("vars"),
+                data_table_vo=data_table_vo,
+                response_format=params_dict.get("format"),
+            )
+        except Exception as e:
+            _LOGGER.error(
+                f"[_load_widget_group] failed to load data table: "
+                f"{data_table_vo.data_table_id} ({e})",
+                exc_info=True,
+            )
+            return [
+                self._make_widget_error(widget["widget_id"], e) for widget in widgets
+            ]
+
+        return [
+            {"widget_id": widget_id, **response} for widget_id, response in responses
+        ]
+
+    def _generate_widget_responses(
+        self,
+        widget_responses: list,
+        widget_groups: dict,
+        params_dict: dict,
+        transaction,
+    ) -> Generator:
+        max_workers = min(
+            len(widget_groups),
+            config.get_global("DASHBOARD_MAX_LOAD_WORKERS", DEFAULT_MAX_LOAD_WORKERS),
+        )
+        # Compatible cost queries of different data tables are sent as one
+        analyze_batch_mgr = AnalyzeBatchManager()
+
+        # The executor only exists while the generator runs, so none is left
+        # behind when the generator is never iterated or is closed early
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            futures = [
+                executor.submit(
+                    run_with_transaction,
+                    transaction,
+                    self._load_widget_group,
+                    widget_group,
+                    params_dict,
+                    analyze_batch_mgr,
+                )
+                for widget_group in widget_groups.values()
+            ]
+
+            yield from widget_responses
+
+            for future in as_completed(futures):
+                yield from future.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _make_widget_error(widget_id: str, error: Exception) -> dict:
+        if not isinstance(error, ERROR_BASE):
+            error = ERROR_UNKNOWN(message=error)
+
+        return {
+            "widget_id": widget_id,
+            "error": {"error_code": error.error_code, "message": error.message},
+        }
+
+    @staticmethod
+    def _get_data_table_manager(
+        pub_data_table_vo,
+    ) -> Union[DataSourceManager, DataTransformationManager]:
+        if pub_data_table_vo.data_type == "ADDED":
+            return DataSourceManager(
+                "PUBLIC",
+                pub_data_table_vo.source_type,
+                pub_data_table_vo.options,
+                pub_data_table_vo.widget_id,
+                pub_data_table_vo.domain_id,
+            )
+        else:
+            operator = pub_data_table_vo.operator
+            return DataTransformationManager(
+                "PUBLIC",
+                operator,
+                pub_data_table_vo.options.get(operator, {}),
+                pub_data_table_vo.widget_id,
+                pub_data_table_vo.domain_id,
             )
 
     @transaction(
@@ -499,6 +747,7 @@ class PublicWidgetService(BaseService):
                 params.end,
                 vars=params.vars,
                 column_sum=True,
+                data_table_vo=pub_data_table_vo,
             )
 
         else:
@@ -519,6 +768,7 @@ class PublicWidgetService(BaseService):
                 params.end,
                 vars=params.vars,
                 column_sum=True,
+                data_table_vo=pub_data_table_vo,
             )
 
     @transaction(
@@ -550,7 +800,9 @@ class PublicWidgetService(BaseService):
             params.user_projects,
         )
 
-        return PublicWidgetResponse(**pub_widget_vo.to_dict())
+        pub_widget_info = pub_widget_vo.to_dict()
+        self._add_data_table_variables([pub_widget_info], params.domain_id)
+        return PublicWidgetResponse(**pub_widget_info)
 
     @transaction(
         permission="dashboard:PublicWidget.read",
@@ -595,4 +847,29 @@ class PublicWidgetService(BaseService):
         query = params.query or {}
         pub_widget_vos, total_count = self.pub_widget_mgr.list_public_widgets(query)
         pub_widgets_info = [pub_widget_vo.to_dict() for pub_widget_vo in pub_widget_vos]
+        self._add_data_table_variables(pub_widgets_info, params.domain_id)
         return PublicWidgetsResponse(results=pub_widgets_info, total_count=total_count)
+
+    @staticmethod
+    def _add_data_table_variables(widgets_info: list, domain_id: str) -> None:
+        # Lets clients reload only the widgets affected by a changed variable
+        data_table_ids = [
+            widget_info["data_table_id"]
+            for widget_info in widgets_info
+            if widget_info.get("data_table_id")
+        ]
+
+        if not data_table_ids:
+            return
+
+        pub_data_table_mgr = PublicDataTableManager()
+        variables_map = {
+            data_table_vo.data_table_id: data_table_vo.variables
+            for data_table_vo in pub_data_table_mgr.filter_public_data_tables(
+                data_table_id=data_table_ids, domain_id=domain_id
+            )
+        }
+
+        for widget_info in widgets_info:
+            data_table_id = widget_info.get("data_table_id")
+            widget_info["variables"] = variables_map.get(data_table_id)
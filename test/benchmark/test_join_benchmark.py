@@ -0,0 +1,55 @@
+"""Benchmark of the JOIN operator at 10k, 100k and 1M rows.
+
+A cost table (2 keys, 2 labels, 2 data fields) is joined with an asset
+count table holding half of its key combinations.
+
+Run with: DASHBOARD_BENCHMARK=1 python -m pytest -s test/benchmark
+"""
+
+import os
+import time
+
+import pandas.testing as pdt
+import pytest
+
+from spaceone.dashboard.manager.data_table_manager.data_transformation_manager import (
+    DataTransformationManager,
+)
+
+from test.test_join_operator import LegacyJoinManager, make_join_frames, run_join
+from test.transformation_utils import normalize
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("DASHBOARD_BENCHMARK"),
+    reason="set DASHBOARD_BENCHMARK=1 to run benchmarks",
+)
+
+REPEAT = 3
+
+
+def _best_time(data_frames: list, how: str, manager_class: type) -> tuple:
+    best_time = None
+    for _ in range(REPEAT):
+        start_time = time.perf_counter()
+        dt_mgr = run_join(data_frames, how, manager_class=manager_class)
+        elapsed_time = time.perf_counter() - start_time
+        if best_time is None or elapsed_time < best_time:
+            best_time = elapsed_time
+
+    return best_time, dt_mgr.df
+
+
+@pytest.mark.parametrize("row_count", [10_000, 100_000, 1_000_000])
+@pytest.mark.parametrize("how", ["left", "inner", "outer"])
+def test_join_benchmark(row_count, how):
+    data_frames = make_join_frames(row_count)
+
+    legacy_time, legacy_df = _best_time(data_frames, how, LegacyJoinManager)
+    new_time, new_df = _best_time(data_frames, how, DataTransformationManager)
+
+    print(
+        f"\n{how} join x {row_count} rows: "
+        f"before {legacy_time * 1000:.1f} ms, after {new_time * 1000:.1f} ms"
+    )
+
+    pdt.assert_frame_equal(normalize(new_df), normalize(legacy_df))
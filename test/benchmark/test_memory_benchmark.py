@@ -0,0 +1,167 @@
+"""Peak traced memory of the load and response paths at 200k rows.
+
+Each case runs the previous implementation and the current one on the same
+frame and compares the tracemalloc peaks.
+
+Run with: DASHBOARD_BENCHMARK=1 python -m pytest -s test/benchmark
+"""
+
+import os
+import tracemalloc
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from spaceone.dashboard.manager.data_table_manager import DataTableManager
+from spaceone.dashboard.manager.data_table_manager.data_source_manager import (
+    DataSourceManager,
+)
+
+from test.test_data_source_manager import make_data_source_manager
+from test.transformation_utils import make_cost_df
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("DASHBOARD_BENCHMARK"),
+    reason="set DASHBOARD_BENCHMARK=1 to run benchmarks",
+)
+
+ROW_COUNT = 200_000
+LABEL_KEYS = ["Date", "provider", "region", "product"]
+
+
+def _measure_peak(func: Callable) -> int:
+    tracemalloc.start()
+    try:
+        result = func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return peak
+
+
+def _report(name: str, before: int, after: int) -> None:
+    print(
+        f"\n{name} x {ROW_COUNT} rows: "
+        f"before {before / 2**20:.1f} MB, after {after / 2**20:.1f} MB"
+    )
+
+
+def legacy_decode_labels(df: pd.DataFrame, columns: list = None) -> pd.DataFrame:
+    """decode_labels before it stopped deep copying the frame."""
+
+    df = df.copy(deep=True)
+    for column in columns or df.columns:
+        if column in df.columns and isinstance(df[column].dtype, pd.CategoricalDtype):
+            decoded = df[column].astype(object)
+            df[column] = decoded.where(decoded.notna(), None)
+
+    return df
+
+
+class LegacyTimediffManager(DataSourceManager):
+    def _apply_timediff(
+        self, granularity: str, start: str, end: str, vars: dict
+    ) -> pd.DataFrame:
+        # The previous implementation kept a full copy of the source frame
+        self.df = self.df.copy()
+        return super()._apply_timediff(granularity, start, end, vars)
+
+
+def _make_timediff_manager(
+    manager_class: type, origin_df: pd.DataFrame, diff_df: pd.DataFrame
+) -> DataSourceManager:
+    ds_mgr = make_data_source_manager({"months": 1})
+    ds_mgr.__class__ = manager_class
+    ds_mgr.source_type = "COST"
+    ds_mgr.data_name = "cost"
+    ds_mgr.timediff_data_name = "last_month_cost"
+    ds_mgr.df = origin_df
+
+    def analyze_cost(granularity, start, end, vars):
+        ds_mgr.df = diff_df.copy(deep=False)
+
+    ds_mgr._analyze_cost = analyze_cost
+    return ds_mgr
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+def test_decode_labels_memory(categorical):
+    df = make_cost_df(ROW_COUNT, with_nan=True)
+    if categorical:
+        df = DataTableManager.encode_labels(df, LABEL_KEYS)
+
+    before = _measure_peak(lambda: legacy_decode_labels(df))
+    after = _measure_peak(lambda: DataTableManager.decode_labels(df))
+
+    _report(f"decode_labels categorical={categorical}", before, after)
+    pd.testing.assert_frame_equal(
+        DataTableManager.decode_labels(df), legacy_decode_labels(df)
+    )
+    assert after <= before
+
+
+def test_timediff_memory():
+    # Analyze results have one row per label combination
+    resource_ids = [f"resource-{index}" for index in range(ROW_COUNT)]
+    origin_df = make_cost_df(ROW_COUNT, with_nan=False).drop(columns=["usage"])
+    origin_df["resource_id"] = resource_ids
+    diff_df = make_cost_df(ROW_COUNT, with_nan=False, seed=1).drop(columns=["usage"])
+    diff_df["resource_id"] = resource_ids
+
+    def apply_timediff(manager_class: type) -> pd.DataFrame:
+        ds_mgr = _make_timediff_manager(manager_class, origin_df, diff_df)
+        return ds_mgr._apply_timediff("MONTHLY", "2024-01", "2024-03", {})
+
+    peaks = {}
+    for manager_class in [LegacyTimediffManager, DataSourceManager]:
+        peaks[manager_class] = _measure_peak(lambda: apply_timediff(manager_class))
+
+    before = peaks[LegacyTimediffManager]
+    after = peaks[DataSourceManager]
+    _report("_apply_timediff", before, after)
+    pd.testing.assert_frame_equal(
+        apply_timediff(DataSourceManager), apply_timediff(LegacyTimediffManager)
+    )
+    assert after <= before
+
+
+def test_concat_fill_memory():
+    df = make_cost_df(ROW_COUNT, with_nan=True)
+    fill_na = {key: 0 for key in ["cost", "usage"]}
+    fill_na.update({key: "" for key in LABEL_KEYS})
+
+    def fill_in_place():
+        filled_df = df.copy(deep=False)
+        filled_df.fillna(value=fill_na, inplace=True)
+        return filled_df
+
+    before = _measure_peak(fill_in_place)
+    after = _measure_peak(lambda: DataTableManager.fill_na_values(df, fill_na))
+
+    _report("CONCAT fill (in place -> fill_na_values)", before, after)
+    pd.testing.assert_frame_equal(
+        DataTableManager.fill_na_values(df, fill_na), fill_in_place()
+    )
+    assert after <= before
+
+
+def test_join_fill_memory():
+    # A left join only leaves gaps in the columns of the right input
+    df = make_cost_df(ROW_COUNT, with_nan=False)
+    df["other_cost"] = df["cost"].where(np.arange(ROW_COUNT) % 3 != 0)
+    fill_all = {key: 0 for key in ["cost", "usage", "other_cost"]}
+    fill_all.update({key: "" for key in LABEL_KEYS})
+    fill_gaps = {"other_cost": 0}
+
+    before = _measure_peak(lambda: df.fillna(value=fill_all))
+    after = _measure_peak(lambda: DataTableManager.fill_na_values(df, fill_gaps))
+
+    _report("JOIN fill (all columns -> gap columns)", before, after)
+    pd.testing.assert_frame_equal(
+        DataTableManager.fill_na_values(df, fill_gaps), df.fillna(value=fill_all)
+    )
+    assert after <= before
@@ -0,0 +1,57 @@
+"""Benchmark of the timediff date shift at 100k rows.
+
+Run with: DASHBOARD_BENCHMARK=1 python -m pytest -s test/benchmark
+"""
+
+import os
+import time
+
+import pandas as pd
+import pytest
+
+from test.test_data_source_manager import (
+    change_date_by_relativedelta,
+    make_data_source_manager,
+)
+
+pytestmark = pytest.mark.skipif(
+    not os.environ.get("DASHBOARD_BENCHMARK"),
+    reason="set DASHBOARD_BENCHMARK=1 to run benchmarks",
+)
+
+ROW_COUNT = 100_000
+
+
+def _make_dates(granularity: str) -> pd.Series:
+    if granularity == "DAILY":
+        periods = pd.date_range("2024-01-01", periods=365, freq="D")
+        distinct_dates = periods.strftime("%Y-%m-%d")
+    else:
+        periods = pd.date_range("2015-01-01", periods=120, freq="MS")
+        distinct_dates = periods.strftime("%Y-%m")
+
+    return pd.Series(distinct_dates).sample(ROW_COUNT, replace=True, random_state=0)
+
+
+@pytest.mark.parametrize("granularity", ["DAILY", "MONTHLY"])
+@pytest.mark.parametrize("timediff", [{"months": 1}, {"months": 13}, {"years": 1}])
+def test_timediff_benchmark(granularity, timediff):
+    dates = _make_dates(granularity)
+    ds_mgr = make_data_source_manager(timediff)
+
+    start_time = time.perf_counter()
+    expected = dates.apply(lambda date: change_date_by_relativedelta(date, timediff))
+    per_row_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    result = ds_mgr._change_dates_by_timediff(dates)
+    vectorized_time = time.perf_counter() - start_time
+
+    print(
+        f"\n{granularity} {timediff} x {ROW_COUNT} rows: "
+        f"per row {per_row_time * 1000:.0f} ms, "
+        f"vectorized {vectorized_time * 1000:.0f} ms"
+    )
+
+    assert result.tolist() == expected.tolist()
+    assert vectorized_time < per_row_time
@@ -0,0 +1,137 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from spaceone.dashboard.manager.data_table_manager import analyze_batch_manager
+from spaceone.dashboard.manager.data_table_manager.analyze_batch_manager import (
+    AnalyzeBatchManager,
+)
+
+WINDOW = 2.0  # seconds, long enough to tell a full wait from an early dispatch
+
+
+class FakeCostAnalysisManager:
+    """Answers Cost.analyze with a row per provider, valued by the field key."""
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def analyze_cost(self, params: dict) -> dict:
+        with self.lock:
+            self.calls.append(params)
+
+        fields = params["query"]["fields"]
+        return {
+            "results": [
+                {
+                    "provider": provider,
+                    **{
+                        name: index + len(field["key"])
+                        for name, field in fields.items()
+                    },
+                }
+                for index, provider in enumerate(["aws", "google"])
+            ]
+        }
+
+
+def _make_params(data_name: str) -> dict:
+    return {
+        "data_source_id": "ds-test",
+        "query": {
+            "granularity": "MONTHLY",
+            "group_by": ["provider"],
+            "fields": {data_name: {"key": data_name, "operator": "sum"}},
+        },
+    }
+
+
+def _make_batch_mgr(expected_callers: int = None) -> AnalyzeBatchManager:
+    with mock.patch.object(
+        analyze_batch_manager, "CostAnalysisManager", FakeCostAnalysisManager
+    ):
+        batch_mgr = AnalyzeBatchManager(expected_callers=expected_callers)
+
+    batch_mgr.window = WINDOW
+    return batch_mgr
+
+
+def _analyze_concurrently(batch_mgr: AnalyzeBatchManager, data_names: list) -> list:
+    with ThreadPoolExecutor(max_workers=len(data_names)) as executor:
+        futures = [
+            executor.submit(batch_mgr.analyze_cost, _make_params(data_name))
+            for data_name in data_names
+        ]
+        return [future.result() for future in futures]
+
+
+def test_dispatches_once_every_expected_caller_has_joined():
+    batch_mgr = _make_batch_mgr(expected_callers=3)
+    data_names = ["cost", "usage_quantity", "usage_cost"]
+
+    start_time = time.perf_counter()
+    responses = _analyze_concurrently(batch_mgr, data_names)
+    elapsed_time = time.perf_counter() - start_time
+
+    assert elapsed_time < WINDOW / 2
+    assert len(batch_mgr.cost_analysis_mgr.calls) == 1
+    for data_name, response in zip(data_names, responses):
+        assert response["results"] == [
+            {"provider": "aws", data_name: len(data_name)},
+            {"provider": "google", data_name: 1 + len(data_name)},
+        ]
+
+
+def test_single_expected_caller_does_not_wait():
+    batch_mgr = _make_batch_mgr(expected_callers=1)
+
+    start_time = time.perf_counter()
+    response = batch_mgr.analyze_cost(_make_params("cost"))
+
+    assert time.perf_counter() - start_time < WINDOW / 2
+    assert [row["cost"] for row in response["results"]] == [4, 5]
+
+
+def test_released_caller_is_not_waited_for():
+    batch_mgr = _make_batch_mgr(expected_callers=2)
+
+    # The other load finishes without calling analyze_cost
+    threading.Timer(0.1, batch_mgr.release).start()
+
+    start_time = time.perf_counter()
+    batch_mgr.analyze_cost(_make_params("cost"))
+
+    assert time.perf_counter() - start_time < WINDOW / 2
+    assert len(batch_mgr.cost_analysis_mgr.calls) == 1
+
+
+def test_unknown_callers_wait_for_the_window():
+    batch_mgr = _make_batch_mgr()
+    batch_mgr.window = 0.2
+
+    start_time = time.perf_counter()
+    _analyze_concurrently(batch_mgr, ["cost", "usage_quantity"])
+
+    assert time.perf_counter() - start_time >= 0.2
+    assert len(batch_mgr.cost_analysis_mgr.calls) == 1
+
+
+def test_incompatible_queries_are_not_waited_on():
+    batch_mgr = _make_batch_mgr(expected_callers=2)
+    params = _make_params("cost")
+    other_params = _make_params("usage_quantity")
+    other_params["query"]["group_by"] = ["region"]
+
+    start_time = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(batch_mgr.analyze_cost, query_params)
+            for query_params in [params, other_params]
+        ]
+        for future in futures:
+            future.result()
+
+    assert time.perf_counter() - start_time < WINDOW / 2
+    assert len(batch_mgr.cost_analysis_mgr.calls) == 2
@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+import pytest
+from google.protobuf.json_format import ParseDict
+from google.protobuf.struct_pb2 import Struct
+
+from spaceone.dashboard.interface.grpc.columnar import columnar_to_struct
+from spaceone.dashboard.manager.data_table_manager import DataTableManager
+
+
+def _as_lists(response: dict) -> dict:
+    """The response as plain lists, with missing numbers as None."""
+
+    columns = []
+    for column in response["columns"]:
+        column = dict(column)
+        for key in ["values", "codes", "categories"]:
+            if isinstance(column.get(key), np.ndarray):
+                column[key] = [
+                    None if np.isnan(value) else value
+                    for value in column[key].astype("float64").tolist()
+                ]
+        columns.append(column)
+
+    return {**response, "columns": columns}
+
+
+def _assert_same_struct(df: pd.DataFrame, **header) -> Struct:
+    response = {"columns": DataTableManager.make_columnar_results(df), **header}
+
+    encoded = columnar_to_struct(response)
+
+    assert encoded == ParseDict(_as_lists(response), Struct())
+    return encoded
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"cost": [1.5, np.nan, -0.0, 1e300], "count": [1, 2, 3, 4]}),
+        pd.DataFrame({"cost": pd.array([1, None, 3], dtype="Int64")}),
+        pd.DataFrame({"cost": [np.nan, np.nan]}),
+        pd.DataFrame({"value": [1.0, None, "a", True]}, dtype=object),
+        pd.DataFrame({"enabled": [True, False, True]}),
+        pd.DataFrame({"enabled": [True, False, True, True, False]}),
+        pd.DataFrame({"enabled": [True, None, False]}, dtype=object),
+    ],
+)
+def test_numbers_nulls_and_bools_match_parse_dict(df):
+    _assert_same_struct(df)
+
+
+def test_codes_and_categories_match_parse_dict():
+    df = pd.DataFrame(
+        {
+            "provider": ["aws", "aws", None, "google", "aws", "aws"],
+            "region": pd.Categorical(["us", None, "eu", "us", "us", "eu"]),
+            "product": [f"product-{index}" for index in range(6)],
+        }
+    )
+
+    encoded = _assert_same_struct(df)
+
+    columns = encoded["columns"]
+    assert set(columns[0].keys()) == {"name", "codes", "categories"}
+    assert list(columns[1]["codes"]) == [1, -1, 0, 1, 1, 0]
+    assert set(columns[2].keys()) == {"name", "values"}
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        ["東京", "Zürich", "서울", "🚀"],
+        ["a" * 200, "b" * 20000, "c" * 127, "d" * 128],
+        ["é" * 10000, "", "x", "東" * 50],
+    ],
+)
+def test_non_ascii_and_long_strings_match_parse_dict(values):
+    encoded = _assert_same_struct(pd.DataFrame({"name": values}))
+
+    assert list(encoded["columns"][0]["values"]) == values
+
+
+def test_header_fields_match_parse_dict():
+    df = pd.DataFrame({"provider": ["aws", "google"], "cost": [1.0, 2.0]})
+
+    _assert_same_struct(
+        df,
+        total_count=2,
+        order=["provider", "cost"],
+        data_info={"cost": {"unit": "USD"}},
+        labels_info={"provider": {}},
+    )
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame(),
+        pd.DataFrame(columns=["provider", "cost"]),
+        pd.DataFrame({"provider": pd.Series([], dtype=object), "cost": []}),
+        pd.DataFrame({"region": pd.Categorical([])}),
+    ],
+)
+def test_empty_frames_match_parse_dict(df):
+    _assert_same_struct(df, total_count=0)
+
+
+def test_response_without_columns_matches_parse_dict():
+    response = {"total_count": 0, "order": []}
+
+    assert columnar_to_struct(response) == ParseDict(response, Struct())
@@ -0,0 +1,72 @@
+import pandas as pd
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from spaceone.dashboard.manager.data_table_manager.data_source_manager import (
+    DataSourceManager,
+)
+
+DAILY_DATES = [
+    "2024-01-31",
+    "2024-02-29",
+    "2024-03-30",
+    "2024-03-31",
+    "2024-05-31",
+    "2024-12-31",
+    "2025-01-01",
+    "2025-03-31",
+]
+MONTHLY_DATES = ["2024-01", "2024-02", "2024-03", "2024-12", "2025-01"]
+YEARLY_DATES = ["2020", "2024", "2025"]
+
+
+def make_data_source_manager(timediff: dict) -> DataSourceManager:
+    # Only the timediff options are needed, so the connectors are not created
+    ds_mgr = DataSourceManager.__new__(DataSourceManager)
+    ds_mgr.timediff = timediff
+    return ds_mgr
+
+
+def change_date_by_relativedelta(date: str, timediff: dict) -> str:
+    """The per-row implementation replaced by _change_dates_by_timediff."""
+
+    dt = DataSourceManager._get_datetime_from_str(date)
+    years = int(timediff.get("years", 0))
+    months = int(timediff.get("months", 0))
+
+    if years:
+        dt = dt - relativedelta(years=years)
+    elif months:
+        dt = dt - relativedelta(months=months)
+
+    return DataSourceManager._change_str_from_datetime(dt, len(date))
+
+
+@pytest.mark.parametrize(
+    "dates",
+    [DAILY_DATES, MONTHLY_DATES, YEARLY_DATES],
+    ids=["DAILY", "MONTHLY", "YEARLY"],
+)
+@pytest.mark.parametrize(
+    "timediff",
+    [{"months": 1}, {"months": 13}, {"months": -1}, {"years": 1}, {"years": 4}, {}],
+)
+def test_change_dates_by_timediff_matches_relativedelta(dates, timediff):
+    ds_mgr = make_data_source_manager(timediff)
+    dates = pd.Series(dates * 3)
+
+    expected = [change_date_by_relativedelta(date, timediff) for date in dates]
+
+    assert ds_mgr._change_dates_by_timediff(dates).tolist() == expected
+
+
+def test_change_dates_by_timediff_clamps_month_end():
+    ds_mgr = make_data_source_manager({"months": 1})
+    dates = pd.Series(["2024-03-31", "2024-03-30", "2025-03-31", "2024-05-31"])
+
+    assert ds_mgr._change_dates_by_timediff(dates).tolist() == [
+        "2024-02-29",
+        "2024-02-29",
+        "2025-02-28",
+        "2024-04-30",
+    ]
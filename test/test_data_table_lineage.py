@@ -0,0 +1,239 @@
+from unittest import mock
+
+import pytest
+
+from spaceone.dashboard.error.data_table import (
+    ERROR_DATA_TABLE_CYCLE,
+    ERROR_DATA_TABLE_DEPTH,
+)
+from spaceone.dashboard.manager.data_table_manager import data_table_plan_manager
+from spaceone.dashboard.manager.data_table_manager.data_table_plan_manager import (
+    DataTablePlanManager,
+)
+
+
+class FakeDataTable:
+    def __init__(self, data_table_id: str, name: str, **fields):
+        self.data_table_id = data_table_id
+        self.name = name
+        self.data_type = fields.get("data_type", "ADDED")
+        self.source_type = fields.get("source_type", "COST")
+        self.operator = fields.get("operator")
+        self.options = fields.get("options", {})
+        self.ancestors = None
+        self.depth = None
+        self.dag_hash = None
+        self.variables = None
+
+    def update(self, data: dict) -> "FakeDataTable":
+        for key, value in data.items():
+            setattr(self, key, value)
+        return self
+
+
+class FakePublicDataTableManager:
+    """Keeps the data tables in memory and answers the queries of the lineage."""
+
+    def __init__(self):
+        self.data_tables = {}
+
+    def add(self, data_table_vo: FakeDataTable) -> FakeDataTable:
+        self.data_tables[data_table_vo.data_table_id] = data_table_vo
+        return data_table_vo
+
+    def get_public_data_table(self, data_table_id: str, domain_id: str):
+        return self.data_tables[data_table_id]
+
+    def filter_public_data_tables(
+        self, domain_id: str, data_table_id: list = None, ancestors: str = None
+    ) -> list:
+        data_table_vos = list(self.data_tables.values())
+        if data_table_id is not None:
+            data_table_vos = [
+                vo for vo in data_table_vos if vo.data_table_id in data_table_id
+            ]
+        if ancestors is not None:
+            data_table_vos = [
+                vo for vo in data_table_vos if ancestors in (vo.ancestors or [])
+            ]
+        return data_table_vos
+
+
+def make_plan_manager() -> DataTablePlanManager:
+    plan_mgr = DataTablePlanManager("PUBLIC", "domain-test")
+    plan_mgr.data_table_mgr = FakePublicDataTableManager()
+    return plan_mgr
+
+
+def add_data_table(
+    plan_mgr: DataTablePlanManager, data_table_id: str, name: str = None, **fields
+) -> FakeDataTable:
+    data_table_vo = plan_mgr.data_table_mgr.add(
+        FakeDataTable(data_table_id, name or data_table_id, **fields)
+    )
+    data_table_vo.update(
+        plan_mgr.make_lineage(
+            data_table_vo.data_type,
+            data_table_vo.source_type,
+            data_table_vo.operator,
+            data_table_vo.options,
+            data_table_id,
+        )
+    )
+    return data_table_vo
+
+
+def eval_options(data_table_id: str) -> dict:
+    return {
+        "EVAL": {"data_table_id": data_table_id, "expressions": ["doubled = cost * 2"]}
+    }
+
+
+def add_eval_data_table(
+    plan_mgr: DataTablePlanManager, data_table_id: str, input_id: str
+) -> FakeDataTable:
+    return add_data_table(
+        plan_mgr,
+        data_table_id,
+        data_type="TRANSFORMED",
+        operator="EVAL",
+        options=eval_options(input_id),
+    )
+
+
+def join_options(data_table_ids: list) -> dict:
+    return {
+        "JOIN": {
+            "data_tables": data_table_ids,
+            "how": "left",
+            "left_keys": ["project_id"],
+            "right_keys": ["project_id"],
+        }
+    }
+
+
+def _add_join_of_named_inputs(names: list) -> FakeDataTable:
+    plan_mgr = make_plan_manager()
+    for index, name in enumerate(names):
+        add_data_table(plan_mgr, f"dt-{index}", name, options={"plugin_id": "cost"})
+
+    return add_data_table(
+        plan_mgr,
+        "dt-join",
+        data_type="TRANSFORMED",
+        operator="JOIN",
+        options=join_options(["dt-0", "dt-1"]),
+    )
+
+
+def test_join_inputs_with_other_names_have_another_dag_hash():
+    # Identical inputs, but the duplicated columns are named after the inputs
+    join_vo = _add_join_of_named_inputs(["Cost", "Budget"])
+    other_join_vo = _add_join_of_named_inputs(["Cost", "Forecast"])
+
+    assert join_vo.dag_hash != other_join_vo.dag_hash
+    assert join_vo.dag_hash == _add_join_of_named_inputs(["Cost", "Budget"]).dag_hash
+
+
+def test_renamed_input_re_hashes_the_descendant_joins():
+    plan_mgr = make_plan_manager()
+    cost_vo = add_data_table(plan_mgr, "dt-cost", "Cost")
+    add_data_table(plan_mgr, "dt-budget", "Budget")
+    join_vo = add_data_table(
+        plan_mgr,
+        "dt-join",
+        data_type="TRANSFORMED",
+        operator="JOIN",
+        options=join_options(["dt-cost", "dt-budget"]),
+    )
+    dag_hash = join_vo.dag_hash
+
+    cost_vo.update({"name": "Actual Cost"})
+    plan_mgr.update_descendant_lineages(cost_vo)
+
+    assert join_vo.dag_hash != dag_hash
+
+
+def test_lineage_of_a_chain():
+    plan_mgr = make_plan_manager()
+    add_data_table(plan_mgr, "dt-a")
+    add_eval_data_table(plan_mgr, "dt-b", "dt-a")
+    add_data_table(plan_mgr, "dt-c")
+    join_vo = add_data_table(
+        plan_mgr,
+        "dt-join",
+        data_type="TRANSFORMED",
+        operator="JOIN",
+        options=join_options(["dt-b", "dt-c"]),
+    )
+
+    assert join_vo.ancestors == ["dt-a", "dt-b", "dt-c"]
+    assert join_vo.depth == 2
+
+
+@pytest.mark.parametrize("input_id", ["dt-a", "dt-b", "dt-c"])
+def test_cycle_is_rejected(input_id):
+    plan_mgr = make_plan_manager()
+    add_data_table(plan_mgr, "dt-root")
+    add_eval_data_table(plan_mgr, "dt-a", "dt-root")
+    add_eval_data_table(plan_mgr, "dt-b", "dt-a")
+    add_eval_data_table(plan_mgr, "dt-c", "dt-b")
+
+    # dt-a reads itself or one of its descendants
+    with pytest.raises(ERROR_DATA_TABLE_CYCLE):
+        plan_mgr.make_lineage(
+            "TRANSFORMED", None, "EVAL", eval_options(input_id), "dt-a"
+        )
+
+
+def test_depth_limit_is_enforced():
+    plan_mgr = make_plan_manager()
+    add_data_table(plan_mgr, "dt-0")
+
+    def get_global(key, default=None):
+        return 3 if key == "DATA_TABLE_MAX_DEPTH" else default
+
+    with mock.patch.object(
+        data_table_plan_manager.config, "get_global", side_effect=get_global
+    ):
+        for depth in range(1, 4):
+            add_eval_data_table(plan_mgr, f"dt-{depth}", f"dt-{depth - 1}")
+
+        with pytest.raises(ERROR_DATA_TABLE_DEPTH):
+            add_eval_data_table(plan_mgr, "dt-4", "dt-3")
+
+    assert plan_mgr.data_table_mgr.data_tables["dt-3"].depth == 3
+
+
+def test_updated_options_re_hash_every_descendant():
+    plan_mgr = make_plan_manager()
+    root_vo = add_data_table(plan_mgr, "dt-root", options={"plugin_id": "cost"})
+    other_vo = add_data_table(plan_mgr, "dt-other")
+    eval_vo = add_eval_data_table(plan_mgr, "dt-eval", "dt-root")
+    join_vo = add_data_table(
+        plan_mgr,
+        "dt-join",
+        data_type="TRANSFORMED",
+        operator="JOIN",
+        options=join_options(["dt-eval", "dt-other"]),
+    )
+    dag_hashes = {
+        vo.data_table_id: vo.dag_hash for vo in [root_vo, other_vo, eval_vo, join_vo]
+    }
+
+    root_vo.update({"options": {"plugin_id": "usage"}})
+    root_vo.update(
+        plan_mgr.make_lineage("ADDED", "COST", None, root_vo.options, "dt-root")
+    )
+    plan_mgr.update_descendant_lineages(root_vo)
+
+    assert root_vo.dag_hash != dag_hashes["dt-root"]
+    assert eval_vo.dag_hash != dag_hashes["dt-eval"]
+    assert join_vo.dag_hash != dag_hashes["dt-join"]
+    assert other_vo.dag_hash == dag_hashes["dt-other"]
+
+    # The join is re-hashed after its input, from the new input hash
+    lineage = plan_mgr.make_lineage(
+        "TRANSFORMED", None, "JOIN", join_vo.options, "dt-join"
+    )
+    assert join_vo.dag_hash == lineage["dag_hash"]
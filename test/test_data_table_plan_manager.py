@@ -0,0 +1,191 @@
+import copy
+from unittest import mock
+
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from spaceone.dashboard.manager.data_table_manager.data_table_plan_manager import (
+    DataTablePlanManager,
+)
+from spaceone.dashboard.manager.data_table_manager.data_transformation_manager import (
+    DataTransformationManager,
+)
+
+SOURCE_DF = pd.DataFrame(
+    {
+        "Date": ["2024-01", "2024-01", "2024-02", "2024-02"],
+        "provider": ["aws", "google", "aws", "azure"],
+        "cost": [10.0, 30.0, 20.0, 40.0],
+    }
+)
+
+
+class FakeSourceManager:
+    def __init__(self, df: pd.DataFrame):
+        self.df = df
+        self.state = "AVAILABLE"
+        self.remote_time = 0.0
+        self.remote_calls = 0
+        self.join_info = None
+
+
+def _make_node(data_table_id: str, data_type: str, operator=None, options=None):
+    return {
+        "data_table_id": data_table_id,
+        "name": data_table_id,
+        "data_type": data_type,
+        "source_type": "COST" if data_type == "ADDED" else None,
+        "operator": operator,
+        "options": {operator: options} if operator else {},
+        "inputs": [],
+        "data_info": {"cost": {}},
+        "labels_info": {"Date": {}, "provider": {}},
+        "widget_id": None,
+        "domain_id": "domain-test",
+    }
+
+
+def _make_query_over_plan(operator: str, options: dict) -> dict:
+    source = _make_node("source", "ADDED")
+    input_node = _make_node("input", "TRANSFORMED", operator, options)
+    input_node["inputs"] = ["source"]
+    root = _make_node(
+        "root", "TRANSFORMED", "QUERY", {"conditions": ["provider == 'aws'"]}
+    )
+    root["inputs"] = ["input"]
+
+    return {
+        "root": "root",
+        "order": ["source", "input", "root"],
+        "nodes": {"source": source, "input": input_node, "root": root},
+        "rewrites": [],
+    }
+
+
+def _make_query_over_eval_plan(expressions: list) -> dict:
+    return _make_query_over_plan("EVAL", {"expressions": expressions})
+
+
+def _make_value_mapping_options(condition: str = None) -> dict:
+    options = {"name": "tier", "key": "provider", "cases": [], "else": "small"}
+    if condition:
+        options["condition"] = condition
+    return options
+
+
+def _execute(plan: dict) -> pd.DataFrame:
+    root = plan["nodes"][plan["root"]]
+    dt_mgr = DataTransformationManager(
+        "PUBLIC",
+        root["operator"],
+        root["options"][root["operator"]],
+        None,
+        "domain-test",
+        data_table_vos=[],
+    )
+    source_mgrs = {"source": (FakeSourceManager(SOURCE_DF.copy()), 0.0)}
+
+    with mock.patch.object(
+        DataTablePlanManager, "get_plan", return_value=copy.deepcopy(plan)
+    ), mock.patch.object(
+        DataTransformationManager, "_load_source_nodes", return_value=source_mgrs
+    ):
+        dt_mgr.execute_plan("MONTHLY", "2024-01", "2024-02")
+
+    return dt_mgr.df.reset_index(drop=True)
+
+
+def _optimize(plan: dict) -> dict:
+    plan_mgr = DataTablePlanManager("PUBLIC", "domain-test")
+    return plan_mgr.optimize_plan(copy.deepcopy(plan))
+
+
+@pytest.mark.parametrize(
+    "operator, options",
+    [
+        ("EVAL", {"expressions": ["ratio = cost / cost.sum()"]}),
+        ("EVAL", {"expressions": ["ratio = cost.cumsum()"]}),
+        ("EVAL", {"expressions": ["ratio = cost.shift(1)"]}),
+        (
+            "EVAL",
+            {"expressions": [{"name": "ratio", "expression": "{cost} / {cost}.max()"}]},
+        ),
+        ("VALUE_MAPPING", _make_value_mapping_options("cost > cost.mean()")),
+    ],
+)
+def test_query_is_not_pushed_below_column_wide_eval(operator, options):
+    plan = _make_query_over_plan(operator, options)
+    optimized_plan = _optimize(plan)
+
+    assert not any(
+        rewrite.startswith("push_down_query") for rewrite in optimized_plan["rewrites"]
+    )
+    pdt.assert_frame_equal(_execute(optimized_plan), _execute(plan))
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "doubled = cost * 2",
+        "`cost with tax` = cost * 1.1 + 1",
+        {"name": "doubled", "expression": "{cost} * 2"},
+    ],
+)
+def test_query_is_pushed_below_row_local_eval(expression):
+    plan = _make_query_over_eval_plan([expression])
+    optimized_plan = _optimize(plan)
+
+    assert "push_down_query:root->input" in optimized_plan["rewrites"]
+    pdt.assert_frame_equal(_execute(optimized_plan), _execute(plan))
+
+
+@pytest.mark.parametrize("condition", [None, "cost > 15"])
+def test_query_is_pushed_below_row_local_value_mapping(condition):
+    plan = _make_query_over_plan(
+        "VALUE_MAPPING", _make_value_mapping_options(condition)
+    )
+    optimized_plan = _optimize(plan)
+
+    assert "push_down_query:root->input" in optimized_plan["rewrites"]
+    pdt.assert_frame_equal(_execute(optimized_plan), _execute(plan))
+
+
+@pytest.mark.parametrize(
+    "expression, is_row_local",
+    [
+        ("cost * 2 + 1", True),
+        ("`cost with tax` / 100", True),
+        ("provider in ['aws', 'google'] and cost > 10", True),
+        ("cost / cost.sum()", False),
+        ("cost.shift(1)", False),
+        ("abs(cost)", False),
+        ("cost[0]", False),
+        ("cost * {{ global.rate }}", False),
+        (3.5, True),
+    ],
+)
+def test_is_row_local_expression(expression, is_row_local):
+    assert DataTablePlanManager.is_row_local_expression(expression) is is_row_local
+
+
+@pytest.mark.parametrize(
+    "operator, options, is_incremental",
+    [
+        ("EVAL", {"expressions": ["doubled = cost * 2"]}, True),
+        ("EVAL", {"expressions": ["ratio = cost / cost.sum()"]}, False),
+        ("QUERY", {"conditions": ["provider == 'aws'"]}, True),
+        ("QUERY", {"conditions": ["cost > cost.mean()"]}, False),
+        ("VALUE_MAPPING", _make_value_mapping_options(), True),
+        ("VALUE_MAPPING", _make_value_mapping_options("cost > 15"), True),
+        ("VALUE_MAPPING", _make_value_mapping_options("cost > cost.mean()"), False),
+        ("AGGREGATE", {"group_by": ["provider"]}, False),
+    ],
+)
+def test_is_incremental_plan(operator, options, is_incremental):
+    source = _make_node("source", "ADDED")
+    root = _make_node("root", "TRANSFORMED", operator, options)
+    root["inputs"] = ["source"]
+    plan = {"root": "root", "nodes": {"source": source, "root": root}}
+
+    assert DataTablePlanManager.is_incremental_plan(plan) is is_incremental
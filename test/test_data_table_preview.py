@@ -0,0 +1,115 @@
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from spaceone.dashboard.error.data_table import (
+    ERROR_LOAD_CANCELLED,
+    ERROR_PREVIEW_TIMEOUT,
+)
+from spaceone.dashboard.manager import data_table_manager
+from spaceone.dashboard.manager.data_table_manager.data_table_plan_manager import (
+    DataTablePlanManager,
+)
+from spaceone.dashboard.manager.data_table_manager.data_transformation_manager import (
+    DataTransformationManager,
+)
+
+from test.test_data_source_manager import make_data_source_manager
+from test.test_data_table_plan_manager import (
+    SOURCE_DF,
+    FakeSourceManager,
+    _make_query_over_eval_plan,
+)
+
+PREVIEW_TIMEOUT = 0.05
+
+
+def _get_global(key, default=None):
+    if key == "DATA_TABLE_PREVIEW_TIMEOUT":
+        return PREVIEW_TIMEOUT
+    return default
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def _make_manager(plan: dict) -> DataTransformationManager:
+    root = plan["nodes"][plan["root"]]
+    return DataTransformationManager(
+        "PUBLIC",
+        root["operator"],
+        root["options"][root["operator"]],
+        None,
+        "domain-test",
+        data_table_vos=[],
+    )
+
+
+def test_preview_timeout_stops_the_remaining_nodes():
+    plan = _make_query_over_eval_plan(["doubled = cost * 2"])
+    dt_mgr = _make_manager(plan)
+    sources_loaded = threading.Event()
+
+    def load_source_nodes(*args, **kwargs):
+        # The sources outlive the time budget
+        time.sleep(PREVIEW_TIMEOUT * 4)
+        sources_loaded.set()
+        return {"source": (FakeSourceManager(SOURCE_DF.copy()), 0.0)}
+
+    with mock.patch.object(
+        data_table_manager.config, "get_global", side_effect=_get_global
+    ), mock.patch.object(
+        DataTablePlanManager, "get_plan", return_value=plan
+    ), mock.patch.object(
+        DataTransformationManager, "_load_source_nodes", side_effect=load_source_nodes
+    ), mock.patch.object(
+        DataTransformationManager, "run_operator"
+    ) as run_operator:
+        with pytest.raises(ERROR_PREVIEW_TIMEOUT):
+            dt_mgr.preview("MONTHLY", "2024-01", "2024-02")
+
+        assert dt_mgr.cancel_event.is_set()
+        _wait_until(lambda: dt_mgr.state == "UNAVAILABLE")
+
+    assert sources_loaded.is_set()
+    run_operator.assert_not_called()
+
+
+def test_preview_within_budget_is_not_cancelled():
+    plan = _make_query_over_eval_plan(["doubled = cost * 2"])
+    dt_mgr = _make_manager(plan)
+    source_mgrs = {"source": (FakeSourceManager(SOURCE_DF.copy()), 0.0)}
+
+    with mock.patch.object(
+        DataTablePlanManager, "get_plan", return_value=plan
+    ), mock.patch.object(
+        DataTransformationManager, "_load_source_nodes", return_value=source_mgrs
+    ):
+        df = dt_mgr.preview("MONTHLY", "2024-01", "2024-02")
+
+    assert not dt_mgr.cancel_event.is_set()
+    assert dt_mgr.state == "AVAILABLE"
+    assert df["provider"].tolist() == ["aws", "aws"]
+
+
+def test_cancelled_source_skips_the_remote_call():
+    ds_mgr = make_data_source_manager({})
+    ds_mgr.load_mode = "PREVIEW"
+    ds_mgr.remote_time = 0.0
+    ds_mgr.remote_calls = 0
+    ds_mgr.cancel_event = threading.Event()
+    analyze_func = mock.Mock(return_value={"results": []})
+
+    ds_mgr._dispatch_analyze(analyze_func, {"query": {}})
+    ds_mgr.cancel_event.set()
+    with pytest.raises(ERROR_LOAD_CANCELLED):
+        ds_mgr._dispatch_analyze(analyze_func, {"query": {}})
+
+    assert analyze_func.call_count == 1
+    assert ds_mgr.remote_calls == 1
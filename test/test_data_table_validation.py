@@ -0,0 +1,156 @@
+from unittest import mock
+
+import pytest
+
+from spaceone.dashboard.manager.data_table_manager import data_source_manager
+from spaceone.dashboard.manager.data_table_manager.data_source_manager import (
+    DataSourceManager,
+)
+from spaceone.dashboard.manager.data_table_manager.data_table_plan_manager import (
+    DataTablePlanManager,
+)
+from spaceone.dashboard.manager.data_table_manager.data_transformation_manager import (
+    DataTransformationManager,
+)
+
+from test.test_data_table_plan_manager import _make_node
+
+SOURCE_OPTIONS = {
+    "data_name": "cost",
+    "data_unit": "USD",
+    "group_by": [{"key": "provider", "name": "provider"}],
+    "COST": {"data_source_id": "ds-test", "data_key": "cost"},
+}
+
+
+class FakeCostAnalysisManager:
+    calls = []
+
+    def analyze_cost(self, params: dict) -> dict:
+        self.calls.append(params)
+        fields = params["query"]["fields"]
+        return {
+            "results": [
+                {"provider": "aws", "date": "2024-01", **dict.fromkeys(fields, 10.0)}
+            ]
+        }
+
+
+@pytest.fixture(autouse=True)
+def cost_analysis_calls():
+    FakeCostAnalysisManager.calls = []
+    with mock.patch.object(
+        data_source_manager, "CostAnalysisManager", FakeCostAnalysisManager
+    ):
+        yield FakeCostAnalysisManager.calls
+
+
+def _make_source_manager(options: dict = None) -> DataSourceManager:
+    return DataSourceManager(
+        "PUBLIC", "COST", options or SOURCE_OPTIONS, None, "domain-test"
+    )
+
+
+def _make_eval_plan() -> dict:
+    source = _make_node("source", "ADDED")
+    source["options"] = SOURCE_OPTIONS
+    source["data_info"] = {"cost": {"unit": "USD"}}
+    root = _make_node(
+        "root", "TRANSFORMED", "EVAL", {"expressions": ["doubled = cost * 2"]}
+    )
+    root["inputs"] = ["source"]
+
+    return {
+        "root": "root",
+        "order": ["source", "root"],
+        "nodes": {"source": source, "root": root},
+        "rewrites": [],
+    }
+
+
+def _validate_eval(mode: str) -> DataTransformationManager:
+    plan = _make_eval_plan()
+    dt_mgr = DataTransformationManager(
+        "PUBLIC",
+        "EVAL",
+        plan["nodes"]["root"]["options"]["EVAL"],
+        None,
+        "domain-test",
+        data_table_vos=[],
+    )
+
+    with mock.patch.object(DataTablePlanManager, "get_plan", return_value=plan):
+        dt_mgr.validate(mode)
+
+    return dt_mgr
+
+
+def test_schema_validation_of_a_source_makes_no_remote_call(cost_analysis_calls):
+    ds_mgr = _make_source_manager()
+
+    df = ds_mgr.validate("SCHEMA")
+
+    assert cost_analysis_calls == []
+    assert ds_mgr.state == "AVAILABLE"
+    assert ds_mgr.load_mode == "FULL"
+    assert df.empty
+    assert sorted(df.columns) == ["Date", "cost", "provider"]
+    assert ds_mgr.get_data_and_labels_info() == (
+        {"cost": {"unit": "USD"}},
+        {"provider": {}, "Date": {}},
+    )
+
+
+def test_schema_validation_still_verifies_the_options(cost_analysis_calls):
+    options = {**SOURCE_OPTIONS, "COST": {"data_source_id": "ds-test"}}
+    ds_mgr = _make_source_manager(options)
+
+    ds_mgr.validate("SCHEMA")
+
+    assert cost_analysis_calls == []
+    assert ds_mgr.state == "UNAVAILABLE"
+
+
+def test_schema_validation_of_a_transformation_infers_the_info(cost_analysis_calls):
+    dt_mgr = _validate_eval("SCHEMA")
+
+    assert cost_analysis_calls == []
+    assert dt_mgr.state == "AVAILABLE"
+    assert dt_mgr.get_data_and_labels_info() == (
+        {"cost": {"unit": "USD"}, "doubled": {}},
+        {"Date": {}, "provider": {}},
+    )
+
+
+@pytest.mark.parametrize("timediff", [None, {"months": 1, "data_name": "last_cost"}])
+def test_probe_validation_fetches_one_row_per_query(cost_analysis_calls, timediff):
+    options = {**SOURCE_OPTIONS}
+    if timediff:
+        options["timediff"] = timediff
+    ds_mgr = _make_source_manager(options)
+
+    ds_mgr.validate("PROBE")
+
+    assert ds_mgr.state == "AVAILABLE"
+    assert len(cost_analysis_calls) == (2 if timediff else 1)
+    for params in cost_analysis_calls:
+        assert params["query"]["page"] == {"limit": 1}
+
+
+def test_probe_validation_of_a_transformation_fetches_one_row(cost_analysis_calls):
+    dt_mgr = _validate_eval("PROBE")
+
+    assert dt_mgr.state == "AVAILABLE"
+    assert [params["query"]["page"] for params in cost_analysis_calls] == [
+        {"limit": 1}
+    ]
+    assert dt_mgr.df["doubled"].tolist() == [20.0]
+
+
+def test_full_validation_fetches_without_a_page_limit(cost_analysis_calls):
+    ds_mgr = _make_source_manager()
+
+    ds_mgr.validate("FULL")
+
+    assert len(cost_analysis_calls) == 1
+    assert "page" not in cost_analysis_calls[0]["query"]
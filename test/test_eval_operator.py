@@ -0,0 +1,184 @@
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from spaceone.dashboard.error.data_table import ERROR_INVALID_PARAMETER
+from spaceone.dashboard.manager.data_table_manager.data_transformation_manager import (
+    DataTransformationManager,
+)
+
+from test.transformation_utils import make_cost_df, normalize, run_operator
+
+
+class LegacyEvalManager(DataTransformationManager):
+    """EVAL as it was before the expressions were compiled and batched."""
+
+    def evaluate_data_table(self, granularity, start=None, end=None, vars=None):
+        expressions = self.options.get("expressions", [])
+
+        origin_vo = self.data_table_vos[0]
+        self.data_keys = list(origin_vo.data_info.keys())
+        self.label_keys = list(origin_vo.labels_info.keys())
+
+        df = self._get_data_table(origin_vo, granularity, start, end, vars).copy()
+
+        for expression in expressions:
+            if isinstance(expression, dict):
+                name = expression["name"]
+                field_type = expression.get("field_type", "DATA")
+                condition = expression.get("condition")
+                value_expression = expression["expression"]
+
+                template_vars = {}
+                for key in self.data_keys + self.label_keys:
+                    template_vars[key] = f"`{key}`"
+
+                if isinstance(value_expression, str):
+                    try:
+                        value_expression = value_expression.format(**template_vars)
+                    except KeyError:
+                        value_expression = value_expression.replace("{", "{{").replace(
+                            "}", "}}"
+                        )
+                        value_expression = value_expression.format(**template_vars)
+
+                try:
+                    merged_expr = f"`{name}` = {value_expression}"
+
+                    if field_type == "LABEL":
+                        self.label_keys = list(set(self.label_keys) | {name})
+                    else:
+                        self.data_keys = list(set(self.data_keys) | {name})
+
+                    if name in df.columns:
+                        last_key = name
+                    else:
+                        last_key = df.eval(merged_expr).columns[-1:][0]
+
+                    if condition:
+                        matched_index = self._legacy_query(df, condition).index
+                        df.loc[matched_index, last_key] = df.eval(merged_expr).loc[
+                            matched_index, last_key
+                        ]
+                    else:
+                        df.eval(merged_expr, inplace=True)
+
+                    if last_key.startswith("BACKTICK_QUOTED_STRING"):
+                        df.rename(columns={last_key: name}, inplace=True)
+
+                    df.replace([np.inf, -np.inf], 0, inplace=True)
+
+                except Exception:
+                    raise ERROR_INVALID_PARAMETER(
+                        key="options.EVAL.expressions", reason=expression
+                    )
+
+            else:
+                try:
+                    name, value_expression = expression.split("=", 1)
+                    name = name.replace("`", "").strip()
+                    expression = f"`{name}` = {value_expression.strip()}"
+
+                    self.data_keys = list(set(self.data_keys) | {name})
+
+                    df.eval(expression, inplace=True)
+                    last_key = df.columns[-1:][0]
+                    if last_key.startswith("BACKTICK_QUOTED_STRING"):
+                        df.rename(columns={last_key: name}, inplace=True)
+                    df.replace([np.inf, -np.inf], 0, inplace=True)
+
+                except Exception:
+                    raise ERROR_INVALID_PARAMETER(
+                        key="options.EVAL.expressions", reason=expression
+                    )
+
+        self.df = df
+
+    @staticmethod
+    def _legacy_query(df: pd.DataFrame, condition: str) -> pd.DataFrame:
+        return df.query(condition)
+
+
+@pytest.mark.parametrize(
+    "expressions",
+    [
+        # Independent steps are evaluated in one batch
+        ["double_cost = cost * 2", "unit_cost = cost / usage", "total = cost + usage"],
+        # A step reads a column produced earlier in the same batch
+        ["double_cost = cost * 2", "quad_cost = double_cost * 2", "x = quad_cost - 1"],
+        # Division by zero produces inf, which is replaced with 0 in every step
+        ["ratio = usage / (cost - cost)", "ratio_plus = ratio + 1"],
+        ["`cost with tax` = cost * 1.1", "`tax` = `cost with tax` - cost"],
+        # A step overwrites an existing column
+        ["cost = cost * 100", "double_cost = cost * 2"],
+        [
+            {"name": "double_cost", "expression": "{cost} * 2"},
+            {"name": "quad_cost", "expression": "{double_cost} * 2"},
+            {"name": "ratio", "expression": "{usage} / {cost}"},
+        ],
+        [
+            {
+                "name": "aws_cost",
+                "expression": "{cost}",
+                "condition": "provider == 'aws'",
+            },
+            {"name": "double_cost", "expression": "{cost} * 2"},
+        ],
+        [
+            {"name": "is_high", "expression": "{cost} > 100", "field_type": "LABEL"},
+            {"name": "share", "expression": "{cost} / {cost}.sum()"},
+        ],
+    ],
+)
+@pytest.mark.parametrize("with_nan", [True, False])
+def test_eval_matches_legacy(expressions, with_nan):
+    df = make_cost_df(with_nan=with_nan)
+    df.loc[df.index[:5], "usage"] = 0
+    options = {"expressions": expressions}
+
+    new_mgr = run_operator("EVAL", options, df)
+    legacy_mgr = run_operator("EVAL", options, df, manager_class=LegacyEvalManager)
+
+    pdt.assert_frame_equal(normalize(new_mgr.df), normalize(legacy_mgr.df))
+    assert set(new_mgr.data_keys) == set(legacy_mgr.data_keys)
+    assert set(new_mgr.label_keys) == set(legacy_mgr.label_keys)
+
+
+def test_eval_batch_reads_earlier_step():
+    df = pd.DataFrame({"cost": [1.0, 0.0, 3.0], "usage": [2.0, 5.0, 0.0]})
+    options = {
+        "expressions": [
+            "ratio = usage / cost",
+            "ratio_plus = ratio + 1",
+            "double_cost = cost * 2",
+        ]
+    }
+
+    dt_mgr = run_operator("EVAL", options, df)
+
+    # ratio_plus must read ratio after its inf values were replaced with 0
+    assert dt_mgr.df["ratio"].tolist() == [2.0, 0.0, 0.0]
+    assert dt_mgr.df["ratio_plus"].tolist() == [3.0, 1.0, 1.0]
+    assert dt_mgr.df["double_cost"].tolist() == [2.0, 0.0, 6.0]
+
+
+@pytest.mark.parametrize(
+    "name, value_expression, batch_names, can_batch",
+    [
+        ("b", "`cost` * 2", ["a"], True),
+        ("b", "`cost` + 1", ["cost"], False),
+        ("a", "`cost` * 2", ["a"], False),
+        ("b", "`cost` / `cost`.sum()", ["a"], False),
+    ],
+)
+def test_can_batch_eval_step(name, value_expression, batch_names, can_batch):
+    df = pd.DataFrame({"cost": [1.0]})
+    batch = [({"name": batch_name}, "1") for batch_name in batch_names]
+
+    assert (
+        DataTransformationManager._can_batch_eval_step(
+            df, batch, {"name": name}, value_expression, None
+        )
+        is can_batch
+    )
@@ -0,0 +1,144 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from spaceone.dashboard.manager.data_table_manager import DataTableManager
+
+from test.test_data_source_manager import make_data_source_manager
+
+VARS = {
+    "threshold": 10,
+    "ratio": 0.5,
+    "provider": "aws",
+    "providers": ["aws", "google", "azure"],
+    "enabled": True,
+}
+
+
+@pytest.fixture
+def dt_mgr() -> DataTableManager:
+    return DataTableManager()
+
+
+@pytest.mark.parametrize(
+    "expression, bound",
+    [
+        ("cost > {{ global.threshold }}", "cost > 10"),
+        ("cost * {{global.ratio}}", "cost * 0.5"),
+        ("provider == {{ global.provider }}", "provider == 'aws'"),
+        ("name in {{ global.providers }}", "name in ['aws', 'google', 'azure']"),
+        ("provider == {{ global.providers[1] }}", "provider == 'google'"),
+        ("provider == {{ global.providers [ -1 ] }}", "provider == 'azure'"),
+        ("{{ global.enabled }} and cost > 0", "True and cost > 0"),
+        ("{{ Usage Type }} > {{ cost }}", "`Usage Type` > cost"),
+        ("cost > 10", "cost > 10"),
+    ],
+)
+def test_bind_global_variables(dt_mgr, expression, bound):
+    assert dt_mgr.bind_global_variables(expression, VARS) == bound
+
+
+@pytest.mark.parametrize("vars", [None, {}, {"other": 1}])
+def test_unbound_global_variable_is_a_column_reference(dt_mgr, vars):
+    expression = "cost > {{ global.threshold }}"
+
+    assert dt_mgr.bind_global_variables(expression, vars) == "cost > threshold"
+
+
+@pytest.mark.parametrize(
+    "provider",
+    [
+        "aws' or provider != '",
+        'aws" or provider != "',
+        "aws\\' or provider != \\'",
+        "it's \"quoted\"",
+    ],
+)
+def test_quotes_in_global_variables_stay_in_the_literal(dt_mgr, provider):
+    df = pd.DataFrame({"provider": ["aws", "google", provider]})
+
+    query = dt_mgr.bind_global_variables(
+        "provider == {{ global.provider }}", {"provider": provider}
+    )
+
+    assert df.query(query)["provider"].tolist() == [provider]
+
+
+def test_html_tags_are_removed_from_global_variables(dt_mgr):
+    vars = {
+        "provider": "<script>alert(1)</script>aws",
+        "providers": ["<b>aws</b>", "google<br/>"],
+    }
+
+    assert (
+        dt_mgr.bind_global_variables("provider == {{ global.provider }}", vars)
+        == "provider == 'alert(1)aws'"
+    )
+    assert dt_mgr.bind_filter_value("{{ global.providers }}", vars) == (
+        ["aws", "google"],
+        True,
+    )
+
+
+@pytest.mark.parametrize(
+    "value, literal",
+    [
+        (None, "None"),
+        (True, "True"),
+        (10, "10"),
+        (0.5, "0.5"),
+        ("aws", "'aws'"),
+        ("it's", '"it\'s"'),
+        ("東京", "'東京'"),
+        (["aws", 1, None, [True]], "['aws', 1, None, [True]]"),
+        ([], "[]"),
+        (date(2024, 1, 31), "'2024-01-31'"),
+    ],
+)
+def test_to_query_literal(dt_mgr, value, literal):
+    assert dt_mgr._to_query_literal(value) == literal
+
+
+@pytest.mark.parametrize(
+    "expression, value, is_bound",
+    [
+        ("{{ global.threshold }}", 10, True),
+        ("  {{ global.ratio }} ", 0.5, True),
+        ("{{ global.provider }}", "aws", True),
+        ("{{ global.providers }}", ["aws", "google", "azure"], True),
+        ("{{ global.providers[0] }}", "aws", True),
+        ("[{{ global.threshold }}, {{ global.ratio }}]", [10, 0.5], True),
+        ("{{ global.missing }}", None, False),
+        (["gcp", "{{ global.providers }}"], ["gcp", "aws", "google", "azure"], True),
+        (["gcp", "{{ global.provider }}", 1], ["gcp", "aws", 1], True),
+        (["gcp", "{{ global.missing }}"], ["gcp", None], False),
+    ],
+)
+def test_bind_filter_value_returns_typed_values(dt_mgr, expression, value, is_bound):
+    assert dt_mgr.bind_filter_value(expression, VARS) == (value, is_bound)
+
+
+def test_make_query_binds_filter_values():
+    ds_mgr = make_data_source_manager({})
+    ds_mgr.source_type = "COST"
+    ds_mgr.data_name = "cost"
+    ds_mgr.group_by = ["provider"]
+    ds_mgr.filter_or = []
+    ds_mgr.sort = None
+    ds_mgr.filter = [
+        {"k": "cost", "v": "{{ global.threshold }}", "o": "gte"},
+        {"k": "provider", "v": ["gcp", "{{ global.providers }}"], "o": "in"},
+        {"k": "provider", "v": "{{ global.providers[1] }}", "o": "eq"},
+        {"k": "region_code", "v": "{{ global.missing }}", "o": "eq"},
+        {"k": "product", "v": "EC2", "o": "eq"},
+    ]
+
+    query = ds_mgr._make_query("cost", "MONTHLY", "2024-01", "2024-03", VARS)
+
+    assert query["filter"] == [
+        {"k": "cost", "v": [10], "o": "gte"},
+        {"k": "provider", "v": ["gcp", "aws", "google", "azure"], "o": "in"},
+        {"k": "provider", "v": ["google"], "o": "eq"},
+        {"k": "product", "v": "EC2", "o": "eq"},
+    ]
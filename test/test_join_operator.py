@@ -0,0 +1,274 @@
+from typing import List, Type
+
+import numpy as np
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from spaceone.dashboard.manager.data_table_manager.data_table_plan_manager import (
+    DataTableNode,
+)
+from spaceone.dashboard.manager.data_table_manager.data_transformation_manager import (
+    DataTransformationManager,
+)
+
+from test.transformation_utils import normalize
+
+COST_ID = "cost"
+ASSET_ID = "asset"
+KEYS = ["project_id", "region"]
+
+
+class LegacyJoinManager(DataTransformationManager):
+    """JOIN as it was before the keys were encoded into one integer index."""
+
+    def _merge_data_frames(
+        self,
+        data_frames: List[pd.DataFrame],
+        names: list,
+        how: str,
+        left_keys: list,
+        right_keys: list,
+    ) -> pd.DataFrame:
+        rename_columns = self._create_rename_columns_from_join_keys(
+            left_keys, right_keys, how
+        )
+        if how in ["left", "inner", "outer"]:
+            join_keys = left_keys
+            data_frames = [data_frames[0]] + [
+                df.rename(columns=rename_columns) for df in data_frames[1:]
+            ]
+        else:
+            join_keys = right_keys
+            data_frames = [data_frames[0].rename(columns=rename_columns)] + list(
+                data_frames[1:]
+            )
+
+        data_frames = [
+            pd.DataFrame(columns=join_keys) if df.empty else df for df in data_frames
+        ]
+        data_frames = self._rename_duplicated_columns(data_frames, names, join_keys)
+        self.align_categories(data_frames, join_keys)
+
+        columns = list(data_frames[0].columns)
+        merged_df = data_frames[0].set_index(join_keys)
+        for other_df in data_frames[1:]:
+            columns += [column for column in other_df.columns if column not in columns]
+            merged_df = merged_df.merge(
+                other_df.set_index(join_keys),
+                left_index=True,
+                right_index=True,
+                how=how,
+            )
+
+        merged_df = merged_df.reset_index()[columns]
+
+        label_keys = list(set(merged_df.columns) - set(self.data_keys))
+        fill_na = {key: 0 for key in self.data_keys}
+        fill_na.update({key: "" for key in label_keys})
+        merged_df = self.fill_na_values(merged_df, fill_na)
+
+        return merged_df
+
+
+def make_join_frames(
+    row_count: int, with_nan: bool = False, seed: int = 0
+) -> List[pd.DataFrame]:
+    """A cost table and an asset count table with half as many key combinations."""
+
+    rng = np.random.default_rng(seed)
+    project_count = max(row_count // 20, 1)
+    cost_df = pd.DataFrame(
+        {
+            "project_id": rng.integers(0, project_count, row_count),
+            "region": rng.integers(0, 20, row_count),
+            "provider": rng.choice(["aws", "google", "azure"], row_count),
+            "product": rng.choice([f"product-{i}" for i in range(30)], row_count),
+            "cost": rng.gamma(2.0, 50.0, row_count).round(4),
+            "usage": rng.integers(0, 1000, row_count).astype(float),
+        }
+    )
+    cost_df["project_id"] = "project-" + cost_df["project_id"].astype(str)
+    cost_df["region"] = "region-" + cost_df["region"].astype(str)
+
+    asset_df = (
+        cost_df[KEYS]
+        .drop_duplicates()
+        .sample(frac=0.5, random_state=seed)
+        .reset_index(drop=True)
+    )
+    asset_df["count"] = rng.integers(1, 100, len(asset_df)).astype(float)
+
+    if with_nan:
+        cost_df.loc[rng.random(row_count) < 0.1, "cost"] = np.nan
+        cost_df.loc[rng.random(row_count) < 0.05, "product"] = np.nan
+        asset_df.loc[rng.random(len(asset_df)) < 0.1, "count"] = np.nan
+
+    return [cost_df, asset_df]
+
+
+def run_join(
+    data_frames: List[pd.DataFrame],
+    how: str,
+    keys: list = None,
+    manager_class: Type[DataTransformationManager] = DataTransformationManager,
+    categorical_labels: bool = False,
+) -> DataTransformationManager:
+    keys = keys or KEYS
+    data_table_vos = []
+    input_dfs = {}
+    for data_table_id, df in zip([COST_ID, ASSET_ID], data_frames):
+        data_keys = [
+            column for column in ["cost", "usage", "count"] if column in df.columns
+        ]
+        label_keys = [column for column in df.columns if column not in data_keys]
+        data_table_vos.append(
+            DataTableNode(
+                {
+                    "data_table_id": data_table_id,
+                    "name": data_table_id,
+                    "data_type": "ADDED",
+                    "source_type": "COST",
+                    "data_info": {key: {} for key in data_keys},
+                    "labels_info": {key: {} for key in label_keys},
+                }
+            )
+        )
+
+        input_df = df.copy()
+        if categorical_labels:
+            input_df = DataTransformationManager.encode_labels(input_df, label_keys)
+        input_dfs[data_table_id] = input_df
+
+    options = {"how": how, "left_keys": keys, "right_keys": keys}
+    dt_mgr = manager_class(
+        "PUBLIC", "JOIN", options, None, "domain-test", data_table_vos=data_table_vos
+    )
+    dt_mgr.categorical_labels = categorical_labels
+    dt_mgr.data_frames = input_dfs
+    dt_mgr.run_operator("MONTHLY", "2024-01", "2024-03", {})
+    return dt_mgr
+
+
+def _assert_same_join(data_frames: list, how: str, **kwargs) -> pd.DataFrame:
+    new_df = run_join(data_frames, how, **kwargs).df
+    legacy_df = run_join(data_frames, how, manager_class=LegacyJoinManager, **kwargs).df
+
+    pdt.assert_frame_equal(normalize(new_df), normalize(legacy_df))
+    return new_df
+
+
+@pytest.mark.parametrize("how", ["left", "right", "inner", "outer"])
+@pytest.mark.parametrize("with_nan", [False, True])
+@pytest.mark.parametrize("categorical_labels", [False, True])
+@pytest.mark.parametrize("keys", [KEYS, ["project_id"]])
+def test_join_matches_legacy(how, with_nan, categorical_labels, keys):
+    data_frames = make_join_frames(400, with_nan=with_nan)
+    if keys == ["project_id"]:
+        data_frames[1] = data_frames[1].drop_duplicates("project_id")
+
+    _assert_same_join(
+        data_frames, how, keys=keys, categorical_labels=categorical_labels
+    )
+
+
+@pytest.mark.parametrize("how", ["left", "inner", "outer"])
+def test_join_with_missing_keys_matches_legacy(how):
+    cost_df, asset_df = make_join_frames(200)
+    cost_df.loc[::17, "region"] = np.nan
+    asset_df.loc[::5, "region"] = np.nan
+    asset_df = asset_df.drop_duplicates(KEYS)
+
+    new_df = run_join([cost_df, asset_df], how).df
+    legacy_df = run_join([cost_df, asset_df], how, manager_class=LegacyJoinManager).df
+
+    # Outer joins may order the rows with missing keys differently
+    columns = list(new_df.columns)
+    pdt.assert_frame_equal(
+        normalize(new_df).sort_values(columns).reset_index(drop=True),
+        normalize(legacy_df).sort_values(columns).reset_index(drop=True),
+    )
+
+
+@pytest.mark.parametrize("categorical_labels", [False, True])
+def test_join_keys_are_encoded_as_int64(categorical_labels):
+    data_frames = make_join_frames(300)
+    if categorical_labels:
+        data_frames = [
+            DataTransformationManager.encode_labels(df, KEYS) for df in data_frames
+        ]
+    dt_mgr = run_join(
+        make_join_frames(300), "left", categorical_labels=categorical_labels
+    )
+
+    key_codes, key_categories = dt_mgr._encode_join_keys(data_frames, KEYS)
+
+    for df, codes in zip(data_frames, key_codes):
+        assert not isinstance(codes, pd.MultiIndex)
+        assert codes.dtype == "int64"
+
+        decoded = dt_mgr._decode_join_keys(codes, key_categories)
+        for key in KEYS:
+            assert list(decoded[key]) == list(df[key])
+
+    assert dt_mgr.join_info["key_cardinality"] == {
+        "project_id": 15,
+        "region": 20,
+    }
+
+
+def test_join_falls_back_to_multi_index_on_large_cardinality():
+    # 4 keys of 2**16 distinct values each have 2**64 combinations
+    keys = ["key_0", "key_1", "key_2", "key_3"]
+    row_count = 2**16
+    rng = np.random.default_rng(0)
+    cost_df = pd.DataFrame(
+        {
+            key: [f"{key}-{value}" for value in rng.permutation(row_count)]
+            for key in keys
+        }
+    )
+    cost_df["cost"] = rng.random(row_count)
+    asset_df = cost_df[keys].sample(frac=0.5, random_state=0)
+    asset_df["count"] = rng.random(len(asset_df))
+
+    dt_mgr = run_join([cost_df, asset_df], "left", keys=keys)
+    key_codes, _ = dt_mgr._encode_join_keys([cost_df, asset_df], keys)
+
+    assert all(isinstance(codes, pd.MultiIndex) for codes in key_codes)
+    assert dt_mgr.join_info["key_cardinality"] == {key: row_count for key in keys}
+    _assert_same_join([cost_df, asset_df], "left", keys=keys)
+
+
+@pytest.mark.parametrize(
+    "how, gap_columns",
+    [
+        ("left", {"asset_label", "count"}),
+        ("right", {"cost_label", "cost"}),
+        ("outer", {"cost_label", "cost", "asset_label", "count"}),
+        ("inner", set()),
+    ],
+)
+def test_get_join_gap_columns(how, gap_columns):
+    data_frames = [
+        pd.DataFrame(columns=["project_id", "cost_label", "cost"]),
+        pd.DataFrame(columns=["project_id", "asset_label", "count"]),
+    ]
+
+    assert (
+        DataTransformationManager._get_join_gap_columns(
+            data_frames, how, ["project_id"]
+        )
+        == gap_columns
+    )
+
+
+@pytest.mark.parametrize("how", ["left", "right", "inner", "outer"])
+def test_gap_fill_matches_full_fillna(how):
+    # Columns outside the gap columns are still filled when their input has NA
+    cost_df, asset_df = make_join_frames(300, with_nan=True)
+    asset_df["tier"] = np.where(np.arange(len(asset_df)) % 4 == 0, None, "gold")
+
+    joined_df = _assert_same_join([cost_df, asset_df], how)
+
+    assert not joined_df.isna().any().any()
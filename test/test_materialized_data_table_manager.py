@@ -0,0 +1,61 @@
+from datetime import datetime, timedelta
+from unittest import mock
+
+import pandas as pd
+
+from spaceone.dashboard.manager.materialized_data_table_manager import (
+    MaterializedDataTableManager,
+)
+
+
+def _make_manager() -> MaterializedDataTableManager:
+    materialized_mgr = MaterializedDataTableManager()
+    materialized_mgr.materialized_model = mock.Mock()
+    return materialized_mgr
+
+
+def test_delete_unused_materialized_data_tables():
+    materialized_mgr = _make_manager()
+    materialized_mgr.delete_unused_materialized_data_tables("PUBLIC")
+
+    conditions = [
+        call.kwargs
+        for call in materialized_mgr.materialized_model.filter.call_args_list
+    ]
+    read_after = conditions[1].pop("read_at__lt")
+
+    assert conditions == [
+        {"data_table_type": "PUBLIC", "state": "EXPIRED"},
+        {"data_table_type": "PUBLIC"},
+        {"data_table_type": "PUBLIC", "read_at": None},
+    ]
+    ttl_read_after = datetime.utcnow() - timedelta(hours=7 * 24)
+    assert abs(ttl_read_after - read_after) < timedelta(minutes=1)
+
+
+def test_update_read_at_once_per_refresh_interval():
+    materialized_mgr = _make_manager()
+    recent_vo = mock.Mock(read_at=datetime.utcnow() - timedelta(minutes=5))
+    old_vo = mock.Mock(read_at=datetime.utcnow() - timedelta(hours=2))
+    unread_vo = mock.Mock(read_at=None)
+
+    for materialized_vo in [recent_vo, old_vo, unread_vo]:
+        materialized_mgr.update_read_at(materialized_vo)
+
+    recent_vo.update.assert_not_called()
+    old_vo.update.assert_called_once()
+    unread_vo.update.assert_called_once()
+
+
+def test_save_data_frame_records_read_at_on_create():
+    materialized_mgr = _make_manager()
+    materialized_mgr.save_data_frame(
+        None,
+        {"data_table_id": "dt-test"},
+        pd.DataFrame({"cost": [1.0]}),
+        ["cost"],
+        [],
+    )
+
+    params = materialized_mgr.materialized_model.create.call_args[0][0]
+    assert params["read_at"] == params["refreshed_at"]
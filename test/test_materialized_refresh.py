@@ -0,0 +1,139 @@
+from datetime import datetime
+from types import SimpleNamespace
+from unittest import mock
+
+import pandas as pd
+import pytest
+from dateutil.relativedelta import relativedelta
+
+from spaceone.dashboard.manager import data_table_manager
+from spaceone.dashboard.manager.data_table_manager import DataTableManager
+
+NOW = datetime.utcnow()
+OPEN_PERIOD = NOW.strftime("%Y-%m")
+CLOSED_PERIOD = (NOW - relativedelta(months=1)).strftime("%Y-%m")
+START = (NOW - relativedelta(months=2)).strftime("%Y-%m")
+
+
+class FakeDataTableManager(DataTableManager):
+    def __init__(self, loaded_df: pd.DataFrame, is_incremental: bool = True):
+        super().__init__()
+        self.loaded_df = loaded_df
+        self.incremental = is_incremental
+        self.data_table_type = "PUBLIC"
+        self.widget_id = None
+        self.domain_id = "domain-test"
+        self.load_calls = []
+        self.data_keys = ["cost"]
+        self.label_keys = [column for column in loaded_df.columns if column != "cost"]
+
+    def is_incremental(self) -> bool:
+        return self.incremental
+
+    def load(self, granularity, start=None, end=None, vars=None) -> pd.DataFrame:
+        self.load_calls.append((start, end))
+        self.state = "AVAILABLE"
+        self.df = self.loaded_df.copy()
+        return self.df
+
+
+def _make_materialized_vo() -> SimpleNamespace:
+    return SimpleNamespace(
+        data_table_id="dt-test",
+        granularity="MONTHLY",
+        start=START,
+        end=OPEN_PERIOD,
+        vars=None,
+        state="AVAILABLE",
+        refreshed_at=NOW,
+        data=None,
+        data_keys=["cost"],
+        label_keys=["provider"],
+    )
+
+
+def _refresh(dt_mgr: DataTableManager, stored_df: pd.DataFrame) -> pd.DataFrame:
+    materialized_mgr = mock.Mock()
+    materialized_mgr.restore_data_frame.return_value = stored_df
+
+    with mock.patch.object(
+        data_table_manager,
+        "MaterializedDataTableManager",
+        return_value=materialized_mgr,
+    ):
+        dt_mgr.refresh_materialized(_make_materialized_vo())
+
+    return materialized_mgr.save_data_frame.call_args[0][2]
+
+
+def test_incremental_refresh_fetches_only_the_open_period():
+    stored_df = pd.DataFrame(
+        {
+            "Date": [START, CLOSED_PERIOD, OPEN_PERIOD],
+            "provider": ["aws", "aws", "aws"],
+            "cost": [1.0, 2.0, 3.0],
+        }
+    )
+    open_df = pd.DataFrame({"Date": [OPEN_PERIOD], "provider": ["aws"], "cost": [5.0]})
+    dt_mgr = FakeDataTableManager(open_df)
+
+    saved_df = _refresh(dt_mgr, stored_df)
+
+    assert dt_mgr.load_calls == [(OPEN_PERIOD, OPEN_PERIOD)]
+    assert saved_df["cost"].tolist() == [1.0, 2.0, 5.0]
+
+
+@pytest.mark.parametrize("is_incremental", [True, False])
+def test_refresh_without_date_column_loads_once(is_incremental):
+    stored_df = pd.DataFrame({"provider": ["aws"], "cost": [1.0]})
+    full_df = pd.DataFrame({"provider": ["aws"], "cost": [7.0]})
+    dt_mgr = FakeDataTableManager(full_df, is_incremental)
+
+    saved_df = _refresh(dt_mgr, stored_df)
+
+    assert dt_mgr.load_calls == [(START, OPEN_PERIOD)]
+    assert saved_df["cost"].tolist() == [7.0]
+
+
+def _load_materialized(
+    dt_mgr: DataTableManager, materialized_vo: SimpleNamespace, is_stale: bool
+) -> mock.Mock:
+    materialized_mgr = mock.Mock()
+    materialized_mgr.get_materialized_data_table.return_value = materialized_vo
+    materialized_mgr.is_stale.return_value = is_stale
+    materialized_mgr.restore_data_frame.return_value = pd.DataFrame(
+        {"provider": ["aws"], "cost": [1.0]}
+    )
+    materialized_mgr.save_data_frame.return_value = materialized_vo
+
+    with mock.patch.object(
+        data_table_manager,
+        "MaterializedDataTableManager",
+        return_value=materialized_mgr,
+    ):
+        dt_mgr.load_materialized(materialized_vo, "MONTHLY", START, OPEN_PERIOD)
+
+    return materialized_mgr
+
+
+def test_load_materialized_serves_a_fresh_result():
+    dt_mgr = FakeDataTableManager(pd.DataFrame({"provider": ["aws"], "cost": [7.0]}))
+
+    materialized_mgr = _load_materialized(dt_mgr, _make_materialized_vo(), False)
+
+    assert dt_mgr.load_calls == []
+    assert dt_mgr.df["cost"].tolist() == [1.0]
+    materialized_mgr.save_data_frame.assert_not_called()
+
+
+def test_load_materialized_recomputes_a_stale_result():
+    # Without a scheduler refresh, a result is not served past the interval
+    dt_mgr = FakeDataTableManager(pd.DataFrame({"provider": ["aws"], "cost": [7.0]}))
+    materialized_vo = _make_materialized_vo()
+
+    materialized_mgr = _load_materialized(dt_mgr, materialized_vo, True)
+
+    assert dt_mgr.load_calls == [(START, OPEN_PERIOD)]
+    assert dt_mgr.df["cost"].tolist() == [7.0]
+    assert materialized_mgr.save_data_frame.call_args[0][0] is materialized_vo
+    materialized_mgr.update_read_at.assert_not_called()
@@ -0,0 +1,209 @@
+from typing import Union
+
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from spaceone.dashboard.error.data_table import ERROR_INVALID_PARAMETER
+from spaceone.dashboard.manager.data_table_manager.data_transformation_manager import (
+    DataTransformationManager,
+)
+
+from test.transformation_utils import make_cost_df, normalize, run_operator
+
+
+class LegacyPivotManager(DataTransformationManager):
+    """PIVOT as it was before the columns were picked from the totals."""
+
+    def pivot_data_table(self, granularity, start=None, end=None, vars=None) -> None:
+        origin_vo = self.data_table_vos[0]
+        field_options = self.options["fields"]
+        labels, column, data = (
+            field_options.get("labels"),
+            field_options["column"],
+            field_options["data"],
+        )
+        function = self.options.get("function", "sum")
+
+        raw_df = self._get_data_table(origin_vo, granularity, start, end, vars)
+
+        if raw_df.empty:
+            self.df = raw_df
+        else:
+            self._check_columns(raw_df, labels, column, data)
+            fill_value = self._set_fill_value_from_df(raw_df, data)
+
+            pivot_table = self._legacy_create_pivot_table(
+                raw_df, labels, column, data, function, fill_value
+            )
+
+            self.df = self._legacy_sort_and_filter_pivot_table(pivot_table)
+
+    def _legacy_create_pivot_table(
+        self,
+        raw_df: pd.DataFrame,
+        labels: list,
+        column: str,
+        data: str,
+        function: str,
+        fill_value: Union[int, str],
+    ) -> pd.DataFrame:
+        try:
+            self._validate_function(function)
+            pivot_table = pd.pivot_table(
+                raw_df,
+                values=[data],
+                index=labels,
+                columns=[column],
+                aggfunc=function,
+                fill_value=fill_value,
+                observed=True,
+            )
+            pivot_table.reset_index(inplace=True)
+            self._legacy_set_keys(list(pivot_table.columns))
+            return self._legacy_set_new_column_names(pivot_table)
+        except Exception as e:
+            raise ERROR_INVALID_PARAMETER(key="options.PIVOT", reason=str(e))
+
+    @staticmethod
+    def _legacy_set_new_column_names(pivot_table: pd.DataFrame) -> pd.DataFrame:
+        if pivot_table.columns[0] == "index":
+            pivot_table = pivot_table.iloc[:, 1:]
+        else:
+            pivot_table.columns = [
+                lower_col if lower_col else upper_col
+                for upper_col, lower_col in pivot_table.columns
+            ]
+        return pivot_table
+
+    def _legacy_set_keys(self, columns: list) -> None:
+        if columns[0] == "index":
+            self.label_keys = []
+            self.data_keys = [col for col in columns if col != "index"]
+        else:
+            self.label_keys = [
+                upper_col for upper_col, lower_col in columns if not lower_col
+            ]
+            self.data_keys = [
+                lower_col for upper_col, lower_col in columns if lower_col
+            ]
+
+    def _legacy_sort_and_filter_pivot_table(
+        self, pivot_table: pd.DataFrame
+    ) -> pd.DataFrame:
+        column_fields = list(set(pivot_table.columns) - set(self.label_keys))
+        self.total_series = pivot_table[column_fields].sum(axis=1)
+
+        pivot_table = self._apply_row_sorting(pivot_table)
+
+        if select_fields := self.options.get("select"):
+            self._validate_select_fields(select_fields, column_fields)
+            pivot_table = pivot_table[self.label_keys + select_fields]
+            column_fields = select_fields
+
+        if order_by := self.options.get("order_by"):
+            self._validate_order_by_type(order_by)
+            order_by_type = order_by.get("type", "key")
+            desc = order_by.get("desc", False)
+            if order_by_type == "key":
+                sorted_columns = sorted(column_fields, reverse=desc)
+            else:
+                column_sums = pivot_table.drop(columns=self.label_keys).sum()
+                sorted_columns = column_sums.sort_values(
+                    ascending=not desc
+                ).index.tolist()
+            pivot_table = pivot_table[self.label_keys + sorted_columns]
+
+        if limit := self.options.get("limit"):
+            limit = int(limit)
+            limited_columns = pivot_table.iloc[
+                :, len(self.label_keys) : len(self.label_keys) + limit
+            ]
+            pivot_table = pivot_table.iloc[:, : len(self.label_keys) + limit]
+
+            pivot_table["Others"] = self.total_series.loc[
+                pivot_table.index
+            ] - limited_columns.sum(axis=1)
+
+        pivot_table["Sub Total"] = self.total_series.loc[pivot_table.index]
+        self.data_keys = [
+            col for col in pivot_table.columns if col not in set(self.label_keys)
+        ]
+
+        return pivot_table
+
+
+def _run_both(options: dict, df: pd.DataFrame, categorical_labels: bool = False):
+    new_mgr = run_operator("PIVOT", options, df, categorical_labels=categorical_labels)
+    legacy_mgr = run_operator(
+        "PIVOT",
+        options,
+        df,
+        manager_class=LegacyPivotManager,
+        categorical_labels=categorical_labels,
+    )
+    return new_mgr, legacy_mgr
+
+
+@pytest.mark.parametrize("labels", [["provider"], ["provider", "region"], None])
+@pytest.mark.parametrize("function", ["sum", "mean", "max", "min"])
+@pytest.mark.parametrize(
+    "pivot_options",
+    [
+        {},
+        {"limit": 5},
+        {"limit": 5.0, "order_by": {"type": "value", "desc": True}},
+        {"order_by": {"type": "key", "desc": True}},
+        {"order_by": {"type": "value"}, "limit": 3},
+        {"select": ["product-1", "product-3", "product-7"]},
+        {"select": ["product-1", "product-3", "product-7"], "limit": 2},
+    ],
+)
+@pytest.mark.parametrize("categorical_labels", [False, True])
+def test_pivot_matches_legacy(labels, function, pivot_options, categorical_labels):
+    df = make_cost_df()
+    options = {
+        "fields": {"labels": labels, "column": "product", "data": "cost"},
+        "function": function,
+        **pivot_options,
+    }
+
+    new_mgr, legacy_mgr = _run_both(options, df, categorical_labels)
+
+    pdt.assert_frame_equal(normalize(new_mgr.df), normalize(legacy_mgr.df))
+    assert new_mgr.label_keys == legacy_mgr.label_keys
+    assert new_mgr.data_keys == legacy_mgr.data_keys
+
+
+def test_pivot_others_is_row_total_minus_kept_columns():
+    df = pd.DataFrame(
+        {
+            "provider": ["aws", "aws", "aws", "google", "google"],
+            "product": ["a", "b", "c", "a", "c"],
+            "cost": [1.0, 2.0, 4.0, 8.0, None],
+        }
+    )
+    options = {
+        "fields": {"labels": ["provider"], "column": "product", "data": "cost"},
+        "order_by": {"type": "value", "desc": True},
+        "limit": 1,
+    }
+
+    new_mgr, legacy_mgr = _run_both(options, df)
+
+    assert new_mgr.df.to_dict("records") == [
+        {"provider": "google", "a": 8.0, "Others": 0.0, "Sub Total": 8.0},
+        {"provider": "aws", "a": 1.0, "Others": 6.0, "Sub Total": 7.0},
+    ]
+    pdt.assert_frame_equal(normalize(new_mgr.df), normalize(legacy_mgr.df))
+
+
+def test_pivot_invalid_select_is_rejected_like_legacy():
+    options = {
+        "fields": {"labels": ["provider"], "column": "product", "data": "cost"},
+        "select": ["unknown-product"],
+    }
+
+    for manager_class in [DataTransformationManager, LegacyPivotManager]:
+        with pytest.raises(ERROR_INVALID_PARAMETER):
+            run_operator("PIVOT", options, make_cost_df(), manager_class=manager_class)
@@ -0,0 +1,105 @@
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from spaceone.dashboard.error.data_table import ERROR_INVALID_PARAMETER
+from spaceone.dashboard.manager.data_table_manager.data_transformation_manager import (
+    DataTransformationManager,
+)
+
+from test.transformation_utils import make_cost_df, normalize, run_operator
+
+
+class LegacyQueryManager(DataTransformationManager):
+    """QUERY as it was before the conditions were fused into one mask."""
+
+    def apply_conditions(self, df: pd.DataFrame, conditions: list) -> pd.DataFrame:
+        df = df.copy()
+        for condition in conditions:
+            df = self._legacy_apply_query(df, condition)
+        return df
+
+    def _legacy_apply_query(self, df: pd.DataFrame, condition: str) -> pd.DataFrame:
+        try:
+            fields_in_condition = self.extract_fields_from_condition(condition)
+
+            if "Date" in fields_in_condition:
+                for field in fields_in_condition:
+                    if field in df.columns:
+                        df[field] = pd.to_datetime(df[field], errors="coerce")
+
+                df = df.query(condition).copy()
+
+                for field in fields_in_condition:
+                    if field in df.columns:
+                        df[field] = df[field].astype(str)
+            else:
+                df = df.query(condition).copy()
+
+        except Exception:
+            raise ERROR_INVALID_PARAMETER(key="query.condition", reason=condition)
+
+        return df
+
+
+@pytest.mark.parametrize(
+    "conditions",
+    [
+        ["provider == 'aws'"],
+        ["provider == 'aws'", "cost > 50"],
+        ["provider in ['aws', 'google']", "usage >= 100", "region != 'region-1'"],
+        ["`Date` >= '2024-02'"],
+        ["`Date` >= '2024-02'", "provider == 'azure'", "`Date` < '2024-03'"],
+        ["cost > 10000"],
+        ["cost == cost"],
+        # Conditions reading the whole column filter the rows kept so far
+        ["provider == 'aws'", "cost > cost.mean()"],
+        ["cost > cost.median()", "usage > usage.mean()"],
+        ["`Date` >= '2024-02'", "cost > cost.mean()"],
+    ],
+)
+@pytest.mark.parametrize("categorical_labels", [False, True])
+@pytest.mark.parametrize("with_nan", [True, False])
+def test_query_matches_legacy(conditions, categorical_labels, with_nan):
+    df = make_cost_df(with_nan=with_nan)
+    options = {"conditions": conditions}
+
+    new_mgr = run_operator(
+        "QUERY", options, df, categorical_labels=categorical_labels
+    )
+    legacy_mgr = run_operator(
+        "QUERY",
+        options,
+        df,
+        manager_class=LegacyQueryManager,
+        categorical_labels=categorical_labels,
+    )
+
+    pdt.assert_frame_equal(normalize(new_mgr.df), normalize(legacy_mgr.df))
+
+
+def test_query_with_global_variables_matches_legacy():
+    options = {"conditions": ["provider == {{ global.provider }}", "cost > 10"]}
+    vars = {"provider": "google"}
+
+    new_mgr = run_operator("QUERY", options, make_cost_df(), vars=vars)
+    legacy_mgr = run_operator(
+        "QUERY", options, make_cost_df(), manager_class=LegacyQueryManager, vars=vars
+    )
+
+    assert set(new_mgr.df["provider"]) == {"google"}
+    pdt.assert_frame_equal(normalize(new_mgr.df), normalize(legacy_mgr.df))
+
+
+def test_query_does_not_convert_the_input_frame():
+    df = make_cost_df()
+    dt_mgr = run_operator("QUERY", {"conditions": ["`Date` >= '2024-02'"]}, df)
+    input_df = dt_mgr.data_frames.get("source")
+
+    assert dt_mgr.df["Date"].isin(["2024-02-01", "2024-03-01"]).all()
+    assert input_df is None or input_df["Date"].isin(df["Date"]).all()
+
+
+def test_invalid_condition_is_rejected():
+    with pytest.raises(ERROR_INVALID_PARAMETER):
+        run_operator("QUERY", {"conditions": ["unknown_column > 1"]}, make_cost_df())
@@ -0,0 +1,155 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import pytest
+
+from spaceone.dashboard.manager.single_flight_manager import SingleFlightManager
+
+ADMIN_META = {
+    "authorization.domain_id": "domain-test",
+    "authorization.role_type": "DOMAIN_ADMIN",
+}
+USER_META = {
+    "authorization.domain_id": "domain-test",
+    "authorization.role_type": "WORKSPACE_MEMBER",
+    "authorization.workspace_id": "workspace-a",
+    "authorization.user_id": "user-a",
+}
+PARAMS = {"query": {"granularity": "MONTHLY", "group_by": ["provider"]}}
+
+_scope = threading.local()
+
+
+class FakeTransaction:
+    def __init__(self, meta: dict):
+        self.meta = meta
+
+    def get_meta(self, key: str, default=None):
+        return self.meta.get(key, default)
+
+
+class FakeConnector:
+    """Holds every upstream call until it is released."""
+
+    def __init__(self, error: Exception = None):
+        self.error = error
+        self.calls = []
+        self.lock = threading.Lock()
+        self.released = threading.Event()
+
+    def dispatch(self, method: str, params: dict, **kwargs) -> dict:
+        with self.lock:
+            self.calls.append((method, params))
+
+        assert self.released.wait(5)
+        if self.error:
+            raise self.error
+        return {"results": [{"provider": "aws", "cost": 1.0}]}
+
+
+@pytest.fixture(autouse=True)
+def single_flight_state():
+    with mock.patch.object(SingleFlightManager, "_in_flight", {}), mock.patch.object(
+        SingleFlightManager, "_stats", {}
+    ), mock.patch.object(
+        SingleFlightManager,
+        "transaction",
+        new_callable=mock.PropertyMock,
+        side_effect=lambda *args: FakeTransaction(_scope.meta),
+    ):
+        yield
+
+
+def _wait_until(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def _dispatch(connector: FakeConnector, meta: dict, method: str = "Cost.analyze"):
+    _scope.meta = meta
+    return SingleFlightManager().dispatch(connector, method, PARAMS)
+
+
+def _dispatch_concurrently(
+    connector: FakeConnector, metas: list, upstream_calls: int
+) -> list:
+    with ThreadPoolExecutor(max_workers=len(metas)) as executor:
+        futures = [executor.submit(_dispatch, connector, meta) for meta in metas]
+
+        # Every caller has either reached the connector or joined a flight
+        _wait_until(
+            lambda: len(connector.calls) == upstream_calls
+            and SingleFlightManager.get_stats()["Cost.analyze"]["calls"] == len(metas)
+        )
+        connector.released.set()
+
+        return [future.exception() or future.result() for future in futures]
+
+
+def test_identical_calls_make_one_upstream_call():
+    connector = FakeConnector()
+
+    responses = _dispatch_concurrently(connector, [USER_META, USER_META], 1)
+
+    assert len(connector.calls) == 1
+    assert responses[0] == responses[1] == {
+        "results": [{"provider": "aws", "cost": 1.0}]
+    }
+
+
+@pytest.mark.parametrize(
+    "other_meta",
+    [
+        {**USER_META, "authorization.workspace_id": "workspace-b"},
+        {**USER_META, "authorization.user_id": "user-b"},
+        ADMIN_META,
+    ],
+)
+def test_calls_of_other_scopes_are_not_coalesced(other_meta):
+    connector = FakeConnector()
+
+    _dispatch_concurrently(connector, [USER_META, other_meta], 2)
+
+    assert len(connector.calls) == 2
+    assert SingleFlightManager.get_stats()["Cost.analyze"]["coalesced"] == 0
+
+
+def test_leader_error_is_raised_in_every_follower():
+    error = ValueError("upstream failed")
+    connector = FakeConnector(error=error)
+
+    errors = _dispatch_concurrently(connector, [USER_META] * 3, 1)
+
+    assert errors == [error] * 3
+    assert len(connector.calls) == 1
+
+
+def test_in_flight_call_is_removed_after_an_error():
+    connector = FakeConnector(error=ValueError("upstream failed"))
+    connector.released.set()
+
+    with pytest.raises(ValueError):
+        _dispatch(connector, USER_META)
+
+    assert SingleFlightManager._in_flight == {}
+
+    # The next call goes upstream instead of waiting on the failed one
+    connector.error = None
+    assert _dispatch(connector, USER_META)["results"]
+    assert len(connector.calls) == 2
+
+
+def test_get_stats_counts_calls_and_coalesced_calls():
+    connector = FakeConnector()
+
+    _dispatch_concurrently(connector, [USER_META, USER_META, ADMIN_META], 2)
+    _dispatch(connector, USER_META, method="Cost.analyze_data_source")
+
+    assert SingleFlightManager.get_stats() == {
+        "Cost.analyze": {"calls": 3, "coalesced": 1},
+        "Cost.analyze_data_source": {"calls": 1, "coalesced": 0},
+    }
@@ -0,0 +1,152 @@
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from spaceone.dashboard.manager import data_table_manager
+from spaceone.dashboard.manager.data_table_manager import DataTableManager
+
+ROW_COUNT = 25
+DATA_INFO = {"cost": {"unit": "USD"}}
+LABELS_INFO = {"provider": {}, "region": {}}
+
+
+class FakeDataTableManager(DataTableManager):
+    def __init__(self, df: pd.DataFrame):
+        super().__init__()
+        self.df = df
+        self.data_keys = ["cost"]
+        self.label_keys = ["provider", "region"]
+
+    def get_data_and_labels_info(self) -> tuple:
+        return DATA_INFO, LABELS_INFO
+
+
+def _make_df(categorical_labels: bool = False) -> pd.DataFrame:
+    providers = ["aws", "google", None]
+    df = pd.DataFrame(
+        {
+            "provider": [providers[index % 3] for index in range(ROW_COUNT)],
+            "region": [f"region-{index % 4}" for index in range(ROW_COUNT)],
+            "cost": np.arange(ROW_COUNT, dtype="float64") * 7 % 11,
+        }
+    )
+    if categorical_labels:
+        df = DataTableManager.encode_labels(df, ["provider", "region"])
+    return df
+
+
+def _stream(generate, chunk_size: int) -> tuple:
+    def get_global(key, default=None):
+        return chunk_size if key == "DATA_TABLE_STREAM_CHUNK_SIZE" else default
+
+    with mock.patch.object(
+        data_table_manager.config, "get_global", side_effect=get_global
+    ):
+        header, *chunks = list(generate())
+
+    return header, chunks
+
+
+def _rows(chunks: list) -> list:
+    return [row for chunk in chunks for row in chunk["results"]]
+
+
+@pytest.mark.parametrize(
+    "chunk_size, chunk_lengths",
+    [
+        (10, [10, 10, 5]),
+        (25, [25]),
+        (100, [25]),
+        (1, [1] * ROW_COUNT),
+        (0, [1] * ROW_COUNT),
+    ],
+)
+def test_chunks_are_bounded_by_the_chunk_size(chunk_size, chunk_lengths):
+    dt_mgr = FakeDataTableManager(_make_df())
+
+    _, chunks = _stream(dt_mgr.stream_response_data, chunk_size)
+
+    assert [len(chunk["results"]) for chunk in chunks] == chunk_lengths
+    assert all(set(chunk.keys()) == {"results"} for chunk in chunks)
+
+
+@pytest.mark.parametrize("categorical_labels", [False, True])
+def test_stream_matches_the_response(categorical_labels):
+    response = FakeDataTableManager(_make_df(categorical_labels)).response_data()
+    dt_mgr = FakeDataTableManager(_make_df(categorical_labels))
+
+    header, chunks = _stream(dt_mgr.stream_response_data, 10)
+
+    assert header == {
+        "total_count": ROW_COUNT,
+        "labels_info": LABELS_INFO,
+        "data_info": DATA_INFO,
+        "order": ["provider", "region", "cost"],
+    }
+    assert header == {k: v for k, v in response.items() if k != "results"}
+    assert _rows(chunks) == response["results"]
+    assert dt_mgr.df is None
+
+
+def test_sort_and_page_are_applied_before_chunking():
+    sort = [{"key": "cost", "desc": True}, {"key": "region"}]
+    page = {"start": 3, "limit": 12}
+    response = FakeDataTableManager(_make_df()).response_data(sort, page)
+    dt_mgr = FakeDataTableManager(_make_df())
+
+    header, chunks = _stream(lambda: dt_mgr.stream_response_data(sort, page), 5)
+
+    assert header["total_count"] == ROW_COUNT
+    assert [len(chunk["results"]) for chunk in chunks] == [5, 5, 2]
+    assert _rows(chunks) == response["results"]
+
+    costs = [row["cost"] for row in _rows(chunks)]
+    assert costs == sorted(_make_df()["cost"], reverse=True)[2:14]
+
+
+def test_empty_frame_streams_only_the_header():
+    dt_mgr = FakeDataTableManager(_make_df().iloc[0:0])
+
+    header, chunks = _stream(dt_mgr.stream_response_data, 10)
+
+    assert header["total_count"] == 0
+    assert chunks == []
+
+
+def _make_widget_response() -> dict:
+    return {
+        "results": FakeDataTableManager(_make_df()).response_data()["results"],
+        "total_count": ROW_COUNT,
+        "labels_info": LABELS_INFO,
+        "data_info": DATA_INFO,
+        "order": ["provider", "region", "cost"],
+        "materialized": {"refreshed_at": "2024-01-01T00:00:00Z", "is_stale": False},
+    }
+
+
+@pytest.mark.parametrize(
+    "sort, page, chunk_lengths",
+    [
+        (None, None, [10, 10, 5]),
+        ([{"key": "cost"}], None, [10, 10, 5]),
+        ([{"key": "cost", "desc": True}], {"start": 3, "limit": 12}, [10, 2]),
+        (None, {"start": 24, "limit": 10}, [2]),
+    ],
+)
+def test_widget_stream_matches_the_widget_response(sort, page, chunk_lengths):
+    widget_response = _make_widget_response()
+    dt_mgr = FakeDataTableManager(None)
+    response = dt_mgr.response_data_from_widget(widget_response, sort, page)
+
+    header, chunks = _stream(
+        lambda: dt_mgr.stream_response_data_from_widget(widget_response, sort, page),
+        10,
+    )
+
+    assert header == {k: v for k, v in response.items() if k != "results"}
+    assert header["total_count"] == ROW_COUNT
+    assert header["materialized"] == widget_response["materialized"]
+    assert [len(chunk["results"]) for chunk in chunks] == chunk_lengths
+    assert _rows(chunks) == response["results"]
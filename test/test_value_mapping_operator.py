@@ -0,0 +1,146 @@
+import pandas as pd
+import pandas.testing as pdt
+import pytest
+
+from spaceone.dashboard.manager.data_table_manager.data_transformation_manager import (
+    DataTransformationManager,
+)
+
+from test.transformation_utils import make_cost_df, normalize, run_operator
+
+
+class LegacyValueMappingManager(DataTransformationManager):
+    """VALUE_MAPPING as it was before the cases were resolved per distinct key."""
+
+    def value_mapping_data_table(
+        self, granularity, start=None, end=None, vars=None
+    ) -> None:
+        data_table_vo = self.data_table_vos[0]
+        df = self._get_data_table(data_table_vo, granularity, start, end, vars)
+
+        self.label_keys = list(data_table_vo.labels_info.keys())
+        self.data_keys = list(data_table_vo.data_info.keys())
+
+        name = self.options["name"]
+        field_type = self.options.get("field_type", "LABEL")
+
+        if name in df.columns:
+            df = self.decode_labels(df, [name])
+
+        filtered_df = self.filter_data(df, vars).copy()
+        filtered_df = self._legacy_apply_cases(filtered_df)
+
+        df.loc[filtered_df.index, name] = filtered_df[name]
+        self.handle_unfiltered_data(df, filtered_df, name, field_type)
+
+        if self.categorical_labels and field_type == "LABEL":
+            df = self.encode_labels(df, [name])
+
+        self.df = df
+
+    def _legacy_apply_cases(self, filtered_df: pd.DataFrame) -> pd.DataFrame:
+        name = self.options["name"]
+        key = self.options["key"]
+        else_value = self.options.get("else")
+        cases = self.options.get("cases", [])
+
+        if key not in filtered_df.columns:
+            if name not in filtered_df.columns:
+                filtered_df[name] = pd.NA
+            return filtered_df
+
+        if name not in filtered_df.columns:
+            filtered_df[name] = pd.NA
+
+        if not filtered_df.empty:
+            temp_key_column = f"_{key}_backup"
+            if temp_key_column not in filtered_df.columns:
+                filtered_df[temp_key_column] = filtered_df[key]
+
+            for case in cases:
+                self._validate_case(case)
+                operator = case["operator"]
+                value = case["value"]
+                match = case["match"].strip()
+
+                if operator == "eq":
+                    condition = (filtered_df[key] == match) & (filtered_df[name].isna())
+                    filtered_df.loc[condition, name] = value
+
+                elif operator == "regex":
+                    condition = (filtered_df[key].str.contains(match, na=False)) & (
+                        filtered_df[name].isna()
+                    )
+                    filtered_df.loc[condition, name] = value
+
+            if else_value is not None:
+                filtered_df.loc[filtered_df[name].isna(), name] = else_value
+            else:
+                if name in filtered_df.columns:
+                    filtered_df.loc[filtered_df[name].isna(), name] = filtered_df[
+                        temp_key_column
+                    ]
+
+            filtered_df.drop(columns=[temp_key_column], inplace=True)
+
+        return filtered_df
+
+
+CASES = [
+    {"match": "region-1", "value": "Seoul", "operator": "eq"},
+    {"match": "region-1.*", "value": "Seoul Group", "operator": "regex"},
+    {"match": "^region-[2-4]$", "value": "Tokyo", "operator": "regex"},
+    {"match": " region-5 ", "value": "Virginia", "operator": "eq"},
+]
+
+
+@pytest.mark.parametrize(
+    "mapping_options",
+    [
+        {"name": "Region Name", "key": "region", "cases": CASES},
+        {"name": "Region Name", "key": "region", "cases": CASES, "else": "Others"},
+        {"name": "region", "key": "region", "cases": CASES},
+        {"name": "Region Name", "key": "unknown", "cases": CASES},
+        {
+            "name": "Region Name",
+            "key": "region",
+            "cases": CASES,
+            "condition": "provider == 'aws'",
+        },
+        {
+            "name": "Region Name",
+            "key": "region",
+            "cases": CASES,
+            "field_type": "DATA",
+            "else": 0,
+        },
+    ],
+)
+@pytest.mark.parametrize("categorical_labels", [False, True])
+def test_value_mapping_matches_legacy(mapping_options, categorical_labels):
+    df = make_cost_df()
+
+    new_mgr = run_operator(
+        "VALUE_MAPPING", mapping_options, df, categorical_labels=categorical_labels
+    )
+    legacy_mgr = run_operator(
+        "VALUE_MAPPING",
+        mapping_options,
+        df,
+        manager_class=LegacyValueMappingManager,
+        categorical_labels=categorical_labels,
+    )
+
+    pdt.assert_frame_equal(normalize(new_mgr.df), normalize(legacy_mgr.df))
+    assert new_mgr.label_keys == legacy_mgr.label_keys
+    assert new_mgr.data_keys == legacy_mgr.data_keys
+
+
+def test_value_mapping_keeps_the_first_matching_case():
+    df = pd.DataFrame({"region": ["region-1", "region-10", None], "cost": [1.0] * 3})
+    options = {"name": "Region Name", "key": "region", "cases": CASES}
+
+    dt_mgr = run_operator("VALUE_MAPPING", options, df)
+
+    assert dt_mgr.df["Region Name"].tolist()[:2] == ["Seoul", "Seoul Group"]
+    assert pd.isna(dt_mgr.df["Region Name"].iloc[2])
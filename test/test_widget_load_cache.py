@@ -0,0 +1,78 @@
+from unittest import mock
+
+import pandas as pd
+
+from spaceone.dashboard.manager import data_table_manager
+from spaceone.dashboard.manager.data_table_manager import DataTableManager
+
+
+class FakeDataTableManager(DataTableManager):
+    def __init__(self, widget_id: str):
+        super().__init__()
+        self.widget_id = widget_id
+        self.domain_id = "domain-test"
+        self.data_keys = ["cost"]
+        self.label_keys = ["provider"]
+        self.load_calls = 0
+
+    def get_data_and_labels_info(self) -> tuple:
+        return {"cost": {}}, {"provider": {}}
+
+    def load(self, granularity, start=None, end=None, vars=None) -> pd.DataFrame:
+        self.load_calls += 1
+        self.df = pd.DataFrame({"provider": ["aws", "google"], "cost": [1.0, 2.0]})
+        return self.df
+
+
+def _cached_keys(load_func) -> list:
+    with mock.patch.object(
+        data_table_manager.cache, "get", return_value=None
+    ), mock.patch.object(data_table_manager.cache, "set") as cache_set:
+        load_func()
+
+    return [call.args[0] for call in cache_set.call_args_list]
+
+
+def test_group_load_caches_each_widget_under_its_own_data_table():
+    widgets = [
+        {"widget_id": "widget-a", "data_table_id": "dt-a"},
+        {"widget_id": "widget-b", "data_table_id": "dt-b"},
+    ]
+    for widget in widgets:
+        widget["data_table_widget_id"] = widget["widget_id"]
+
+    group_mgr = FakeDataTableManager("widget-a")
+    group_keys = _cached_keys(
+        lambda: group_mgr.load_from_widgets(
+            "dt-a", widgets, "MONTHLY", "2024-01", "2024-03"
+        )
+    )
+
+    single_keys = []
+    for widget in widgets:
+        single_mgr = FakeDataTableManager(widget["data_table_widget_id"])
+        single_keys += _cached_keys(
+            lambda: single_mgr.load_from_widget(
+                widget["data_table_id"], "MONTHLY", "2024-01", "2024-03"
+            )
+        )
+
+    assert group_mgr.load_calls == 1
+    assert group_keys == single_keys
+    assert ":widget-b:" in group_keys[1]
+
+
+def test_group_load_without_widget_data_tables_uses_the_manager():
+    group_mgr = FakeDataTableManager("widget-a")
+    group_keys = _cached_keys(
+        lambda: group_mgr.load_from_widgets(
+            "dt-a", [{"widget_id": "widget-a"}], "MONTHLY", "2024-01", "2024-03"
+        )
+    )
+
+    single_mgr = FakeDataTableManager("widget-a")
+    single_keys = _cached_keys(
+        lambda: single_mgr.load_from_widget("dt-a", "MONTHLY", "2024-01", "2024-03")
+    )
+
+    assert group_keys == single_keys
@@ -0,0 +1,85 @@
+from typing import Type
+
+import numpy as np
+import pandas as pd
+
+from spaceone.dashboard.manager.data_table_manager.data_table_plan_manager import (
+    DataTableNode,
+)
+from spaceone.dashboard.manager.data_table_manager.data_transformation_manager import (
+    DataTransformationManager,
+)
+
+SOURCE_ID = "source"
+
+
+def make_cost_df(
+    row_count: int = 500, with_nan: bool = True, seed: int = 0
+) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(
+        {
+            "Date": rng.choice(["2024-01", "2024-02", "2024-03"], row_count),
+            "provider": rng.choice(["aws", "google", "azure", "oci"], row_count),
+            "region": rng.choice([f"region-{i}" for i in range(12)], row_count),
+            "product": rng.choice([f"product-{i}" for i in range(30)], row_count),
+            "cost": rng.gamma(2.0, 50.0, row_count).round(4),
+            "usage": rng.integers(0, 1000, row_count).astype(float),
+        }
+    )
+
+    if with_nan:
+        df.loc[rng.random(row_count) < 0.1, "cost"] = np.nan
+        df.loc[rng.random(row_count) < 0.05, "region"] = np.nan
+
+    return df
+
+
+def run_operator(
+    operator: str,
+    options: dict,
+    df: pd.DataFrame,
+    manager_class: Type[DataTransformationManager] = DataTransformationManager,
+    categorical_labels: bool = False,
+    vars: dict = None,
+) -> DataTransformationManager:
+    data_keys = [column for column in ["cost", "usage"] if column in df.columns]
+    label_keys = [column for column in df.columns if column not in data_keys]
+    source_node = DataTableNode(
+        {
+            "data_table_id": SOURCE_ID,
+            "data_type": "ADDED",
+            "source_type": "COST",
+            "data_info": {key: {} for key in data_keys},
+            "labels_info": {key: {} for key in label_keys},
+        }
+    )
+
+    dt_mgr = manager_class(
+        "PUBLIC", operator, options, None, "domain-test", data_table_vos=[source_node]
+    )
+    dt_mgr.categorical_labels = categorical_labels
+
+    input_df = df.copy()
+    if categorical_labels:
+        input_df = dt_mgr.encode_labels(input_df, label_keys)
+
+    dt_mgr.data_frames = {SOURCE_ID: input_df}
+    dt_mgr.run_operator("MONTHLY", "2024-01", "2024-03", vars or {})
+    return dt_mgr
+
+
+def normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Compares values only: categorical labels are decoded and dtypes unified."""
+
+    df = df.copy()
+    df.columns = list(df.columns)
+    for column in df.columns:
+        if isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype(object)
+        elif df[column].dtype.kind in "iuf":
+            df[column] = df[column].astype(float)
+        else:
+            df[column] = df[column].astype(object)
+
+    return df